@@ -1,15 +1,22 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, font
 import random
-from enum import Enum
-from dataclasses import dataclass
+from enum import Enum, IntEnum
+from dataclasses import dataclass, field, replace
 from typing import List, Optional, Tuple, Dict
 import math
+import copy
+import heapq
+from operator import attrgetter, itemgetter
+from itertools import accumulate
 import threading
 import os
 import socket
 import json
 import queue
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
 
 # Optional pygame import for audio
 try:
@@ -27,12 +34,48 @@ except ImportError:
     SOCKETIO_AVAILABLE = False
     print("python-socketio not available - relay networking will be disabled")
 
+# Optional numba import for compiled card kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("Numba not available - card kernels will run as plain Python")
+    
+    def njit(*args, **kwargs):
+        """Fallback decorator: leave the kernel as a plain Python function"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Module-level bindings for the GUI's random picks (hints, AI moves, team choices, tutorial deal)
+_rand_choice = random.choice
+_rand_sample = random.sample
+_rand_shuffle = random.shuffle
+_rand_choices = random.choices
+
+# Set True to trace GUI game setup, blocking turns and repaints on stdout
+_VERBOSE = False
+
 # Game constants
-class Suit(Enum):
-    RED = "Red"
-    BLUE = "Blue"
-    YELLOW = "Yellow"
-    GREEN = "Green"
+class Suit(IntEnum):
+    RED = 0
+    BLUE = 1
+    YELLOW = 2
+    GREEN = 3
+    
+    @property
+    def label(self) -> str:
+        """Display name ("Red", "Blue", ...) - also used in network messages and saves"""
+        return self.name.title()
+    
+    @classmethod
+    def from_label(cls, label: str) -> "Suit":
+        """Suit for a display name as produced by label"""
+        return cls[label.upper()]
+    
+    def __str__(self):
+        return self.label
 
 class Phase(Enum):
     BLOCKING = "Blocking"
@@ -41,16 +84,268 @@ class Phase(Enum):
     TRICK_TAKING = "Trick Taking"
     ROUND_END = "Round End"
 
+# Suit <-> small integer index used by the packed card encoding
+SUITS = tuple(Suit)
+SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
+# Hand-sort rank of each suit (alphabetical by name, the order hands have always shown)
+SUIT_SORT_RANK = {suit: rank for rank, suit in enumerate(sorted(SUITS, key=lambda s: s.label))}
+
+NO_SUIT = 255  # Packed suit index for "no trump / no super trump" (Njet)
+
+def suit_index(suit: Optional[Suit]) -> int:
+    """Packed suit index for a Suit, or NO_SUIT when None"""
+    return NO_SUIT if suit is None else SUIT_INDEX[suit]
+
+@njit(cache=True)
+def card_beats(card1, card2, lead, trump, super_trump):
+    """Check if packed card1 beats packed card2 (suits are packed indices, NO_SUIT for none)"""
+    suit1 = card1 >> 4
+    value1 = card1 & 15
+    suit2 = card2 >> 4
+    value2 = card2 & 15
+    
+    # Super trump logic: value 0 cards of the super trump suit
+    is_card1_super = super_trump != NO_SUIT and suit1 == super_trump and value1 == 0
+    is_card2_super = super_trump != NO_SUIT and suit2 == super_trump and value2 == 0
+    
+    # Super trump 0s count as the highest cards of the trump suit
+    card1_trump = (trump != NO_SUIT and suit1 == trump) or is_card1_super
+    card2_trump = (trump != NO_SUIT and suit2 == trump) or is_card2_super
+    
+    # Trump (including super trump) beats non-trump
+    if card1_trump != card2_trump:
+        return card1_trump
+    
+    if card1_trump:
+        # Super trump 0s beat all other trump cards; between two of them last played wins
+        if is_card1_super != is_card2_super:
+            return is_card1_super
+        if is_card1_super:
+            return False
+        # Between regular trump cards, higher value wins (last played wins ties)
+        if suit1 == trump and suit2 == trump:
+            return value1 > value2
+        return False
+    
+    # Must follow suit
+    if (suit1 == lead) != (suit2 == lead):
+        return suit1 == lead
+    
+    # Within same suit, higher value wins (or last played if same value)
+    if suit1 == suit2:
+        return value1 > value2
+    return False
+
+@njit(cache=True)
+def card_priority(card, lead, trump, super_trump):
+    """Trick rank of a packed card: the highest score wins, equal scores go to the later card.
+    lead is the packed suit index of the led suit, or NO_SUIT when trump was led."""
+    suit = card >> 4
+    value = card & 15
+    # Super trump 0s are the highest trump cards (identical ones tie)
+    if super_trump != NO_SUIT and suit == super_trump and value == 0:
+        return 300
+    if trump != NO_SUIT and suit == trump:
+        return 200 + value
+    if suit == lead:
+        return 100 + value
+    return -1  # Off-suit cards can never win
+
+def trick_winner_index(codes, trump, super_trump):
+    """Position of the winning card in a trick of packed cards (ties go to the later card)"""
+    lead = codes[0]
+    # Lead card sets the suit to follow, unless it is trump (super trump 0s count as trump)
+    lead_idx = NO_SUIT if card_priority(lead, NO_SUIT, trump, super_trump) >= 200 else lead >> 4
+    winning_idx = 0
+    winning_score = -1
+    for i in range(len(codes)):
+        score = card_priority(codes[i], lead_idx, trump, super_trump)
+        if score >= winning_score:
+            winning_idx = i
+            winning_score = score
+    return winning_idx
+
+def legal_plays(hand, lead, trump, super_trump):
+    """Packed cards of hand that may be played (lead is the packed lead card, or None to lead).
+    Follow the lead's effective suit if possible, otherwise trump if possible, otherwise anything."""
+    if lead is None:
+        return hand
+    trumps = [c for c in hand if card_priority(c, NO_SUIT, trump, super_trump) >= 200]
+    if card_priority(lead, NO_SUIT, trump, super_trump) >= 200:
+        return trumps or hand
+    lead_suit = lead >> 4
+    follow = [c for c in hand if c >> 4 == lead_suit and card_priority(c, NO_SUIT, trump, super_trump) < 200]
+    return follow or trumps or hand
+
+def playout_round(hands, trick, to_play, trump, super_trump, teams, rand):
+    """Play the rest of a round out at random from a fully known position.
+    hands: per-player lists of packed cards (consumed), trick: [(player, code)] already on the table,
+    to_play: next player, teams: per-player team numbers, rand: uniform [0, 1) source.
+    Returns won items (tricks + captured opposing 0s) indexed by team number."""
+    num_players = len(hands)
+    items = [0] * (max(teams) + 1)
+    trick = list(trick)
+    while True:
+        if len(trick) == num_players:
+            winner = trick[trick_winner_index([code for _, code in trick], trump, super_trump)][0]
+            winner_team = teams[winner]
+            items[winner_team] += 1
+            for player, code in trick:
+                if code & 15 == 0 and teams[player] != winner_team:
+                    items[winner_team] += 1
+            if not hands[winner]:
+                return items
+            trick = []
+            to_play = winner
+        hand = hands[to_play]
+        if not hand:  # Uneven hands (discards, 5-player deals): stop when someone runs out
+            return items
+        options = legal_plays(hand, trick[0][1] if trick else None, trump, super_trump)
+        code = options[int(rand() * len(options))]
+        hand.remove(code)
+        trick.append((to_play, code))
+        to_play = (to_play + 1) % num_players
+
+# Transposition-table bound flags for solve_endgame
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+
+def solve_endgame(hands, trick, to_play, trump, super_trump, teams, my_team, alpha, beta, table):
+    """Exact alpha-beta value of a fully known position: my_team's future won items minus the opponents'.
+    hands: per-player tuples of packed cards, trick: tuple of (player, code) on the table,
+    table: transposition table dict, reusable for positions searched with the same my_team."""
+    num_players = len(hands)
+    if len(trick) == num_players:
+        winner = trick[trick_winner_index([code for _, code in trick], trump, super_trump)][0]
+        winner_team = teams[winner]
+        won = 1
+        for player, code in trick:
+            if code & 15 == 0 and teams[player] != winner_team:
+                won += 1
+        gain = won if winner_team == my_team else -won
+        if not hands[winner]:
+            return gain
+        return gain + solve_endgame(hands, (), winner, trump, super_trump, teams, my_team,
+                                    alpha - gain, beta - gain, table)
+    
+    key = (hands, trick, to_play)
+    entry = table.get(key)
+    if entry is not None:
+        value, flag = entry
+        if (flag == TT_EXACT or (flag == TT_LOWER and value >= beta)
+                or (flag == TT_UPPER and value <= alpha)):
+            return value
+    
+    hand = hands[to_play]
+    if not hand:  # Uneven hands end the round when someone runs out of cards
+        return 0
+    maximizing = teams[to_play] == my_team
+    best = -1000 if maximizing else 1000
+    low, high = alpha, beta
+    next_player = (to_play + 1) % num_players
+    # Duplicate cards lead to identical subtrees - search each once, high cards first
+    for code in sorted(set(legal_plays(hand, trick[0][1] if trick else None, trump, super_trump)), reverse=True):
+        i = hand.index(code)
+        child_hands = hands[:to_play] + (hand[:i] + hand[i + 1:],) + hands[to_play + 1:]
+        value = solve_endgame(child_hands, trick + ((to_play, code),), next_player,
+                              trump, super_trump, teams, my_team, low, high, table)
+        if maximizing:
+            best = max(best, value)
+            low = max(low, best)
+        else:
+            best = min(best, value)
+            high = min(high, best)
+        if low >= high:
+            break
+    
+    if best <= alpha:
+        table[key] = (best, TT_UPPER)
+    elif best >= beta:
+        table[key] = (best, TT_LOWER)
+    else:
+        table[key] = (best, TT_EXACT)
+    return best
+
+ROLLOUTS_PER_CARD = 24  # Random playouts per candidate card when the AI picks a card to play
+ENDGAME_SOLVER_CARDS = 16  # At or below this many cards in hands, sampled deals are solved exactly
+ENDGAME_SAMPLES = 8  # Sampled deals per decision for the endgame solver
+
+# Copies of each value (index = value) per suit, per the official rules
+CARD_COUNTS = (3, 1, 1, 1, 1, 1, 1, 4, 1, 1)
+CARD_COUNTS_3P = (3, 1, 1, 1, 1, 1, 1, 1, 1, 1)  # 3-player games keep only one 7 per suit
+
+def _deck_count_table(card_counts):
+    """Flat copy-count table indexed by packed card code"""
+    table = [0] * 64
+    for suit_idx in range(len(SUITS)):
+        for value, count in enumerate(card_counts):
+            table[(suit_idx << 4) | value] = count
+    return table
+
+DECK_COUNT_TABLE = _deck_count_table(CARD_COUNTS)
+DECK_COUNT_TABLE_3P = _deck_count_table(CARD_COUNTS_3P)
+
+# Per-suit "remaining copies" bitmasks give every copy its own bit, lowest values first:
+# the copies of value v occupy bits COPY_BIT_START[v] .. COPY_BIT_START[v + 1] - 1
+COPY_BIT_START = (0, *accumulate(CARD_COUNTS))  # accumulate(initial=) needs Python 3.8
+
+# Set bits per copy bitmask - a lookup table, since int.bit_count needs Python 3.10
+POPCOUNT = tuple(bin(mask).count("1") for mask in range(1 << COPY_BIT_START[-1]))
+
 @dataclass
 class Card:
+    # Hand-written slots (dataclass(slots=True) needs Python 3.10); the derived keys are not
+    # dataclass fields, so they stay out of __init__, repr and comparisons
+    __slots__ = ("suit", "value", "code", "suit_first_key", "value_first_key")
     suit: Suit
     value: int
     
+    def __post_init__(self):
+        self.code = (SUIT_INDEX[self.suit] << 4) | self.value  # Packed (suit_index << 4) | value
+        suit_rank = SUIT_SORT_RANK[self.suit]
+        self.suit_first_key = (suit_rank << 4) | self.value  # Sort by suit, then value
+        self.value_first_key = (self.value << 2) | suit_rank  # Sort by value, then suit
+    
+    @classmethod
+    def from_code(cls, code: int) -> "Card":
+        """Build a card from its packed integer encoding"""
+        return cls(SUITS[code >> 4], code & 15)
+    
     def __str__(self):
-        return f"{self.value} of {self.suit.value}"
+        return f"{self.value} of {self.suit.label}"
     
     def __lt__(self, other):
-        return (self.value, self.suit.value) < (other.value, other.suit.value)
+        return self.value_first_key < other.value_first_key
+
+def _build_deck(card_counts):
+    """Full deck in suit/value order for the given per-value copy counts"""
+    return tuple(Card(suit, value)
+                 for suit in SUITS
+                 for value, count in enumerate(card_counts)
+                 for _ in range(count))
+
+# One card per distinct (suit, value), for per-card lookup tables
+CARD_FACES = tuple(Card(suit, value) for suit in SUITS for value in range(len(CARD_COUNTS)))
+
+# Built once at import - deal_cards copies and shuffles these
+DECK_TEMPLATE = _build_deck(CARD_COUNTS)
+DECK_TEMPLATE_3P = _build_deck(CARD_COUNTS_3P)  # 3-player games: 12 sevens removed
+
+_suit_first_key = attrgetter("suit_first_key")
+_value_first_key = attrgetter("value_first_key")
+
+# Blocking board categories (in board order) and the keys of their blocked-option lists
+BLOCK_CATEGORIES = ("start_player", "discard", "trump", "super_trump", "points")
+BLOCKED_KEYS = {category: f"{category}_blocked" for category in BLOCK_CATEGORIES}
+# Categories whose options are suits (plus "Njet")
+SUIT_CATEGORIES = frozenset(("trump", "super_trump"))
+
+# Per player count (index = number of players, 2-5)
+CARDS_PER_PLAYER = (None, None, 15, 16, 15, 12)
+MAX_ROUNDS = (None, None, 8, 9, 8, 10)
+
+# Points-per-trick options and their parsed values
+POINTS_OPTIONS = ("-2", "1", "2", "3", "4")
+POINTS_VALUES = {option: int(option) for option in POINTS_OPTIONS}
 
 @dataclass
 class Player:
@@ -63,15 +358,65 @@ class Player:
     sort_by_suit_first: bool = True  # True = suit then rank, False = rank then suit
     captured_zeros: int = 0  # Count of captured 0s from opponents
     total_score: int = 0  # Individual cumulative score across all rounds
+    # Hand partitions cached by hand_partition(), keyed on the hand's card codes
+    _hand_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _by_suit: Dict[Suit, List[Card]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _high_cards: List[Card] = field(default_factory=list, init=False, repr=False, compare=False)
+    _zeros: List[Card] = field(default_factory=list, init=False, repr=False, compare=False)
     
     def sort_cards(self):
         """Sort cards based on player preference"""
         if self.sort_by_suit_first:
             # Sort by suit first, then by value
-            self.cards.sort(key=lambda c: (c.suit.value, c.value))
+            self.cards.sort(key=_suit_first_key)
         else:
             # Sort by value first, then by suit
-            self.cards.sort(key=lambda c: (c.value, c.suit.value))
+            self.cards.sort(key=_value_first_key)
+        self.hand_partition()
+    
+    def hand_partition(self) -> Tuple[Dict[Suit, List[Card]], List[Card], List[Card]]:
+        """Cards grouped by suit, high cards (12+) and zeros - rebuilt only when the hand changes"""
+        hand_key = tuple(c.code for c in self.cards)
+        if hand_key != self._hand_key:
+            by_suit = {suit: [] for suit in SUITS}
+            high_cards = []
+            zeros = []
+            for card in self.cards:
+                by_suit[card.suit].append(card)
+                if card.value >= 12:
+                    high_cards.append(card)
+                elif card.value == 0:
+                    zeros.append(card)
+            self._by_suit = by_suit
+            self._high_cards = high_cards
+            self._zeros = zeros
+            self._hand_key = hand_key
+        return self._by_suit, self._high_cards, self._zeros
+    
+    def card_index(self, card: Card) -> int:
+        """Position of a matching card in hand (by packed code, so network copies match too)"""
+        code = card.code
+        for i, held in enumerate(self.cards):
+            if held.code == code:
+                return i
+        raise ValueError(f"{card} is not in {self.name}'s hand")
+    
+    def remove_cards(self, cards: List[Card]):
+        """Remove one matching card per entry (by packed code, like card_index) in a single pass over the hand"""
+        to_remove = [0] * 64
+        for card in cards:
+            to_remove[card.code] += 1
+        kept = []
+        for held in self.cards:
+            if to_remove[held.code]:
+                to_remove[held.code] -= 1
+            else:
+                kept.append(held)
+        self.cards[:] = kept
+    
+    def card_codes(self) -> List[int]:
+        """Packed integer codes for the cards in hand (see Card.code)"""
+        return [c.code for c in self.cards]
 
 class NetworkManager:
     """Handles online multiplayer networking"""
@@ -713,12 +1058,16 @@ class SoundManager:
         return self.enabled
 
 class NjetGame:
+    # Set True to log every current_player_idx change (timestamps + caller introspection).
+    # Keep it off for AI simulations - the setter sits on every turn change.
+    _debug = False
+    
     def __init__(self, num_players: int):
         self.num_players = num_players
         self.players = []
         self.current_phase = Phase.BLOCKING
         self._current_player_idx = 0  # Private variable
-        self._player_change_log = []  # Track all changes
+        self._player_change_log = deque(maxlen=20)  # Last 20 changes (debug mode only)
         
         # Initialize the rest of the game state
         self._initialize_game_state()
@@ -730,9 +1079,13 @@ class NjetGame:
     
     @current_player_idx.setter
     def current_player_idx(self, value):
-        """Set current player index with logging"""
+        """Set current player index (with change logging when debug is enabled)"""
+        if not self._debug:
+            self._current_player_idx = value
+            return
+        
         import time, inspect
-        timestamp = time.strftime("%H:%M:%S.%f")[:-3]
+        timestamp = f"{time.monotonic():.3f}"
         caller_frame = inspect.currentframe().f_back
         caller_info = f"{caller_frame.f_code.co_name}:{caller_frame.f_lineno}" if caller_frame else "Unknown"
         
@@ -741,11 +1094,7 @@ class NjetGame:
         
         # Log the change
         change_info = (timestamp, old_value, value, caller_info)
-        self._player_change_log.append(change_info)
-        
-        # Keep only last 20 changes
-        if len(self._player_change_log) > 20:
-            self._player_change_log = self._player_change_log[-20:]
+        self._player_change_log.append(change_info)  # Bounded deque drops the oldest entry
         
         # Print detailed change info
         print(f"PLAYER_IDX_CHANGE: [{timestamp}] {old_value} -> {value} (from {caller_info})")
@@ -757,25 +1106,59 @@ class NjetGame:
         if not (0 <= value < self.num_players):
             print(f"ERROR: Invalid current_player_idx {value} (should be 0-{self.num_players-1})")
     
+    def _uniform(self, low: float = 0.0, high: float = 1.0) -> float:
+        """Next AI random number in [low, high), from this game's generator"""
+        return low + (high - low) * self._rng.random()
+    
+    def ai_snapshot(self) -> "NjetGame":
+        """Copy of the round state AI card choice reads, for scoring on a worker thread.
+        Hands, trick and card counts are copied, and the copy draws from its own generator and
+        fills its own caches, so the worker never writes to this game."""
+        snapshot = copy.copy(self)
+        snapshot.players = [replace(player, cards=list(player.cards)) for player in self.players]
+        snapshot.current_trick = list(self.current_trick)
+        snapshot.played_cards = list(self.played_cards)
+        snapshot._played_counts = list(self._played_counts)
+        snapshot._discarded_codes = {i: list(codes) for i, codes in self._discarded_codes.items()}
+        snapshot._passed_codes = {i: (receiver, list(codes)) for i, (receiver, codes) in self._passed_codes.items()}
+        snapshot._remaining_cache = None
+        snapshot._strength_cache = None
+        snapshot._rng = random.Random(self._rng.random())
+        return snapshot
+    
     def get_player_change_history(self):
         """Get the history of player changes for debugging"""
-        return self._player_change_log.copy()
+        return list(self._player_change_log)
     
     def _initialize_game_state(self):
         """Initialize the rest of the game state (called after property setup)"""
+        # AI dice come from a per-game generator (see _uniform)
+        self._rng = random.Random()
+        
         self.deck = []
         self.blocking_board = self.init_blocking_board()
+        self._available_cache = {}  # category -> (options, open mask, open options) - see get_available_options
         self.game_params = {}
+        self._hand_profiles = {}  # player_idx -> (hand codes, blocking hand profile)
+        self._blocking_scores = {}  # (player_idx, category, option) -> (hand codes, score), see ai_evaluate_blocking_option
+        self._trump = NO_SUIT  # Packed trump/super trump indices, cached by finalize_parameters
+        self._super_trump = NO_SUIT
+        self._points_per_trick = 2  # Parsed points option, set by finalize_parameters
         self.tricks_played = 0
         self.current_trick = []
         self.teams = {}
         self.team_scores = {1: 0, 2: 0}  # Team scores for this round only
         self.round_number = 1
-        self.max_rounds = {2: 8, 3: 9, 4: 8, 5: 10}[self.num_players]
+        self.max_rounds = MAX_ROUNDS[self.num_players]
         self.monster_card_holder = None  # For 3/5 player games
         
         # AI card counting and strategy
         self.played_cards = []  # Cards that have been played in tricks
+        self._played_counts = [0] * 64  # Copies of each card code played this round
+        self._discarded_codes = {}  # player_idx -> codes that player discarded face down this round
+        self._passed_codes = {}  # passer -> (receiver, passed codes the receiver hasn't played yet)
+        self._remaining_cache = None  # (cache key, remaining lists, remaining copy masks)
+        self._strength_cache = None  # (remaining masks, trump, super trump, strength table)
         self.ai_strategies = {}  # Per-player strategic memory
         
         # Initialize players (will be configured by GUI)
@@ -785,7 +1168,7 @@ class NjetGame:
             self.ai_strategies[i] = {
                 'target_team': None,  # Which team they want to be on
                 'preferred_trump': None,  # Which trump they prefer
-                'risk_tolerance': random.uniform(0.3, 0.8),  # How aggressive they are
+                'risk_tolerance': self._uniform(0.3, 0.8),  # How aggressive they are
                 'card_memory': set(),  # Cards they've seen played
                 'teammate_likely': None,  # Who they think their teammate is
             }
@@ -804,48 +1187,44 @@ class NjetGame:
     
     def init_blocking_board(self):
         """Initialize the blocking board with all options"""
+        # Option sequences never change during a round, so they are stored as tuples
         board = {
-            "start_player": list(range(self.num_players)),
-            "discard": ["0 cards", "1 card", "2 cards", "2 non-zeros", "Pass 2 right"],
-            "trump": [suit for suit in Suit] + ["Njet"],
-            "super_trump": [suit for suit in Suit] + ["Njet"],
-            "points": ["-2", "1", "2", "3", "4"]
+            "start_player": tuple(range(self.num_players)),
+            "discard": ("0 cards", "1 card", "2 cards", "2 non-zeros", "Pass 2 right"),
+            "trump": (*SUITS, "Njet"),
+            "super_trump": (*SUITS, "Njet"),
+            "points": POINTS_OPTIONS
         }
         
         # Add tracking for who blocked what
         board["blocked_by"] = {}  # (category, option) -> player_idx
         
+        # Bit i set = option i of the category is still open
+        board["open_mask"] = {category: (1 << len(board[category])) - 1 for category in BLOCK_CATEGORIES}
+        # Categories with more than one open option, kept up to date by block_option
+        board["blockable"] = sum(1 for category in BLOCK_CATEGORIES if len(board[category]) > 1)
+        
         return board
     
     def create_deck(self):
         """Create the deck - 60 cards normally, 48 cards for 3-player games"""
-        deck = []
-        # Card distribution based on official rules
-        card_counts = {
-            0: 3,  # 0 appears 3 times per suit
-            1: 1, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1,
-            7: 4,  # 7 appears 4 times per suit
-            8: 1, 9: 1
-        }
-        
-        # For 3-player games: remove 3 sevens from each color (12 cards total)
-        if self.num_players == 3:
-            card_counts[7] = 1  # Only 1 seven per suit instead of 4
-        
-        for suit in Suit:
-            for value, count in card_counts.items():
-                for _ in range(count):
-                    deck.append(Card(suit, value))
-        
-        return deck
+        # Cards are never mutated, so every deal shares the prebuilt template cards
+        return list(DECK_TEMPLATE_3P if self.num_players == 3 else DECK_TEMPLATE)
     
     def deal_cards(self):
         """Deal cards to all players"""
         self.deck = self.create_deck()
         random.shuffle(self.deck)
         
+        # New round - reset card counting
+        self.played_cards = []
+        self._played_counts = [0] * 64
+        self._discarded_codes = {}
+        self._passed_codes = {}
+        self._remaining_cache = None
+        
         # Deal specific number of cards based on player count
-        cards_per_player = {2: 15, 3: 16, 4: 15, 5: 12}[self.num_players]
+        cards_per_player = CARDS_PER_PLAYER[self.num_players]
         
         for i, player in enumerate(self.players):
             start_idx = i * cards_per_player
@@ -867,15 +1246,32 @@ class NjetGame:
             self.assign_monster_card()
         
         # Remove monster card from regular deck if present
-        if hasattr(self, 'monster_card_holder') and self.monster_card_holder is not None:
+        if self.monster_card_holder is not None:
             # The monster card is separate from the 60-card deck
             pass
     
     def can_block(self, category: str) -> bool:
         """Check if there are still unblocked options in a category"""
-        available = [opt for opt in self.blocking_board[category] 
-                    if opt not in self.blocking_board.get(f"{category}_blocked", [])]
-        return len(available) > 1
+        # More than one bit set in the open mask
+        mask = self.blocking_board["open_mask"][category]
+        return mask & (mask - 1) != 0
+    
+    def blockable_count(self) -> int:
+        """Number of categories that can still be blocked"""
+        return self.blocking_board["blockable"]
+    
+    def get_available_options(self, category: str) -> list:
+        """Unblocked options of a category, in board order (shared list - callers must not modify it)"""
+        board = self.blocking_board
+        options = board[category]
+        mask = board["open_mask"][category]
+        # Reused until a block changes the mask or a new round replaces the board
+        cached = self._available_cache.get(category)
+        if cached is not None and cached[0] is options and cached[1] == mask:
+            return cached[2]
+        available = [opt for i, opt in enumerate(options) if mask >> i & 1]
+        self._available_cache[category] = (options, mask, available)
+        return available
     
     def get_card_effective_suit(self, card):
         """Get the effective suit of a card considering trump and supertrump rules"""
@@ -883,11 +1279,11 @@ class NjetGame:
         super_trump_suit = self.game_params.get("super_trump")
         
         # If card is a supertrump (0 of supertrump color), it belongs to trump suit
-        if super_trump_suit and card.suit == super_trump_suit and card.value == 0:
+        if super_trump_suit is not None and card.suit == super_trump_suit and card.value == 0:
             return "trump"
         
         # If card's suit is trump suit, it belongs to trump suit
-        if trump_suit and trump_suit != "Njet" and card.suit == trump_suit:
+        if trump_suit is not None and trump_suit != "Njet" and card.suit == trump_suit:
             return "trump"
         
         # Otherwise, it belongs to its natural suit
@@ -902,12 +1298,12 @@ class NjetGame:
             result = []
             for card in cards:
                 # Include supertrump cards (0s of supertrump color)
-                if super_trump_suit and card.suit == super_trump_suit and card.value == 0:
+                if super_trump_suit is not None and card.suit == super_trump_suit and card.value == 0:
                     result.append(card)
                 # Include trump suit cards (but exclude supertrump 0s of that color)
-                elif trump_suit and trump_suit != "Njet" and card.suit == trump_suit:
+                elif trump_suit is not None and trump_suit != "Njet" and card.suit == trump_suit:
                     # Exclude supertrump 0s even if they're in trump color
-                    if not (super_trump_suit and card.suit == super_trump_suit and card.value == 0):
+                    if not (super_trump_suit is not None and card.suit == super_trump_suit and card.value == 0):
                         result.append(card)
             return result
         else:
@@ -917,20 +1313,54 @@ class NjetGame:
             for card in cards:
                 if card.suit == effective_suit:
                     # Exclude supertrump 0s
-                    if not (super_trump_suit and card.suit == super_trump_suit and card.value == 0):
+                    if not (super_trump_suit is not None and card.suit == super_trump_suit and card.value == 0):
                         result.append(card)
             return result
     
+    def valid_plays(self, player_idx: int) -> List[Card]:
+        """Cards the player may legally play to the current trick, looked up through the hand's suit index.
+        The returned list may be shared with the hand or its partition - copy before modifying."""
+        player = self.players[player_idx]
+        if not self.current_trick:
+            return player.cards
+        by_suit = player.hand_partition()[0]
+        trump_suit = self.game_params.get("trump")
+        super_trump_suit = self.game_params.get("super_trump")
+        super_zeros = [c for c in by_suit.get(super_trump_suit, ()) if c.value == 0]
+        
+        lead_effective_suit = self.get_card_effective_suit(self.current_trick[0][1])
+        if lead_effective_suit != "trump":
+            # Rule 1: Must follow the natural suit (supertrump 0s belong to trump)
+            matching = by_suit[lead_effective_suit]
+            if lead_effective_suit == super_trump_suit and super_zeros:
+                matching = [c for c in matching if c.value != 0]
+            if matching:
+                return matching
+        
+        # Trump led, or rule 2: cannot follow suit - must play trump/supertrump if available
+        trump_cards = super_zeros
+        if trump_suit is not None and trump_suit != "Njet":
+            trump_cards = trump_cards + [c for c in by_suit[trump_suit] if not (c.value == 0 and c.suit == super_trump_suit)]
+        # Rule 3: No trump cards - any card is valid
+        return trump_cards or player.cards
+    
     def block_option(self, category: str, option, player_idx: int = None):
         """Block an option on the board and track which player blocked it"""
-        blocked_key = f"{category}_blocked"
-        if blocked_key not in self.blocking_board:
-            self.blocking_board[blocked_key] = []
-        self.blocking_board[blocked_key].append(option)
+        board = self.blocking_board
+        board.setdefault(BLOCKED_KEYS[category], []).append(option)
+        
+        options = board[category]
+        if option in options:
+            open_masks = board["open_mask"]
+            mask = open_masks[category]
+            new_mask = open_masks[category] = mask & ~(1 << options.index(option))
+            # The category stops being blockable when its second-to-last option goes
+            if mask & (mask - 1) and not new_mask & (new_mask - 1):
+                board["blockable"] -= 1
         
         # Track which player blocked this option for visual display
         if player_idx is not None:
-            self.blocking_board["blocked_by"][(category, option)] = player_idx
+            board["blocked_by"][(category, option)] = player_idx
     
     def get_blocking_player(self, category: str, option) -> int:
         """Get the player index who blocked a specific option, or None if not tracked"""
@@ -946,13 +1376,14 @@ class NjetGame:
     
     def finalize_parameters(self):
         """Set game parameters based on remaining unblocked options"""
-        for category in ["start_player", "discard", "trump", "super_trump", "points"]:
-            blocked_key = f"{category}_blocked"
-            blocked = self.blocking_board.get(blocked_key, [])
-            available = [opt for opt in self.blocking_board[category] if opt not in blocked]
-            
-            if available:
-                final_choice = available[0]
+        self._blocking_scores.clear()  # Blocking is over, next round's hands are scored afresh
+        open_masks = self.blocking_board["open_mask"]
+        for category in BLOCK_CATEGORIES:
+            mask = open_masks[category]
+            
+            if mask:
+                # First open option = lowest set bit
+                final_choice = self.blocking_board[category][(mask & -mask).bit_length() - 1]
                 # Handle "Njet" options specially
                 if final_choice == "Njet":
                     if category == "trump":
@@ -963,10 +1394,15 @@ class NjetGame:
                     self.game_params[category] = final_choice
             else:
                 # Should not happen, but handle gracefully
-                if category in ["trump", "super_trump"]:
+                if category in SUIT_CATEGORIES:
                     self.game_params[category] = None
                 else:
                     self.game_params[category] = self.blocking_board[category][0]
+        
+        # Cache packed trump suits for the trick-resolution kernels
+        self._trump = suit_index(self.game_params["trump"])
+        self._super_trump = suit_index(self.game_params["super_trump"])
+        self._points_per_trick = int(self.game_params["points"])
     
     def form_teams(self):
         """Form teams based on player count - only for 2 player games"""
@@ -982,216 +1418,112 @@ class NjetGame:
             # This will be handled in the team selection phase
             return
     
-    def play_card(self, player_idx: int, card: Card):
-        """Play a card to the current trick"""
+    def play_card(self, player_idx: int, card: Card, card_index: Optional[int] = None):
+        """Play a card to the current trick (pass card_index to skip the hand search)"""
         player = self.players[player_idx]
-        player.cards.remove(card)
-        player.sort_cards()  # Re-sort remaining cards
+        if card_index is None:
+            card_index = player.card_index(card)
+        card = player.cards.pop(card_index)  # Removing a card keeps the hand sorted
         self.current_trick.append((player_idx, card))
         self.played_cards.append(card)  # Add to played cards for AI card counting
+        self._played_counts[card.code] += 1
+        self._remaining_cache = None
+        for receiver, codes in self._passed_codes.values():
+            if receiver == player_idx and card.code in codes:
+                codes.remove(card.code)
+    
+    def record_discards(self, player_idx: int, cards: List[Card], receiver: Optional[int] = None):
+        """Remember the cards player_idx discarded (or passed to receiver) - only that player knows them"""
+        codes = [card.code for card in cards]
+        if receiver is None:
+            self._discarded_codes.setdefault(player_idx, []).extend(codes)
+        else:
+            self._passed_codes[player_idx] = (receiver, codes)
     
     def determine_trick_winner(self) -> int:
         """Determine who wins the current trick using effective suit logic"""
-        trump_suit = self.game_params.get("trump")
-        super_trump = self.game_params.get("super_trump")
+        trump_idx = self._trump
+        super_trump_idx = self._super_trump
         
         print(f"DEBUG: === DETERMINING TRICK WINNER ===")
-        print(f"DEBUG: Trump: {trump_suit}, Super Trump: {super_trump}")
-        
-        # Get lead card and its effective suit
-        lead_card = self.current_trick[0][1]
-        lead_effective_suit = self.get_card_effective_suit(lead_card)
-        print(f"DEBUG: Lead card: {lead_card.value} of {lead_card.suit.value} (effective suit: {lead_effective_suit})")
-        
-        # Find highest card considering effective suits
-        # For ties (same rank and effective suit), last played wins
-        winning_idx = 0
-        winning_card = self.current_trick[0][1]
-        winning_effective_suit = lead_effective_suit
-        print(f"DEBUG: Starting with Player {self.current_trick[0][0]} card: {winning_card.value} of {winning_card.suit.value} (effective: {winning_effective_suit})")
-        
-        for i, (player_idx, card) in enumerate(self.current_trick[1:], 1):
-            card_effective_suit = self.get_card_effective_suit(card)
-            print(f"DEBUG: Comparing Player {player_idx} card: {card.value} of {card.suit.value} (effective: {card_effective_suit})")
-            
-            # Check if this card beats the current winner
-            if self._card_beats_new(card, card_effective_suit, winning_card, winning_effective_suit, lead_effective_suit, super_trump):
-                print(f"DEBUG: Player {player_idx} card BEATS current winner!")
-                winning_idx = i
-                winning_card = card
-                winning_effective_suit = card_effective_suit
-            elif (card_effective_suit == winning_effective_suit and 
-                  card.value == winning_card.value and
-                  self._cards_are_equivalent(card, winning_card, super_trump)):
-                # Tie: last played wins
-                print(f"DEBUG: Player {player_idx} card TIES, last played wins!")
-                winning_idx = i
-                winning_card = card
-                winning_effective_suit = card_effective_suit
-            else:
-                print(f"DEBUG: Player {player_idx} card does not beat current winner")
+        print(f"DEBUG: Trump: {self.game_params.get('trump')}, Super Trump: {self.game_params.get('super_trump')}")
         
-        winner_player_idx = self.current_trick[winning_idx][0]
-        print(f"DEBUG: Final winner: Player {winner_player_idx} with {winning_card.value} of {winning_card.suit.value}")
+        for player_idx, card in self.current_trick:
+            print(f"DEBUG: Player {player_idx} card: {card.value} of {card.suit.label}")
+        
+        # Single scoring pass - ties (same rank and effective suit) go to the last card played
+        codes = [card.code for _, card in self.current_trick]
+        winning_idx = trick_winner_index(codes, trump_idx, super_trump_idx)
+        
+        winner_player_idx, winning_card = self.current_trick[winning_idx]
+        print(f"DEBUG: Final winner: Player {winner_player_idx} with {winning_card.value} of {winning_card.suit.label}")
         return winner_player_idx
     
     def _card_beats(self, card1: Card, card2: Card, lead: Suit, 
                     trump: Suit, super_trump: Suit) -> bool:
-        """Check if card1 beats card2"""
-        # Super trump logic: value 0 cards of the super trump suit
-        is_card1_super = (super_trump and card1.suit == super_trump and card1.value == 0)
-        is_card2_super = (super_trump and card2.suit == super_trump and card2.value == 0)
-        
-        # Super trump cards are now considered part of trump suit (highest trump)
-        # They only beat everything if trump suit != super trump suit, or if there's no trump
-        if trump == super_trump:
-            # Super trump is same as trump - super trump 0s are highest trump cards
-            card1_effective_trump = (trump and (card1.suit == trump or is_card1_super))
-            card2_effective_trump = (trump and (card2.suit == trump or is_card2_super))
-        else:
-            # Different suits - super trump cards are highest cards in trump suit
-            card1_effective_trump = (trump and card1.suit == trump) or is_card1_super
-            card2_effective_trump = (trump and card2.suit == trump) or is_card2_super
-        
-        # Trump (including super trump) beats non-trump
-        if card1_effective_trump and not card2_effective_trump:
-            return True
-        if card2_effective_trump and not card1_effective_trump:
-            return False
-        
-        # Within trump suit (including super trump as highest trump)
-        if card1_effective_trump and card2_effective_trump:
-            # Super trump 0s beat all other trump cards
-            if is_card1_super and not is_card2_super:
-                return True
-            if is_card2_super and not is_card1_super:
-                return False
-            
-            # Between super trump cards, last played wins
-            if is_card1_super and is_card2_super:
-                return False  # Last played wins
-            
-            # Between regular trump cards, higher value wins
-            if card1.suit == trump and card2.suit == trump:
-                if card1.value == card2.value:
-                    return False  # Last played wins
-                return card1.value > card2.value
-            
-            # If we get here, both are trump but different handling needed
-            # This covers mixed cases (one is super trump, other is regular trump)
-            return False  # Default to last played wins for edge cases
-        
-        # Must follow suit
-        if card2.suit == lead and card1.suit != lead:
-            return False
-        if card1.suit == lead and card2.suit != lead:
-            return True
-        
-        # Within same suit, higher value wins (or last played if same value)
-        if card1.suit == card2.suit:
-            if card1.value == card2.value:
-                return False  # Last played wins
-            return card1.value > card2.value
-        
-        return False
-    
-    def _card_beats_new(self, card1, card1_effective_suit, card2, card2_effective_suit, lead_effective_suit, super_trump):
-        """Check if card1 beats card2 using new effective suit logic"""
-        # Trump beats non-trump
-        if card1_effective_suit == "trump" and card2_effective_suit != "trump":
-            return True
-        if card2_effective_suit == "trump" and card1_effective_suit != "trump":
-            return False
-        
-        # Within trump suit
-        if card1_effective_suit == "trump" and card2_effective_suit == "trump":
-            # Check if either is a supertrump
-            is_card1_super = (super_trump and card1.suit == super_trump and card1.value == 0)
-            is_card2_super = (super_trump and card2.suit == super_trump and card2.value == 0)
-            
-            # Supertrump beats regular trump
-            if is_card1_super and not is_card2_super:
-                return True
-            if is_card2_super and not is_card1_super:
-                return False
-            
-            # Between supertrumps or between regular trumps, higher value wins
-            if card1.value != card2.value:
-                return card1.value > card2.value
-            
-            # Same value - last played wins (return False)
-            return False
-        
-        # Must follow effective suit
-        if card2_effective_suit == lead_effective_suit and card1_effective_suit != lead_effective_suit:
-            return False
-        if card1_effective_suit == lead_effective_suit and card2_effective_suit != lead_effective_suit:
-            return True
-        
-        # Within same effective suit, higher value wins
-        if card1_effective_suit == card2_effective_suit:
-            if card1.value != card2.value:
-                return card1.value > card2.value
-            # Same value - last played wins
-            return False
-        
-        # Different off-suits - last played wins
-        return False
-    
-    def _cards_are_equivalent(self, card1, card2, super_trump):
-        """Check if two cards are equivalent (for tie-breaking)"""
-        # Both are supertrumps
-        if (super_trump and 
-            card1.suit == super_trump and card1.value == 0 and
-            card2.suit == super_trump and card2.value == 0):
-            return True
-        
-        # Both are regular cards of same suit and value
-        if card1.suit == card2.suit and card1.value == card2.value:
-            # But not if they're supertrumps (already handled above)
-            if super_trump and card1.suit == super_trump and card1.value == 0:
-                return False
-            return True
-        
-        return False
+        """Check if card1 beats card2 (see card_beats for the packed kernel)"""
+        return card_beats(card1.code, card2.code, suit_index(lead),
+                          suit_index(trump), suit_index(super_trump))
     
     # ===== AI HELPER METHODS =====
     
     def get_remaining_cards(self, player_idx: int) -> Dict[Suit, List[int]]:
-        """Get cards that haven't been played yet, organized by suit"""
-        remaining = {suit: list(range(15)) for suit in Suit}  # 0-14 for each suit
-        
-        # Remove cards held by all players
+        """Get cards that haven't been played yet, organized by suit (cached between plays)"""
+        # Hands only shrink outside play_card (discards), so the held-card total catches those
+        cache_key = (len(self.played_cards), sum(len(p.cards) for p in self.players))
+        if self._remaining_cache is not None and self._remaining_cache[0] == cache_key:
+            return self._remaining_cache[1]
+        
+        # Start from the deck's copy counts and subtract every card in a hand or already played
+        counts = list(DECK_COUNT_TABLE_3P if self.num_players == 3 else DECK_COUNT_TABLE)
+        played_counts = self._played_counts
+        for code in range(64):
+            counts[code] -= played_counts[code]
         for player in self.players:
             for card in player.cards:
-                if card.value in remaining[card.suit]:
-                    remaining[card.suit].remove(card.value)
-        
-        # Remove cards that have been played
-        for card in self.played_cards:
-            if card.value in remaining[card.suit]:
-                remaining[card.suit].remove(card.value)
-        
+                counts[card.code] -= 1
+        
+        # Expand back to one entry per remaining copy, plus the matching copy bitmasks
+        remaining = {}
+        masks = {}
+        for suit_idx, suit in enumerate(SUITS):
+            base = suit_idx << 4
+            remaining[suit] = [value for value in range(len(CARD_COUNTS))
+                               for _ in range(counts[base | value])]
+            mask = 0
+            for value, start in enumerate(COPY_BIT_START[:-1]):
+                mask |= ((1 << counts[base | value]) - 1) << start
+            masks[suit] = mask
+        self._remaining_cache = (cache_key, remaining, masks)
         return remaining
     
+    def get_remaining_masks(self, player_idx: int) -> Dict[Suit, int]:
+        """Remaining cards as per-suit copy bitmasks (see COPY_BIT_START)"""
+        self.get_remaining_cards(player_idx)
+        return self._remaining_cache[2]
+    
     def evaluate_card_strength(self, card: Card, trump: Suit, super_trump: Suit, 
-                              remaining_cards: Dict[Suit, List[int]]) -> float:
+                              remaining_masks: Dict[Suit, int]) -> float:
         """Evaluate how strong a card is (0.0 = weakest, 1.0 = strongest)"""
+        # Copies above this card's value are the mask bits past its copy range
+        higher_start = COPY_BIT_START[card.value + 1]
+        
         # Super trump 0s are extremely strong
-        if super_trump and card.suit == super_trump and card.value == 0:
+        if super_trump is not None and card.suit == super_trump and card.value == 0:
             return 1.0
         
         # Regular trump cards
-        if trump and card.suit == trump:
+        if trump is not None and card.suit == trump:
             # Trump strength based on value and how many higher trumps remain
-            higher_trumps = len([v for v in remaining_cards[trump] if v > card.value])
-            trump_total = len(remaining_cards[trump]) + 1  # +1 for this card
+            trump_mask = remaining_masks[trump]
+            higher_trumps = POPCOUNT[trump_mask >> higher_start]
+            trump_total = POPCOUNT[trump_mask] + 1  # +1 for this card
             return 0.7 + (0.25 * (1.0 - higher_trumps / max(trump_total, 1)))
         
         # Non-trump cards - strength based on value and remaining cards in suit
-        suit_remaining = remaining_cards[card.suit]
-        higher_in_suit = len([v for v in suit_remaining if v > card.value])
-        suit_total = len(suit_remaining) + 1
+        suit_mask = remaining_masks[card.suit]
+        higher_in_suit = POPCOUNT[suit_mask >> higher_start]
+        suit_total = POPCOUNT[suit_mask] + 1
         
         base_strength = 0.1 + (0.5 * (1.0 - higher_in_suit / max(suit_total, 1)))
         
@@ -1201,40 +1533,130 @@ class NjetGame:
         
         return min(base_strength, 0.69)  # Cap below trump level
     
+    def card_strength_table(self, player_idx: int) -> List[float]:
+        """evaluate_card_strength of every card, indexed by packed code (cached between plays)"""
+        masks = self.get_remaining_masks(player_idx)
+        trump = self.game_params.get("trump")
+        super_trump = self.game_params.get("super_trump")
+        cached = self._strength_cache
+        if cached is not None and cached[0] is masks and cached[1] == trump and cached[2] == super_trump:
+            return cached[3]
+        
+        table = [0.0] * 64
+        for card in CARD_FACES:
+            table[card.code] = self.evaluate_card_strength(card, trump, super_trump, masks)
+        self._strength_cache = (masks, trump, super_trump, table)
+        return table
+    
     def predict_trick_winner(self, current_trick: List[Tuple[int, Card]], 
                            possible_card: Card, player_idx: int) -> Tuple[int, float]:
         """Predict who would win if player_idx plays possible_card"""
         if not self.game_params:
             return player_idx, 0.5
         
-        trump = self.game_params.get("trump")
-        super_trump = self.game_params.get("super_trump")
-        
         # Create hypothetical trick
         hypothetical_trick = current_trick + [(player_idx, possible_card)]
         
         if not hypothetical_trick:
             return player_idx, 0.5
         
-        lead_suit = hypothetical_trick[0][1].suit
+        lead_idx = hypothetical_trick[0][1].code >> 4
         winning_player = hypothetical_trick[0][0]
-        winning_card = hypothetical_trick[0][1]
+        winning_code = hypothetical_trick[0][1].code
         
         for p_idx, card in hypothetical_trick[1:]:
-            if self._card_beats(card, winning_card, lead_suit, trump, super_trump):
+            if card_beats(card.code, winning_code, lead_idx, self._trump, self._super_trump):
                 winning_player = p_idx
-                winning_card = card
+                winning_code = card.code
         
         # Calculate confidence based on remaining players and their possible cards
         confidence = 0.7  # Base confidence
         
         # Adjust based on card strength
-        remaining = self.get_remaining_cards(player_idx)
-        card_strength = self.evaluate_card_strength(possible_card, trump, super_trump, remaining)
+        card_strength = self.card_strength_table(player_idx)[possible_card.code]
         confidence = 0.3 + (0.6 * card_strength)
         
         return winning_player, confidence
     
+    def rollout_card_values(self, player_idx: int, candidates: List[Card],
+                            rollouts: int = ROLLOUTS_PER_CARD) -> List[float]:
+        """Monte Carlo value of playing each candidate card, from player_idx's team's point of view.
+        Every card the player can't account for (the deck minus their hand, played cards and their
+        own discards - set-aside and other players' discards included) is a candidate for the other
+        hands, which are re-dealt at random at their known sizes (cards the player passed stay with
+        the receiver until played) and the round is played out at random - or, once few enough cards are left, solved
+        exactly with solve_endgame. The value is the average of own team's won items (tricks +
+        captured 0s) minus the opponents', negated when tricks score negative points."""
+        teams = [p.team for p in self.players]
+        if None in teams or not candidates:
+            return [0.0] * len(candidates)
+        
+        num_players = self.num_players
+        my_team = teams[player_idx]
+        my_hand = [c.code for c in self.players[player_idx].cards]
+        others = [i for i in range(num_players) if i != player_idx]
+        
+        # Information set: start from the full deck and remove what this player has seen
+        counts = list(DECK_COUNT_TABLE_3P if num_players == 3 else DECK_COUNT_TABLE)
+        played_counts = self._played_counts
+        for code in range(64):
+            counts[code] -= played_counts[code]
+        for code in my_hand:
+            counts[code] -= 1
+        for code in self._discarded_codes.get(player_idx, ()):
+            counts[code] -= 1
+        pinned = {}
+        passed = self._passed_codes.get(player_idx)
+        if passed is not None:
+            receiver, codes = passed
+            pinned[receiver] = codes
+            for code in codes:
+                counts[code] -= 1
+        unseen = [code for code in range(64) for _ in range(counts[code])]
+        hand_sizes = [len(self.players[i].cards) - len(pinned.get(i, ())) for i in others]
+        table = [(p_idx, card.code) for p_idx, card in self.current_trick]
+        next_player = (player_idx + 1) % num_players
+        sign = -1 if self._points_per_trick < 0 else 1
+        shuffle = self._rng.shuffle
+        rand = self._rng.random
+        
+        endgame = len(my_hand) + sum(len(self.players[i].cards) for i in others) <= ENDGAME_SOLVER_CARDS
+        if endgame:
+            rollouts = ENDGAME_SAMPLES
+        
+        # Each candidate is evaluated on the same sampled deals
+        candidate_hands = []
+        for card in candidates:
+            rest_of_hand = list(my_hand)
+            rest_of_hand.remove(card.code)
+            candidate_hands.append((rest_of_hand, table + [(player_idx, card.code)]))
+        
+        totals = [0] * len(candidates)
+        for _ in range(rollouts):
+            # Sample one consistent deal of the unseen cards; the rest are set aside or discarded
+            shuffle(unseen)
+            dealt = {}
+            start = 0
+            for other, size in zip(others, hand_sizes):
+                dealt[other] = list(pinned.get(other, ())) + unseen[start:start + size]
+                start += size
+            
+            if endgame:
+                solved = {}  # Transposition table shared by the candidates of this deal
+                sorted_dealt = {other: tuple(sorted(cards)) for other, cards in dealt.items()}
+                for i, (rest_of_hand, trick) in enumerate(candidate_hands):
+                    hands = tuple(tuple(sorted(rest_of_hand)) if p_idx == player_idx else sorted_dealt[p_idx]
+                                  for p_idx in range(num_players))
+                    totals[i] += solve_endgame(hands, tuple(trick), next_player, self._trump,
+                                               self._super_trump, teams, my_team, -1000, 1000, solved)
+            else:
+                for i, (rest_of_hand, trick) in enumerate(candidate_hands):
+                    hands = [list(rest_of_hand) if p_idx == player_idx else list(dealt[p_idx])
+                             for p_idx in range(num_players)]
+                    items = playout_round(hands, trick, next_player, self._trump, self._super_trump, teams, rand)
+                    totals[i] += 2 * items[my_team] - sum(items)
+        return [sign * total / rollouts for total in totals]
+    
     def get_team_status(self, player_idx: int) -> Dict:
         """Get current team information and scoring status"""
         if not hasattr(self, 'teams') or not self.teams:
@@ -1272,7 +1694,7 @@ class NjetGame:
         player = self.players[player_idx]
         
         # Advanced strategic analysis
-        points_per_trick = int(self.game_params.get("points", "2"))
+        points_per_trick = self._points_per_trick
         trump = self.game_params.get("trump")
         super_trump = self.game_params.get("super_trump")
         
@@ -1289,8 +1711,8 @@ class NjetGame:
         # Card counting: analyze remaining strong cards
         remaining_cards = self.get_remaining_cards(player_idx)
         my_strong_cards = len([c for c in player.cards if c.value >= 7])
-        my_trumps = len([c for c in player.cards if trump and c.suit == trump])
-        my_super_trumps = len([c for c in player.cards if super_trump and c.suit == super_trump and c.value == 0])
+        my_trumps = len([c for c in player.cards if trump is not None and c.suit == trump])
+        my_super_trumps = len([c for c in player.cards if super_trump is not None and c.suit == super_trump and c.value == 0])
         
         # Position analysis: are we leading or following?
         position_factor = 1.0
@@ -1307,7 +1729,7 @@ class NjetGame:
                 if self.are_teammates(player_idx, current_winner):
                     # Teammate winning - don't compete unless trick is very valuable
                     if trick_value < 4 and opponent_zeros < 2:
-                        return random.random() < 0.2  # Usually let teammate take it
+                        return self._uniform() < 0.2  # Usually let teammate take it
             
             # Coordinate with teammate based on hand strength
             if team_status['losing']:
@@ -1344,12 +1766,12 @@ class NjetGame:
         # Add strategic variance based on AI personality
         strategy = self.ai_strategies[player_idx]
         variance = strategy['risk_tolerance'] * 0.1
-        final_probability += random.uniform(-variance, variance)
+        final_probability += self._uniform(-variance, variance)
         
         # Clamp to reasonable bounds
         final_probability = max(0.1, min(0.95, final_probability))
         
-        return random.random() < final_probability
+        return self._uniform() < final_probability
     
     def analyze_hand_strength(self, cards: List[Card]) -> Dict[str, float]:
         """Analyze the overall strength of a hand"""
@@ -1363,9 +1785,9 @@ class NjetGame:
         zeros = [c for c in cards if c.value == 0]
         
         # Suit distribution
-        suit_counts = {}
-        for suit in Suit:
-            suit_counts[suit] = len([c for c in cards if c.suit == suit])
+        suit_counts = dict.fromkeys(SUITS, 0)
+        for c in cards:
+            suit_counts[c.suit] += 1
         
         # Calculate overall strength
         high_card_strength = len(high_cards) / len(cards)
@@ -1394,33 +1816,21 @@ class NjetGame:
         if not hasattr(self, 'blocking_board') or category not in self.blocking_board:
             return 4  # Default assumption
         
-        # Get all options in this category
-        all_options = self.blocking_board[category]
-        
-        # Get blocked options for this category
-        blocked_key = f"{category}_blocked"
-        blocked_options = self.blocking_board.get(blocked_key, [])
-        
-        # Calculate remaining options
-        remaining = len(all_options) - len(blocked_options)
-        return remaining
+        return bin(self.blocking_board["open_mask"][category]).count("1")  # int.bit_count needs 3.10
     
     def predict_current_trick_winner(self, current_trick: List[Tuple[int, Card]]) -> int:
         """Predict who is currently winning the trick"""
         if not current_trick:
             return -1
         
-        trump = self.game_params.get("trump")
-        super_trump = self.game_params.get("super_trump")
-        
-        lead_suit = current_trick[0][1].suit
+        lead_idx = current_trick[0][1].code >> 4
         winning_player = current_trick[0][0]
-        winning_card = current_trick[0][1]
+        winning_code = current_trick[0][1].code
         
         for player_idx, card in current_trick[1:]:
-            if self._card_beats(card, winning_card, lead_suit, trump, super_trump):
+            if card_beats(card.code, winning_code, lead_idx, self._trump, self._super_trump):
                 winning_player = player_idx
-                winning_card = card
+                winning_code = card.code
         
         return winning_player
     
@@ -1487,57 +1897,118 @@ class NjetGame:
         # Return weighted average with default assumption
         return (base_strength * confidence) + (0.5 * (1.0 - confidence))
     
+    def _blocking_hand_profile(self, player_idx: int) -> Dict:
+        """Per-suit hand statistics for blocking decisions, built in one pass over the hand"""
+        cards = self.players[player_idx].cards
+        hand_key = tuple(c.code for c in cards)
+        cached = self._hand_profiles.get(player_idx)
+        if cached is not None and cached[0] == hand_key:
+            return cached[1]
+        
+        # Per-suit tables indexed by packed suit index
+        count = [0] * 4
+        value_sum = [0] * 4
+        zeros = [0] * 4
+        high7 = [0] * 4  # Cards valued 7+
+        high8 = [0] * 4  # Cards valued 8+
+        max_value = [0] * 4
+        weak = medium = non_zero_weak = 0
+        for code in hand_key:
+            suit = code >> 4
+            value = code & 15
+            count[suit] += 1
+            value_sum[suit] += value
+            if value == 0:
+                zeros[suit] += 1
+            if value >= 7:
+                high7[suit] += 1
+                if value >= 8:
+                    high8[suit] += 1
+            if value > max_value[suit]:
+                max_value[suit] = value
+            if value <= 3:
+                weak += 1
+                if value > 0:
+                    non_zero_weak += 1
+            elif value <= 6:
+                medium += 1
+        
+        profile = {
+            'count': count, 'value_sum': value_sum, 'zeros': zeros,
+            'high7': high7, 'high8': high8, 'max_value': max_value,
+            'weak': weak, 'medium': medium, 'non_zero_weak': non_zero_weak,
+        }
+        self._hand_profiles[player_idx] = (hand_key, profile)
+        return profile
+    
     def ai_evaluate_blocking_option(self, player_idx: int, category: str, option) -> float:
+        """Blocking score for an option, reused across the player's blocking turns while their hand is unchanged"""
+        # Blocking another player's start is scored with a fresh random draw each time, so it is never reused
+        if category == "start_player" and option != player_idx:
+            return self._score_blocking_option(player_idx, category, option)
+        
+        self._blocking_hand_profile(player_idx)
+        hand_key = self._hand_profiles[player_idx][0]
+        key = (player_idx, category, option)
+        cached = self._blocking_scores.get(key)
+        if cached is not None and cached[0] is hand_key:
+            return cached[1]
+        score = self._score_blocking_option(player_idx, category, option)
+        self._blocking_scores[key] = (hand_key, score)
+        return score
+    
+    def _score_blocking_option(self, player_idx: int, category: str, option) -> float:
         """Advanced AI: Evaluate blocking options with sophisticated strategy"""
         strategy = self.ai_strategies[player_idx]
         player = self.players[player_idx]
         
-        # Analyze entire hand for context
-        hand_analysis = self.analyze_hand_strength(player.cards)
+        # One pass over the hand serves every category/option evaluated this turn
+        profile = self._blocking_hand_profile(player_idx)
+        suit = SUIT_INDEX.get(option) if category in SUIT_CATEGORIES else None
         
         if category == "trump":
             # Advanced trump evaluation
-            suit_cards = [c for c in player.cards if c.suit == option]
-            suit_strength = sum(c.value for c in suit_cards) / max(len(suit_cards), 1)
-            high_cards = [c for c in suit_cards if c.value >= 8]
+            suit_count = profile['count'][suit] if suit is not None else 0
+            suit_strength = profile['value_sum'][suit] / max(suit_count, 1) if suit_count else 0
+            high_cards = profile['high8'][suit] if suit_count else 0
             
             # If we have multiple high cards in this suit, strongly protect it
-            if len(high_cards) >= 2:
+            if high_cards >= 2:
                 return 0.05  # Almost never block
             # If we have strong concentration in this suit
-            elif len(suit_cards) >= 4 and suit_strength >= 6:
+            elif suit_count >= 4 and suit_strength >= 6:
                 return 0.1   # Rarely block
             # If we're completely weak in this suit
-            elif len(suit_cards) == 0:
+            elif suit_count == 0:
                 return 0.95  # Almost always block
-            elif len(suit_cards) == 1 and suit_cards[0].value <= 4:
+            elif suit_count == 1 and profile['value_sum'][suit] <= 4:
                 return 0.85  # Usually block weak singleton
             # Moderate cases
-            elif len(suit_cards) <= 2 and suit_strength <= 5:
+            elif suit_count <= 2 and suit_strength <= 5:
                 return 0.7   # Often block
             else:
                 return 0.4   # Neutral
                 
         elif category == "super_trump":
             # Super trump is extremely important
-            suit_cards = [c for c in player.cards if c.suit == option]
-            zeros_in_suit = [c for c in suit_cards if c.value == 0]
-            high_cards = [c for c in suit_cards if c.value >= 7]
+            suit_count = profile['count'][suit] if suit is not None else 0
+            zeros_in_suit = profile['zeros'][suit] if suit_count else 0
+            high_cards = profile['high7'][suit] if suit_count else 0
             
             # If we have multiple 0s in this suit, absolutely protect it
-            if len(zeros_in_suit) >= 2:
+            if zeros_in_suit >= 2:
                 return 0.01  # Never block
             # If we have any 0s in this suit
-            elif len(zeros_in_suit) == 1:
+            elif zeros_in_suit == 1:
                 return 0.05  # Almost never block
             # If we have high cards that could capture 0s
-            elif len(high_cards) >= 2:
+            elif high_cards >= 2:
                 return 0.15  # Rarely block
             # If we have no cards in this suit at all
-            elif not suit_cards:
+            elif not suit_count:
                 return 0.9   # Usually block
             # If we have only low cards
-            elif len(suit_cards) <= 2 and all(c.value <= 5 for c in suit_cards):
+            elif suit_count <= 2 and profile['max_value'][suit] <= 5:
                 return 0.75  # Often block
             else:
                 return 0.5   # Neutral
@@ -1546,6 +2017,7 @@ class NjetGame:
             # Advanced start player evaluation
             if option == player_idx:
                 # Sometimes we want to start (with strong hand)
+                hand_analysis = self.analyze_hand_strength(player.cards)
                 if hand_analysis['overall_strength'] > 0.7:
                     return 0.2  # Sometimes allow ourselves to start
                 else:
@@ -1553,7 +2025,7 @@ class NjetGame:
             
             # Analyze other players' likely hand strength
             # (In a real implementation, track previous play patterns)
-            other_player_strength = random.uniform(0.3, 0.7)  # Placeholder
+            other_player_strength = self._uniform(0.3, 0.7)  # Placeholder
             
             if other_player_strength > 0.6:
                 return 0.8  # Block strong players from starting
@@ -1562,51 +2034,44 @@ class NjetGame:
                 
         elif category == "discard":
             # Sophisticated discard evaluation
-            weak_cards = [c for c in player.cards if c.value <= 3]
-            medium_cards = [c for c in player.cards if 4 <= c.value <= 6]
-            strong_cards = [c for c in player.cards if c.value >= 7]
+            weak_cards = profile['weak']
+            medium_cards = profile['medium']
             
             if option == "0 cards":
                 # Good if hand is already strong
+                hand_analysis = self.analyze_hand_strength(player.cards)
                 return 0.3 + (0.4 * hand_analysis['overall_strength'])
             elif option == "1 card":
                 # Good if we have exactly some weak cards to shed
-                if len(weak_cards) >= 1:
+                if weak_cards >= 1:
                     return 0.7
                 else:
                     return 0.3
             elif option == "2 cards":
                 # Good if we have multiple weak cards
-                if len(weak_cards) >= 2:
+                if weak_cards >= 2:
                     return 0.8
-                elif len(weak_cards) + len(medium_cards) >= 2:
+                elif weak_cards + medium_cards >= 2:
                     return 0.6
                 else:
                     return 0.2
             elif "non-zero" in str(option):
                 # Good if we have many low non-zero cards
-                non_zero_weak = [c for c in weak_cards if c.value > 0]
-                if len(non_zero_weak) >= 2:
+                if profile['non_zero_weak'] >= 2:
                     return 0.75
                 else:
                     return 0.4
             elif "pass" in str(option).lower():
                 # Passing cards can be strategic
-                if len(weak_cards) >= 2:
+                if weak_cards >= 2:
                     return 0.6  # Good to pass away weak cards
                 else:
                     return 0.3
-            elif option == "2 cards":
-                bad_cards = [c for c in player.cards if c.value <= 4]
-                return 0.3 + (0.4 * min(len(bad_cards) / 4.0, 1.0))
-            elif option == "2 non-zeros":
-                non_zeros = [c for c in player.cards if c.value > 0 and c.value <= 4]
-                return 0.3 + (0.4 * min(len(non_zeros) / 4.0, 1.0))
             else:  # Pass 2 right
                 return 0.5  # Neutral
                 
         elif category == "points":
-            points_val = int(option) if option.lstrip('-').isdigit() else 0
+            points_val = POINTS_VALUES.get(option, 0)
             # Prefer moderate point values
             if points_val == 2 or points_val == 3:
                 return 0.3  # Don't block standard values
@@ -1615,6 +2080,191 @@ class NjetGame:
         
         return 0.5  # Default neutral evaluation
 
+# Tutorial hand dealt to the learning player, values high to low per suit
+_TUTORIAL_HAND = (
+    (Suit.RED, (9, 7, 3)),
+    (Suit.BLUE, (7, 5, 0)),
+    (Suit.YELLOW, (8, 6, 2)),
+    (Suit.GREEN, (7, 1, 0)),
+)
+
+_TUTORIAL_WELCOME_TEXT = """Welcome to the Interactive Njet Tutorial!
+
+🎯 GOAL: Learn to play Njet through hands-on experience
+
+📖 WHAT YOU'LL LEARN:
+• How to analyze your hand and make strategic decisions
+• The blocking phase - eliminate options that hurt you
+• Team formation - choose the right partners
+• Trick-taking tactics - when to win and when to lose
+• Card counting and advanced strategy
+
+🎮 HOW IT WORKS:
+This tutorial uses a scripted game where you'll play as "You (Learning)" 
+against AI guides who will help teach you the game step by step.
+
+🃏 YOUR TUTORIAL HAND:
+We've given you a specific hand designed to demonstrate key concepts.
+You'll learn to evaluate card strength, suit distribution, and strategic options.
+
+Ready to become a Njet expert? Let's start!"""
+
+_TUTORIAL_ANALYSIS_TEXT = """🔍 YOUR HAND BREAKDOWN:
+
+🔴 RED (3 cards): 9, 7, 3
+   • Strong: High card (9) and good 7
+   • Strategy: Could be trump material!
+
+🔵 BLUE (3 cards): 0, 7, 5  
+   • Special: Has a 0-value card
+   • Mixed strength, good 7
+
+🟡 YELLOW (3 cards): 8, 6, 2
+   • Decent: High card (8) present
+   • Medium strength overall
+
+🟢 GREEN (3 cards): 7, 1, 0
+   • Mixed: Good 7, but weak overall
+   • Another 0-value card
+
+💭 STRATEGIC THOUGHTS:
+• You have TWO 0-value cards (valuable!)
+• Four 7s across suits (very good)
+• Red looks strongest for trump
+• Green looks weakest
+
+🎯 BLOCKING STRATEGY:
+• Protect RED as potential trump
+• Block GREEN from being trump
+• Consider which suits opponents might want"""
+
+_TUTORIAL_COMPLETION_TEXT = """Congratulations! You've completed the Njet tutorial!
+
+🎓 WHAT YOU'VE LEARNED:
+✅ Hand analysis and strategic evaluation
+✅ Blocking phase tactics and decision-making
+✅ Team formation and partnership strategies
+✅ Trick-taking mechanics and timing
+✅ Advanced concepts like card counting
+
+🎮 READY TO PLAY:
+You now understand the core concepts of Njet and are ready to play against challenging AI opponents. 
+
+💡 REMEMBER:
+• Analyze your hand before blocking
+• Protect your strong suits, block weak ones
+• Choose teammates strategically
+• Count cards and time your plays
+• Practice makes perfect!
+
+Good luck in your future games!"""
+
+# Tutorial guide panel text for each overlay step
+_GUIDANCE_TEXTS = {
+    "blocking_intro": """🚫 BLOCKING PHASE
+
+This is where strategy begins! Each player uses blocking tokens to eliminate game options.
+
+👆 YOUR TURN: Look at the blocking board below. Each row represents a game rule you can change.
+
+🎯 GOAL: Block options that would hurt your hand. Based on your analysis, consider blocking GREEN as trump since you're weak there.
+
+Click any available button to place your blocking token!""",
+    
+    "blocking_practice": """🎯 GREAT CHOICE!
+
+You're learning to block strategically. Notice how each block affects the final game rules.
+
+🔄 CONTINUE: Watch the AI players make their choices. They'll also try to block options that don't favor their hands.
+
+⚡ NEXT: After all players block, we'll see what rules remain and move to team selection!""",
+    
+    "team_selection": """👥 TEAM FORMATION
+
+The starting player chooses teammates for this round. Teams are temporary!
+
+🎯 STRATEGY: Choose partners based on:
+• Table position (across is often good)
+• Likely hand strength
+• Trump suit possibilities
+
+💡 TIP: In 4-player games, you pick 1 teammate for a 2v2 match.""",
+    
+    "trick_taking": """🃏 TRICK-TAKING PHASE
+
+Now the real game begins! Use your cards to win tricks and score points.
+
+📋 RULES:
+• Must follow suit if possible
+• Trump beats non-trump
+• High card wins within suit
+
+🎯 YOUR STRATEGY:
+• Use your strong Red cards when Red is trump
+• Try to capture opponent 0-value cards
+• Save your 7s for important tricks!"""
+}
+
+# Display strings for card values, indexed by value
+_VAL_STR = tuple(str(value) for value in range(len(CARD_COUNTS)))
+
+# Symbol shown on a card face for each suit
+_SUIT_SYMBOLS = {Suit.RED: "♦", Suit.BLUE: "♠", Suit.YELLOW: "♣", Suit.GREEN: "♥"}
+
+# Frames of the AI thinking indicator animation
+_THINKING_DOT_STRINGS = ("🤔 AI Thinking", "🤔 AI Thinking.", "🤔 AI Thinking..", "🤔 AI Thinking...")
+
+# How often the Tk thread checks whether an AI worker has chosen its card (ms)
+_AI_MOVE_POLL_MS = 10
+
+# Shown hands are laid out in rows of _CARDS_PER_ROW; (start, end) slices per row, indexed by hand size
+_CARDS_PER_ROW = 5
+_HAND_ROW_RANGES = tuple(tuple((start, min(start + _CARDS_PER_ROW, size)) for start in range(0, size, _CARDS_PER_ROW))
+                         for size in range(61))
+
+# Blocking board canvas layout (pixels)
+_BOARD_LABEL_WIDTH = 160
+_BOARD_CELL_WIDTH = 110
+_BOARD_CELL_HEIGHT = 34
+
+# Seats around the table by player count, the human's seat first
+_SEAT_NAMES = {
+    2: ("bottom", "top"),
+    3: ("bottom", "top_left", "top_right"),
+    4: ("bottom", "left", "top", "right"),
+    5: ("bottom", "left", "top_left", "top_right", "right"),
+}
+# (row, column, position) of each seat on the 5x5 table grid - the board sits at row 2, column 2
+_BOARD_SEATS = {
+    2: ((3, 2, "BOTTOM"), (1, 2, "TOP")),
+    3: ((3, 2, "BOTTOM"), (1, 1, "TOP_LEFT"), (1, 3, "TOP_RIGHT")),
+    4: ((3, 2, "BOTTOM"), (2, 1, "LEFT"), (1, 2, "TOP"), (2, 3, "RIGHT")),
+    5: ((3, 2, "BOTTOM"), (2, 1, "LEFT"), (1, 1, "TOP_LEFT"), (1, 3, "TOP_RIGHT"), (2, 3, "RIGHT")),
+}
+# (row, column, position) of each seat on the 3x3 simple player grid
+_SIMPLE_SEATS = {
+    2: ((1, 0, "BOTTOM"), (0, 0, "TOP")),
+    3: ((2, 1, "BOTTOM"), (0, 0, "TOP_LEFT"), (0, 2, "TOP_RIGHT")),
+    4: ((2, 1, "BOTTOM"), (1, 0, "LEFT"), (0, 1, "TOP"), (1, 2, "RIGHT")),
+    5: ((2, 1, "BOTTOM"), (1, 0, "LEFT"), (0, 0, "TOP_LEFT"), (0, 2, "TOP_RIGHT"), (1, 2, "RIGHT")),
+}
+# (row, column, compass orientation) of each seat on the 3x3 seating grid
+_COMPASS_SEATS = {
+    2: ((2, 1, "S"), (0, 1, "N")),
+    3: ((2, 1, "S"), (0, 0, "NW"), (0, 2, "NE")),
+    4: ((2, 1, "S"), (1, 0, "W"), (0, 1, "N"), (1, 2, "E")),
+    5: ((2, 1, "S"), (1, 0, "W"), (0, 0, "NW"), (0, 2, "NE"), (1, 2, "E")),
+}
+
+
+def _batched_updates(method):
+    """Run a GUI method inside batch_updates so its redraws collapse into one"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.batch_updates():
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class NjetGUI:
     def __init__(self, root, num_players=None, main_menu=None, network_manager=None):
         self.root = root
@@ -1672,6 +2322,8 @@ class NjetGUI:
             "button_hover": "#D7B86E", # Soft Mustard (button hover)
             "panel_bg": "#497B75"    # Smoky Teal (panel backgrounds)
         }
+        # Player colors by player index, so redraws skip building the "playerN" keys
+        self._player_colors = tuple(self.colors[f"player{i}"] for i in range(5))
         
         self.root.configure(bg=self.colors["bg"])
         
@@ -1680,13 +2332,57 @@ class NjetGUI:
         self.header_font = font.Font(family="Arial", size=16, weight="bold")
         self.normal_font = font.Font(family="Arial", size=12)
         self.card_font = font.Font(family="Arial", size=14, weight="bold")
+        self._fonts = {}  # (family, size, weight, slant) -> shared Font, see _font
+        self._info_labels = {}  # Persistent info panel widgets, see update_info_panel
         
         # Track player frame positions for animations
         self.player_frames = {}  # player_idx -> tkinter frame widget
+        self._player_name_labels = {}  # player_idx -> name label in the player areas
+        
+        # Blocking board widgets kept between blocking turns (see show_blocking_phase)
+        self._blocking_scene = None
         
-        # AI thinking indicator
+        # Hand card widgets reused between redraws (see _hand_card_widget)
+        self._card_widget_cache = {}
+        self._cached_card_widgets = set()
+        # Small card backs shown for AI and hidden hands, per player (see _player_card_backs)
+        self._player_back_widgets = {}
+        # Player areas around the table, per player (see _player_view)
+        self._player_views = {}
+        
+        # AI thinking indicator - the shown frame, or None; widgets are built once (see show_ai_thinking)
         self.thinking_indicator = None
+        self._thinking_widgets = None  # (frame, player label)
         self.ai_timeout_timer = None
+        self._thinking_text_var = None
+        self._thinking_anim_id = None
+        self._dot_idx = 0
+        # Overlays deferred until the scene has painted (see _show_ai_thinking_later / update_display)
+        self._thinking_pending = None
+        self._hint_pending = False
+        
+        # Coalesced redraw requests (see request_update_display)
+        self._redraw_pending = False
+        
+        # Redraws deferred until the outermost batch_updates block exits
+        self._update_depth = 0
+        self._update_pending = False
+        
+        # Recent blocking turns traced by next_blocking_turn when _VERBOSE is set
+        self._turn_history = deque(maxlen=10)
+        
+        # Pending AI turns, run one at a time by _drive_ai
+        self._ai_queue = deque()
+        self._ai_driver_id = None
+        # Pause before each queued AI turn - sets the pace of AI moves for the whole game
+        self.ai_speed_ms = 50
+        # Cards chosen by ai_play_card's worker thread, picked up on the Tk thread by _poll_ai_move
+        self._ai_moves = queue.Queue()
+        
+        # Tutorial step handlers, built by show_tutorial_step
+        self._tutorial_dispatch = None
+        # Top-level widgets built during the tutorial, torn down by exit_tutorial
+        self._tutorial_owned = []
         
         # Debug keyboard shortcuts
         self.root.bind('<Control-d>', lambda e: self.debug_show_player_history())
@@ -1708,11 +2404,12 @@ class NjetGUI:
         # Schedule next check
         self.root.after(100, self._check_music_events)
     
-    def show_player_selection(self):
+    def show_player_selection(self, clear=True):
         """Show player count selection screen"""
-        # Clear window
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        # Clear window (callers that already emptied it pass clear=False)
+        if clear:
+            for widget in self.root.winfo_children():
+                widget.destroy()
         
         # Main frame
         main_frame = tk.Frame(self.root, bg=self.colors["bg"])
@@ -1836,11 +2533,13 @@ class NjetGUI:
     
     def start_game_with_players(self):
         """Start game with configured players"""
-        print("DEBUG: start_game_with_players called")
+        if _VERBOSE:
+            print("DEBUG: start_game_with_players called")
         
         # Create game with player names and types
         self.game = NjetGame(self.total_players)
-        print(f"DEBUG: Game created, phase: {self.game.current_phase}")
+        if _VERBOSE:
+            print(f"DEBUG: Game created, phase: {self.game.current_phase}")
         
         # Update player names and types
         for i in range(self.total_players):
@@ -1848,19 +2547,21 @@ class NjetGUI:
             is_human = self.player_types[i].get() == "Human"
             self.game.players[i].name = name
             self.game.players[i].is_human = is_human
-            print(f"DEBUG: Player {i}: {name} ({'Human' if is_human else 'AI'})")
+            if _VERBOSE:
+                print(f"DEBUG: Player {i}: {name} ({'Human' if is_human else 'AI'})")
         
         self.game.deal_cards()
         self.selected_card = None
-        self.blocking_buttons = {}
         
         # Start background music
         self.sound_manager.start_background_music()
         
-        print("DEBUG: About to setup UI")
+        if _VERBOSE:
+            print("DEBUG: About to setup UI")
         self.setup_game_ui()
-        print("DEBUG: About to update display")
-        self.update_display()
+        if _VERBOSE:
+            print("DEBUG: About to update display")
+        self.request_update_display()
     
     def show_tutorial(self):
         """Show interactive tutorial - a guided game session"""
@@ -1897,6 +2598,8 @@ class NjetGUI:
         # Set tutorial mode
         self.game = self.tutorial_game
         self.tutorial_step = 1
+        self._tutorial_widgets = {}
+        self._tutorial_owned = []
         
         # Show welcome screen
         self.show_tutorial_step()
@@ -1904,24 +2607,17 @@ class NjetGUI:
     def setup_tutorial_cards(self):
         """Set up a specific card distribution for tutorial"""
         # Give the human player a strategic hand to demonstrate concepts
-        from random import shuffle
-        
-        # Create deck
         deck = self.tutorial_game.create_deck()
-        shuffle(deck)
+        _rand_shuffle(deck)
         
         # Give human player a good learning hand
-        human_cards = [
-            Card(Suit.RED, 9), Card(Suit.RED, 7), Card(Suit.RED, 3),
-            Card(Suit.BLUE, 0), Card(Suit.BLUE, 7), Card(Suit.BLUE, 5),
-            Card(Suit.YELLOW, 8), Card(Suit.YELLOW, 6), Card(Suit.YELLOW, 2),
-            Card(Suit.GREEN, 7), Card(Suit.GREEN, 1), Card(Suit.GREEN, 0)
-        ]
+        human_cards = [Card(suit, value) for suit, values in _TUTORIAL_HAND for value in values]
         
         self.tutorial_game.players[0].cards = human_cards
         
         # Distribute remaining cards to AI players
-        remaining_deck = [c for c in deck if c not in human_cards]
+        human_codes = frozenset(c.code for c in human_cards)
+        remaining_deck = [c for c in deck if c.code not in human_codes]
         for i in range(1, 4):
             self.tutorial_game.players[i].cards = remaining_deck[(i-1)*12:i*12]
             self.tutorial_game.players[i].sort_cards()
@@ -1930,187 +2626,188 @@ class NjetGUI:
     
     def show_tutorial_step(self):
         """Show current tutorial step with guidance"""
-        # Clear window
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
-        # Tutorial steps with interactive guidance
-        tutorial_steps = {
-            1: self.tutorial_welcome,
-            2: self.tutorial_hand_analysis,
-            3: self.tutorial_blocking_intro,
-            4: self.tutorial_blocking_practice,
-            5: self.tutorial_team_selection,
-            6: self.tutorial_trick_taking,
-            7: self.tutorial_completion
-        }
+        # Text pages reuse the persistent tutorial screen; board steps rebuild the game UI
+        if 3 <= self.tutorial_step <= 6:
+            for widget in self.root.winfo_children():
+                widget.destroy()
         
-        if self.tutorial_step in tutorial_steps:
-            tutorial_steps[self.tutorial_step]()
+        # Tutorial steps with interactive guidance, indexed by step number (built on first use)
+        if self._tutorial_dispatch is None:
+            self._tutorial_dispatch = (
+                None,
+                self.tutorial_welcome,
+                self.tutorial_hand_analysis,
+                self.tutorial_blocking_intro,
+                self.tutorial_blocking_practice,
+                self.tutorial_team_selection,
+                self.tutorial_trick_taking,
+                self.tutorial_completion,
+            )
+        
+        if 1 <= self.tutorial_step <= 7:
+            self._tutorial_dispatch[self.tutorial_step]()
         else:
             self.tutorial_completion()
     
-    def tutorial_welcome(self):
-        """Welcome screen for interactive tutorial"""
-        main_frame = tk.Frame(self.root, bg=self.colors["bg"])
-        main_frame.pack(expand=True, fill=tk.BOTH, padx=40, pady=40)
-        
-        # Title
-        title = tk.Label(main_frame, text="🎓 Interactive Njet Tutorial", 
-                        font=self.title_font, bg=self.colors["bg"], fg="#F1C40F")
-        title.pack(pady=20)
-        
-        # Welcome content
-        content_frame = tk.Frame(main_frame, bg="#34495E", relief=tk.RAISED, bd=3)
-        content_frame.pack(expand=True, fill=tk.BOTH, pady=20)
-        
-        welcome_text = tk.Text(content_frame, font=self.normal_font, bg="#ECF0F1", fg="#2C3E50", 
-                              wrap=tk.WORD, relief=tk.FLAT, bd=0, padx=20, pady=20)
-        
-        welcome_content = """Welcome to the Interactive Njet Tutorial!
-
-🎯 GOAL: Learn to play Njet through hands-on experience
-
-📖 WHAT YOU'LL LEARN:
-• How to analyze your hand and make strategic decisions
-• The blocking phase - eliminate options that hurt you
-• Team formation - choose the right partners
-• Trick-taking tactics - when to win and when to lose
-• Card counting and advanced strategy
-
-🎮 HOW IT WORKS:
-This tutorial uses a scripted game where you'll play as "You (Learning)" 
-against AI guides who will help teach you the game step by step.
-
-🃏 YOUR TUTORIAL HAND:
-We've given you a specific hand designed to demonstrate key concepts.
-You'll learn to evaluate card strength, suit distribution, and strategic options.
-
-Ready to become a Njet expert? Let's start!"""
-        
-        welcome_text.insert(tk.END, welcome_content)
-        welcome_text.configure(state=tk.DISABLED)
-        welcome_text.pack(expand=True, fill=tk.BOTH)
+    def _build_tutorial_screen(self):
+        """Create the tutorial page widgets once - steps only reconfigure them"""
+        bg = self.colors["bg"]
+        normal_font = self.normal_font
+        widgets = {}
+        
+        main_frame = self._track(tk.Frame(self.root, bg=bg))
+        widgets['main'] = main_frame
+        
+        widgets['title'] = tk.Label(main_frame, bg=bg)
+        widgets['title'].pack(pady=20)
+        
+        body = tk.Frame(main_frame, bg=bg)
+        body.pack(expand=True, fill=tk.BOTH)
+        
+        # Left side - text panel
+        text_panel = tk.Frame(body, bg="#34495E", relief=tk.RAISED, bd=3)
+        text_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        widgets['text_panel'] = text_panel
+        
+        widgets['panel_title'] = tk.Label(text_panel, text="💡 Hand Analysis", 
+                                          font=('Arial', 14, 'bold'), bg="#34495E", fg="white")
+        
+        # Static pages render as a wrapped Label; the analysis page keeps a Text
+        widgets['static'] = static = tk.Label(text_panel, bg="#ECF0F1", fg="#2C3E50", wraplength=800,
+                                              justify=tk.LEFT, anchor='nw', padx=20, pady=20)
+        # Wrap to the label's current width (less its padding), like the Text widget does
+        def rewrap(event):
+            width = max(event.width - 40, 1)
+            if widgets['static_wrap'] != width:
+                widgets['static_wrap'] = width
+                static.configure(wraplength=width)
+        widgets['static_wrap'] = 800
+        static.bind('<Configure>', rewrap)
+        widgets['content'] = tk.Text(text_panel, bg="#ECF0F1", fg="#2C3E50", 
+                                     wrap=tk.WORD, relief=tk.FLAT, bd=0, padx=20, pady=20)
+        widgets['shown_text'] = None
+        
+        # Right side - cards panel, filled the first time it is shown
+        widgets['cards_panel'] = tk.Frame(body, bg="#2C3E50", relief=tk.RAISED, bd=3)
+        widgets['cards_filled'] = False
         
         # Navigation
-        nav_frame = tk.Frame(main_frame, bg=self.colors["bg"])
+        nav_frame = tk.Frame(main_frame, bg=bg)
         nav_frame.pack(fill=tk.X, pady=20)
         
-        home_btn = tk.Button(nav_frame, text="🏠 Back to Menu", font=self.normal_font,
-                            width=15, height=2, bg="#95A5A6", fg="white",
-                            command=self.exit_tutorial)
-        home_btn.pack(side=tk.LEFT)
-        
-        next_btn = tk.Button(nav_frame, text="Start Learning! →", font=self.normal_font,
-                            width=18, height=2, bg="#27AE60", fg="white",
-                            command=self.tutorial_next_step)
-        next_btn.pack(side=tk.RIGHT)
-    
-    def tutorial_hand_analysis(self):
-        """Step 2: Analyze the tutorial hand"""
-        main_frame = tk.Frame(self.root, bg=self.colors["bg"])
-        main_frame.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
-        
-        # Title
-        title = tk.Label(main_frame, text="📋 Step 1: Analyze Your Hand", 
-                        font=self.header_font, bg=self.colors["bg"], fg="#F1C40F")
-        title.pack(pady=10)
-        
-        # Split into analysis and cards
-        content_frame = tk.Frame(main_frame, bg=self.colors["bg"])
-        content_frame.pack(expand=True, fill=tk.BOTH)
-        
-        # Left side - analysis
-        analysis_frame = tk.Frame(content_frame, bg="#34495E", relief=tk.RAISED, bd=3)
-        analysis_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
-        
-        analysis_title = tk.Label(analysis_frame, text="💡 Hand Analysis", 
-                                 font=('Arial', 14, 'bold'), bg="#34495E", fg="white")
-        analysis_title.pack(pady=10)
-        
-        analysis_text = tk.Text(analysis_frame, font=('Arial', 10), bg="#ECF0F1", fg="#2C3E50", 
-                               wrap=tk.WORD, relief=tk.FLAT, bd=0, padx=15, pady=15)
-        
-        analysis_content = """🔍 YOUR HAND BREAKDOWN:
-
-🔴 RED (3 cards): 9, 7, 3
-   • Strong: High card (9) and good 7
-   • Strategy: Could be trump material!
-
-🔵 BLUE (3 cards): 0, 7, 5  
-   • Special: Has a 0-value card
-   • Mixed strength, good 7
-
-🟡 YELLOW (3 cards): 8, 6, 2
-   • Decent: High card (8) present
-   • Medium strength overall
-
-🟢 GREEN (3 cards): 7, 1, 0
-   • Mixed: Good 7, but weak overall
-   • Another 0-value card
-
-💭 STRATEGIC THOUGHTS:
-• You have TWO 0-value cards (valuable!)
-• Four 7s across suits (very good)
-• Red looks strongest for trump
-• Green looks weakest
-
-🎯 BLOCKING STRATEGY:
-• Protect RED as potential trump
-• Block GREEN from being trump
-• Consider which suits opponents might want"""
-        
-        analysis_text.insert(tk.END, analysis_content)
-        analysis_text.configure(state=tk.DISABLED)
-        analysis_text.pack(expand=True, fill=tk.BOTH)
-        
-        # Right side - show actual cards
-        cards_frame = tk.Frame(content_frame, bg="#2C3E50", relief=tk.RAISED, bd=3)
-        cards_frame.pack(side=tk.RIGHT, fill=tk.BOTH, padx=(10, 0))
+        widgets['back'] = tk.Button(nav_frame, text="← Back", font=normal_font,
+                                    width=12, height=2, command=self.tutorial_prev_step)
+        widgets['exit'] = tk.Button(nav_frame, font=normal_font, width=15, height=2, fg="white",
+                                    command=self.exit_tutorial, cursor="hand2")
+        widgets['exit'].pack(side=tk.LEFT, padx=(10, 0))
+        widgets['next'] = tk.Button(nav_frame, font=normal_font, width=20, height=2,
+                                    bg="#27AE60", fg="white")
+        widgets['next'].pack(side=tk.RIGHT)
+        
+        self._tutorial_widgets = widgets
+        return widgets
+    
+    def _show_tutorial_page(self, title, title_font, title_fg, content, content_font,
+                            exit_text, exit_bg, next_text, next_command, back=False, cards=False,
+                            static=False):
+        """Show a text page on the persistent tutorial screen"""
+        widgets = self._tutorial_widgets
+        if not widgets or not widgets['main'].winfo_exists():
+            widgets = self._build_tutorial_screen()
+        
+        # Drop whatever screen the tutorial left behind (e.g. the game board)
+        main_frame = widgets['main']
+        for widget in self.root.winfo_children():
+            if widget is not main_frame:
+                widget.destroy()
+        pad = 20 if cards else 40
+        main_frame.pack(expand=True, fill=tk.BOTH, padx=pad, pady=pad)
+        
+        widgets['title'].configure(text=title, font=title_font, fg=title_fg)
+        
+        text = widgets['content']
+        static_label = widgets['static']
+        if static:
+            static_label.configure(text=content, font=content_font)
+            text.pack_forget()
+            static_label.pack(expand=True, fill=tk.BOTH)
+            body = static_label
+        else:
+            # Swap the text only when the page changed - one NORMAL/DISABLED bracket per swap
+            if widgets['shown_text'] is not content:
+                text.configure(state=tk.NORMAL, font=content_font)
+                text.delete('1.0', tk.END)
+                text.insert(tk.END, content)
+                text.configure(state=tk.DISABLED)
+                widgets['shown_text'] = content
+            static_label.pack_forget()
+            text.pack(expand=True, fill=tk.BOTH)
+            body = text
+        
+        if cards:
+            widgets['panel_title'].pack(pady=10, before=body)
+            widgets['text_panel'].pack_configure(padx=(0, 10))
+            if not widgets['cards_filled']:
+                self._fill_tutorial_cards(widgets['cards_panel'])
+                widgets['cards_filled'] = True
+            widgets['cards_panel'].pack(side=tk.RIGHT, fill=tk.BOTH, padx=(10, 0))
+        else:
+            widgets['panel_title'].pack_forget()
+            widgets['text_panel'].pack_configure(padx=0)
+            widgets['cards_panel'].pack_forget()
         
+        # Navigation
+        if back:
+            widgets['back'].pack(side=tk.LEFT, before=widgets['exit'])
+        else:
+            widgets['back'].pack_forget()
+        widgets['exit'].configure(text=exit_text, bg=exit_bg)
+        widgets['next'].configure(text=next_text, command=next_command)
+    
+    def _fill_tutorial_cards(self, cards_frame):
+        """Show the tutorial hand by suit"""
+        colors = self.colors
+        panel_bg = "#2C3E50"
         cards_title = tk.Label(cards_frame, text="🃏 Your Cards", 
-                              font=('Arial', 14, 'bold'), bg="#2C3E50", fg="white")
+                              font=('Arial', 14, 'bold'), bg=panel_bg, fg="white")
         cards_title.pack(pady=10)
         
         # Show cards by suit
-        for suit in Suit:
-            suit_frame = tk.Frame(cards_frame, bg="#2C3E50")
+        for suit, values in _TUTORIAL_HAND:
+            suit_frame = tk.Frame(cards_frame, bg=panel_bg)
             suit_frame.pack(fill=tk.X, padx=10, pady=5)
             
-            suit_cards = [c for c in self.tutorial_game.players[0].cards if c.suit == suit]
-            if suit_cards:
-                suit_label = tk.Label(suit_frame, text=f"{suit.value}:", 
-                                     font=('Arial', 12, 'bold'), bg="#2C3E50", 
-                                     fg=self.colors[suit])
+            if values:
+                suit_label = tk.Label(suit_frame, text=f"{suit.label}:", 
+                                     font=('Arial', 12, 'bold'), bg=panel_bg, 
+                                     fg=colors[suit])
                 suit_label.pack(side=tk.LEFT)
                 
-                cards_text = " • ".join([str(c.value) for c in sorted(suit_cards, key=lambda x: x.value, reverse=True)])
+                cards_text = " • ".join([_VAL_STR[v] for v in values])
                 cards_detail = tk.Label(suit_frame, text=cards_text, 
-                                       font=('Arial', 11), bg="#2C3E50", fg="white")
+                                       font=('Arial', 11), bg=panel_bg, fg="white")
                 cards_detail.pack(side=tk.LEFT, padx=(10, 0))
-        
-        # Navigation
-        nav_frame = tk.Frame(main_frame, bg=self.colors["bg"])
-        nav_frame.pack(fill=tk.X, pady=20)
-        
-        back_btn = tk.Button(nav_frame, text="← Back", font=self.normal_font,
-                            width=12, height=2, command=self.tutorial_prev_step)
-        back_btn.pack(side=tk.LEFT)
-        
-        exit_btn = tk.Button(nav_frame, text="🏠 Exit Tutorial", font=self.normal_font,
-                            width=15, height=2, bg=self.colors["secondary"], fg="white",
-                            command=self.exit_tutorial, cursor="hand2")
-        exit_btn.pack(side=tk.LEFT, padx=(10, 0))
-        
-        next_btn = tk.Button(nav_frame, text="Start Blocking Phase →", font=self.normal_font,
-                            width=20, height=2, bg=self.colors["success"], fg="white",
-                            command=self.tutorial_next_step)
-        next_btn.pack(side=tk.RIGHT)
+    
+    def tutorial_welcome(self):
+        """Welcome screen for interactive tutorial"""
+        self._show_tutorial_page("🎓 Interactive Njet Tutorial", self.title_font, "#F1C40F",
+                                 _TUTORIAL_WELCOME_TEXT, self.normal_font,
+                                 "🏠 Back to Menu", "#95A5A6",
+                                 "Start Learning! →", self.tutorial_next_step, static=True)
+    
+    def tutorial_hand_analysis(self):
+        """Step 2: Analyze the tutorial hand"""
+        self._show_tutorial_page("📋 Step 1: Analyze Your Hand", self.header_font, "#F1C40F",
+                                 _TUTORIAL_ANALYSIS_TEXT, ('Arial', 10),
+                                 "🏠 Exit Tutorial", self.colors["secondary"],
+                                 "Start Blocking Phase →", self.tutorial_next_step,
+                                 back=True, cards=True)
     
     def tutorial_blocking_intro(self):
         """Step 3: Introduction to blocking phase"""
         # Set up the actual blocking phase UI with tutorial overlay
         self.setup_game_ui()
+        self._track(self.main_container)
         self.game.current_phase = Phase.BLOCKING
         self.update_display()
         
@@ -2132,144 +2829,59 @@ Ready to become a Njet expert? Let's start!"""
     
     def tutorial_completion(self):
         """Step 7: Tutorial completion"""
-        main_frame = tk.Frame(self.root, bg=self.colors["bg"])
-        main_frame.pack(expand=True, fill=tk.BOTH, padx=40, pady=40)
-        
-        title = tk.Label(main_frame, text="🎉 Tutorial Complete!", 
-                        font=self.title_font, bg=self.colors["bg"], fg="#27AE60")
-        title.pack(pady=20)
-        
-        completion_text = tk.Text(main_frame, font=self.normal_font, bg="#ECF0F1", fg="#2C3E50", 
-                                 wrap=tk.WORD, relief=tk.FLAT, bd=0, padx=20, pady=20)
-        
-        completion_content = """Congratulations! You've completed the Njet tutorial!
-
-🎓 WHAT YOU'VE LEARNED:
-✅ Hand analysis and strategic evaluation
-✅ Blocking phase tactics and decision-making
-✅ Team formation and partnership strategies
-✅ Trick-taking mechanics and timing
-✅ Advanced concepts like card counting
-
-🎮 READY TO PLAY:
-You now understand the core concepts of Njet and are ready to play against challenging AI opponents. 
-
-💡 REMEMBER:
-• Analyze your hand before blocking
-• Protect your strong suits, block weak ones
-• Choose teammates strategically
-• Count cards and time your plays
-• Practice makes perfect!
-
-Good luck in your future games!"""
-        
-        completion_text.insert(tk.END, completion_content)
-        completion_text.configure(state=tk.DISABLED)
-        completion_text.pack(expand=True, fill=tk.BOTH, pady=20)
-        
-        # Navigation
-        nav_frame = tk.Frame(main_frame, bg=self.colors["bg"])
-        nav_frame.pack(fill=tk.X)
-        
-        menu_btn = tk.Button(nav_frame, text="🏠 Main Menu", font=self.normal_font,
-                            width=15, height=2, bg="#95A5A6", fg="white",
-                            command=self.exit_tutorial)
-        menu_btn.pack(side=tk.LEFT)
-        
-        play_btn = tk.Button(nav_frame, text="🎮 Play Real Game", font=self.normal_font,
-                            width=18, height=2, bg="#27AE60", fg="white",
-                            command=self.start_real_game)
-        play_btn.pack(side=tk.RIGHT)
+        self._show_tutorial_page("🎉 Tutorial Complete!", self.title_font, "#27AE60",
+                                 _TUTORIAL_COMPLETION_TEXT, self.normal_font,
+                                 "🏠 Main Menu", "#95A5A6",
+                                 "🎮 Play Real Game", self.start_real_game, static=True)
     
     def add_tutorial_overlay(self, overlay_type):
         """Add tutorial guidance overlay to current game screen"""
         if not hasattr(self, 'info_panel'):
             return
         
+        colors = self.colors
+        panel_bg = "#8E44AD"
+        step = self.tutorial_step
+        
         # Create tutorial guidance panel
-        tutorial_panel = tk.Frame(self.info_panel, bg="#8E44AD", relief=tk.RAISED, bd=3)
+        tutorial_panel = self._track(tk.Frame(self.info_panel, bg=panel_bg, relief=tk.RAISED, bd=3))
         tutorial_panel.pack(fill=tk.X, padx=5, pady=5)
         
         tutorial_title = tk.Label(tutorial_panel, text="🎓 Tutorial Guide", 
-                                 font=('Arial', 12, 'bold'), bg="#8E44AD", fg="white")
+                                 font=('Arial', 12, 'bold'), bg=panel_bg, fg="white")
         tutorial_title.pack(pady=(5, 2))
         
         # Different guidance based on phase
         guidance_text = self.get_tutorial_guidance(overlay_type)
         
         guidance_label = tk.Label(tutorial_panel, text=guidance_text, 
-                                 font=('Arial', 9), bg="#8E44AD", fg="white",
+                                 font=('Arial', 9), bg=panel_bg, fg="white",
                                  wraplength=250, justify=tk.LEFT)
         guidance_label.pack(padx=10, pady=(0, 5))
         
         # Tutorial navigation buttons
-        nav_frame = tk.Frame(tutorial_panel, bg="#8E44AD")
+        nav_frame = tk.Frame(tutorial_panel, bg=panel_bg)
         nav_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
         
-        if self.tutorial_step > 1:
+        if step > 1:
             back_btn = tk.Button(nav_frame, text="← Back", font=('Arial', 8),
                                 width=8, height=1, command=self.tutorial_prev_step)
             back_btn.pack(side=tk.LEFT)
         
         exit_btn = tk.Button(nav_frame, text="Exit", font=('Arial', 8),
-                            width=8, height=1, bg=self.colors["secondary"], fg="white",
+                            width=8, height=1, bg=colors["secondary"], fg="white",
                             command=self.exit_tutorial, cursor="hand2")
         exit_btn.pack(side=tk.LEFT, padx=(5, 0))
         
-        if self.tutorial_step < 7:
+        if step < 7:
             next_btn = tk.Button(nav_frame, text="Next →", font=('Arial', 8),
-                                width=8, height=1, bg=self.colors["success"], fg="white",
+                                width=8, height=1, bg=colors["success"], fg="white",
                                 command=self.tutorial_next_step, cursor="hand2")
             next_btn.pack(side=tk.RIGHT)
     
     def get_tutorial_guidance(self, overlay_type):
         """Get guidance text for different tutorial phases"""
-        guidance = {
-            "blocking_intro": """🚫 BLOCKING PHASE
-
-This is where strategy begins! Each player uses blocking tokens to eliminate game options.
-
-👆 YOUR TURN: Look at the blocking board below. Each row represents a game rule you can change.
-
-🎯 GOAL: Block options that would hurt your hand. Based on your analysis, consider blocking GREEN as trump since you're weak there.
-
-Click any available button to place your blocking token!""",
-            
-            "blocking_practice": """🎯 GREAT CHOICE!
-
-You're learning to block strategically. Notice how each block affects the final game rules.
-
-🔄 CONTINUE: Watch the AI players make their choices. They'll also try to block options that don't favor their hands.
-
-⚡ NEXT: After all players block, we'll see what rules remain and move to team selection!""",
-            
-            "team_selection": """👥 TEAM FORMATION
-
-The starting player chooses teammates for this round. Teams are temporary!
-
-🎯 STRATEGY: Choose partners based on:
-• Table position (across is often good)
-• Likely hand strength
-• Trump suit possibilities
-
-💡 TIP: In 4-player games, you pick 1 teammate for a 2v2 match.""",
-            
-            "trick_taking": """🃏 TRICK-TAKING PHASE
-
-Now the real game begins! Use your cards to win tricks and score points.
-
-📋 RULES:
-• Must follow suit if possible
-• Trump beats non-trump
-• High card wins within suit
-
-🎯 YOUR STRATEGY:
-• Use your strong Red cards when Red is trump
-• Try to capture opponent 0-value cards
-• Save your 7s for important tricks!"""
-        }
-        
-        return guidance.get(overlay_type, "Continue learning!")
+        return _GUIDANCE_TEXTS.get(overlay_type, "Continue learning!")
     
     def tutorial_next_step(self):
         """Move to next tutorial step"""
@@ -2282,12 +2894,23 @@ Now the real game begins! Use your cards to win tricks and score points.
             self.tutorial_step -= 1
             self.show_tutorial_step()
     
+    def _track(self, widget):
+        """Record a widget built by the tutorial so exit_tutorial can tear it down"""
+        self._tutorial_owned.append(widget)
+        return widget
+    
     def exit_tutorial(self):
         """Exit tutorial and return to main menu"""
         self.tutorial_mode = False
         self.tutorial_game = None
         self.game = None
-        self.show_player_selection()
+        
+        # Children before parents; widgets a later screen already replaced are skipped
+        for widget in reversed(self._tutorial_owned):
+            if widget.winfo_exists():
+                widget.destroy()
+        self._tutorial_owned = []
+        self.show_player_selection(clear=bool(self.root.winfo_children()))
     
     def start_real_game(self):
         """Start a real game after tutorial"""
@@ -2295,15 +2918,20 @@ Now the real game begins! Use your cards to win tricks and score points.
         self.tutorial_game = None
         self.setup_players(4)  # Start 4-player game
 
+    def _show_pending_hint(self):
+        """Idle callback for the hint requested by update_display"""
+        self._hint_pending = False
+        self.show_strategy_hint()
+    
     def show_strategy_hint(self):
         """Show contextual strategy hints during gameplay"""
-        if not hasattr(self, 'info_panel'):
-            return
-        
         # In tutorial mode, show tutorial guidance instead of regular hints
         if getattr(self, 'tutorial_mode', False):
             return  # Tutorial overlay will handle guidance
         
+        if not hasattr(self, 'info_panel'):
+            return
+        
         hints = self.get_current_phase_hints()
         if not hints:
             return
@@ -2317,141 +2945,156 @@ Now the real game begins! Use your cards to win tricks and score points.
         hint_title.pack(pady=(5, 2))
         
         # Pick a random hint from current phase hints
-        import random
-        current_hint = random.choice(hints)
+        current_hint = _rand_choice(hints)
         
         hint_text = tk.Label(hint_frame, text=current_hint, 
                            font=('Arial', 8), bg="#34495E", fg="white",
                            wraplength=200, justify=tk.LEFT)
         hint_text.pack(padx=10, pady=(0, 8))
     
+    # Static strategy hints per phase - dynamic hints are computed per call and put in front
+    _BLOCKING_STATIC_HINTS = (
+        "Block options that don't favor your hand - think about trump suits and starting position.",
+        "Remember: the starting player chooses teammates! Consider who you'd want to partner with.",
+        "Look at discard options - do you have bad cards you'd like to get rid of?",
+        "Count your suit distribution - which suits are you strongest/weakest in?",
+    )
+    _TEAM_HINTS = (
+        "Choose teammates who complement your hand strength!",
+        "Consider table position - sitting across from your teammate can be advantageous.",
+        "Avoid obvious partnerships that opponents can easily predict.",
+        "Think about the upcoming trick-taking phase when choosing partners.",
+    )
+    _DISCARD_STATIC_HINTS = (
+        "Discard your weakest cards unless you need them for specific strategy.",
+        "Consider what you're passing if it's 'Pass 2 right' - don't help opponents too much!",
+    )
+    _TRICK_LEAD_HINTS = (
+        "Leading a trick: Consider starting with a suit where you're strong.",
+        "Save your trump cards for when you really need them.",
+        "If you have the lead, try to play to your team's strengths.",
+    )
+    _TRICK_DISCARD_HINTS = (
+        "Can't follow suit and no trump? Play any card - get rid of weak cards.",
+        "Consider whether you want to win this trick or save your strong cards.",
+    )
+    _TRICK_STATIC_HINTS = (
+        "Count cards! Keep track of what high cards and trumps have been played.",
+        "Try to capture opponent 0-value cards - they're worth the same points as tricks!",
+        "Communicate with your teammate through your card choices.",
+        "Save your strongest cards for the most valuable tricks.",
+    )
+    
     def get_current_phase_hints(self):
         """Get relevant strategy hints for current game phase"""
-        phase = self.game.current_phase
+        hint_fn = self._PHASE_HINT_FNS.get(self.game.current_phase)
+        return hint_fn(self) if hint_fn else ()
+    
+    def _hints_blocking(self):
+        """Blocking hints, personalized from the first human player's hand"""
+        # Find human player to give personalized hints
+        human_player = None
+        human_idx = None
+        for i, player in enumerate(self.game.players):
+            if player.is_human:
+                human_player = player
+                human_idx = i
+                break
         
-        if phase == Phase.BLOCKING:
-            # Find human player to give personalized hints
-            human_player = None
-            human_idx = None
-            for i, player in enumerate(self.game.players):
-                if player.is_human:
-                    human_player = player
-                    human_idx = i
-                    break
-            
-            if not human_player:
-                return []
-            
-            hints = []
-            
-            # Analyze player's hand for specific hints
-            suits = {suit: [c for c in human_player.cards if c.suit == suit] for suit in Suit}
-            
-            # Suit strength hints
-            for suit, cards in suits.items():
-                if len(cards) >= 4:
-                    avg_value = sum(c.value for c in cards) / len(cards)
-                    if avg_value >= 8:
-                        hints.append(f"You're strong in {suit.value}! Consider protecting it from being blocked as trump.")
-                elif len(cards) <= 1:
-                    hints.append(f"You're weak in {suit.value}. Consider blocking it as trump or super trump.")
-            
-            # High card hints
-            high_cards = [c for c in human_player.cards if c.value >= 12]
-            if len(high_cards) >= 3:
-                hints.append("You have many high cards! Try to keep a trump suit available for them.")
-            
-            # Zero card hints
-            zeros = [c for c in human_player.cards if c.value == 0]
-            if zeros:
-                hints.append("You have 0-value cards! Consider which suit might become super trump to make them powerful.")
-            
-            # General blocking hints
-            hints.extend([
-                "Block options that don't favor your hand - think about trump suits and starting position.",
-                "Remember: the starting player chooses teammates! Consider who you'd want to partner with.",
-                "Look at discard options - do you have bad cards you'd like to get rid of?",
-                "Count your suit distribution - which suits are you strongest/weakest in?"
-            ])
-            
-            return hints
-            
-        elif phase == Phase.TEAM_SELECTION:
-            return [
-                "Choose teammates who complement your hand strength!",
-                "Consider table position - sitting across from your teammate can be advantageous.",
-                "Avoid obvious partnerships that opponents can easily predict.",
-                "Think about the upcoming trick-taking phase when choosing partners."
-            ]
-            
-        elif phase == Phase.DISCARD:
-            # Get trump information for specific strategy hints
-            trump_suit = self.game.game_params.get("trump", "None")
-            super_trump = self.game.game_params.get("super_trump", "None")
-            trump_name = trump_suit.value if hasattr(trump_suit, 'value') else str(trump_suit)
-            super_trump_name = super_trump.value if hasattr(super_trump, 'value') else str(super_trump)
-            
-            hints = [
-                f"Trump is {trump_name}, Super Trump is {super_trump_name}. Keep strong cards in these suits!",
-                "Discard your weakest cards unless you need them for specific strategy.",
-                "Consider what you're passing if it's 'Pass 2 right' - don't help opponents too much!",
-            ]
-            
-            # Add suit-specific hints if we have trump info
-            if hasattr(trump_suit, 'value'):
-                hints.append(f"Save high {trump_name} cards - they beat non-trump!")
-            if hasattr(super_trump, 'value'):
-                hints.append(f"Keep {super_trump_name} 0s at all costs - they beat everything!")
-                
-            return hints
-            
-        elif phase == Phase.TRICK_TAKING:
-            current_player = self.game.players[self.game.current_player_idx]
-            if not current_player.is_human:
-                return []
+        if not human_player:
+            return []
+        
+        hints = []
+        
+        # Analyze player's hand for specific hints
+        suits, high_cards, zeros = human_player.hand_partition()
+        
+        # Suit strength hints
+        for suit, cards in suits.items():
+            if len(cards) >= 4:
+                avg_value = sum(c.value for c in cards) / len(cards)
+                if avg_value >= 8:
+                    hints.append(f"You're strong in {suit.label}! Consider protecting it from being blocked as trump.")
+            elif len(cards) <= 1:
+                hints.append(f"You're weak in {suit.label}. Consider blocking it as trump or super trump.")
+        
+        # High card hints
+        if len(high_cards) >= 3:
+            hints.append("You have many high cards! Try to keep a trump suit available for them.")
+        
+        # Zero card hints
+        if zeros:
+            hints.append("You have 0-value cards! Consider which suit might become super trump to make them powerful.")
+        
+        # General blocking hints
+        hints.extend(self._BLOCKING_STATIC_HINTS)
+        
+        return hints
+    
+    def _hints_team(self):
+        """Team selection hints - static"""
+        return self._TEAM_HINTS
+    
+    def _hints_discard(self):
+        """Discard hints naming the chosen trump suits"""
+        # Get trump information for specific strategy hints
+        trump_suit = self.game.game_params.get("trump", "None")
+        super_trump = self.game.game_params.get("super_trump", "None")
+        trump_name = str(trump_suit)
+        super_trump_name = str(super_trump)
+        
+        hints = [f"Trump is {trump_name}, Super Trump is {super_trump_name}. Keep strong cards in these suits!"]
+        hints.extend(self._DISCARD_STATIC_HINTS)
+        
+        # Add suit-specific hints if we have trump info
+        if hasattr(trump_suit, 'value'):
+            hints.append(f"Save high {trump_name} cards - they beat non-trump!")
+        if hasattr(super_trump, 'value'):
+            hints.append(f"Keep {super_trump_name} 0s at all costs - they beat everything!")
             
-            hints = []
+        return hints
+    
+    def _hints_trick(self):
+        """Trick-taking hints for a human player on turn"""
+        current_player = self.game.players[self.game.current_player_idx]
+        if not current_player.is_human:
+            return []
+        
+        hints = []
+        
+        # Trick-specific hints
+        if not self.game.current_trick:
+            hints.extend(self._TRICK_LEAD_HINTS)
+        else:
+            lead_card = self.game.current_trick[0][1]
+            lead_effective_suit = self.game.get_card_effective_suit(lead_card)
+            matching_cards = self.game.get_cards_by_effective_suit(current_player.cards, lead_effective_suit)
             
-            # Trick-specific hints
-            if not self.game.current_trick:
-                hints.extend([
-                    "Leading a trick: Consider starting with a suit where you're strong.",
-                    "Save your trump cards for when you really need them.",
-                    "If you have the lead, try to play to your team's strengths."
-                ])
+            if matching_cards:
+                if lead_effective_suit == "trump":
+                    hints.append("You must follow trump suit if possible!")
+                else:
+                    hints.append(f"You must follow suit ({lead_effective_suit.label}) if possible!")
             else:
-                lead_card = self.game.current_trick[0][1]
-                lead_effective_suit = self.game.get_card_effective_suit(lead_card)
-                matching_cards = self.game.get_cards_by_effective_suit(current_player.cards, lead_effective_suit)
-                
-                if matching_cards:
-                    if lead_effective_suit == "trump":
-                        hints.append("You must follow trump suit if possible!")
-                    else:
-                        hints.append(f"You must follow suit ({lead_effective_suit.value}) if possible!")
+                # Check if player has trump cards
+                trump_cards = self.game.get_cards_by_effective_suit(current_player.cards, "trump")
+                if trump_cards:
+                    hints.append("Can't follow suit? You must play trump or supertrump!")
                 else:
-                    # Check if player has trump cards
-                    trump_cards = self.game.get_cards_by_effective_suit(current_player.cards, "trump")
-                    if trump_cards:
-                        hints.append("Can't follow suit? You must play trump or supertrump!")
-                    else:
-                        hints.extend([
-                            "Can't follow suit and no trump? Play any card - get rid of weak cards.",
-                            "Consider whether you want to win this trick or save your strong cards."
-                        ])
-            
-            # General trick-taking hints
-            hints.extend([
-                "Count cards! Keep track of what high cards and trumps have been played.",
-                "Try to capture opponent 0-value cards - they're worth the same points as tricks!",
-                "Communicate with your teammate through your card choices.",
-                "Save your strongest cards for the most valuable tricks."
-            ])
-            
-            return hints
-            
-        else:
-            return []
+                    hints.extend(self._TRICK_DISCARD_HINTS)
+        
+        # General trick-taking hints
+        hints.extend(self._TRICK_STATIC_HINTS)
+        
+        return hints
+    
+    # Phases without an entry (round end) show no hints
+    _PHASE_HINT_FNS = {
+        Phase.BLOCKING: _hints_blocking,
+        Phase.TEAM_SELECTION: _hints_team,
+        Phase.DISCARD: _hints_discard,
+        Phase.TRICK_TAKING: _hints_trick,
+    }
     
     def show_ai_thinking(self, player_idx, action_type="thinking"):
         """Show AI thinking indicator"""
@@ -2463,48 +3106,68 @@ Now the real game begins! Use your cards to win tricks and score points.
         
         player_name = self.game.players[player_idx].name
         
-        # Create thinking indicator
-        self.thinking_indicator = tk.Frame(self.info_panel, bg="#E67E22", relief=tk.RAISED, bd=3)
-        self.thinking_indicator.pack(fill=tk.X, padx=5, pady=5)
-        
-        # Animated thinking text
-        thinking_label = tk.Label(self.thinking_indicator, text="🤔 AI Thinking", 
-                                 font=('Arial', 12, 'bold'), bg="#E67E22", fg="white")
-        thinking_label.pack(pady=(5, 2))
+        # Create the thinking indicator once per info panel, then just re-pack it
+        widgets = self._thinking_widgets
+        if widgets is None or widgets[0].master is not self.info_panel or not widgets[0].winfo_exists():
+            frame = tk.Frame(self.info_panel, bg="#E67E22", relief=tk.RAISED, bd=3)
+            
+            # Animated thinking text, driven through a StringVar
+            self._thinking_text_var = tk.StringVar(value=_THINKING_DOT_STRINGS[0])
+            thinking_label = tk.Label(frame, textvariable=self._thinking_text_var, 
+                                     font=('Arial', 12, 'bold'), bg="#E67E22", fg="white")
+            thinking_label.pack(pady=(5, 2))
+            
+            player_label = tk.Label(frame, font=('Arial', 10), bg="#E67E22", fg="white")
+            player_label.pack(pady=(0, 5))
+            widgets = self._thinking_widgets = (frame, player_label)
         
-        player_label = tk.Label(self.thinking_indicator, text=f"{player_name} is {action_type}...", 
-                               font=('Arial', 10), bg="#E67E22", fg="white")
-        player_label.pack(pady=(0, 5))
+        frame, player_label = widgets
+        self._thinking_text_var.set(_THINKING_DOT_STRINGS[0])
+        player_label.config(text=f"{player_name} is {action_type}...")
+        frame.pack(fill=tk.X, padx=5, pady=5)
+        self.thinking_indicator = frame
         
         # Add animated dots
-        self.animate_thinking_dots(thinking_label)
+        self._dot_idx = 0
+        self.animate_thinking_dots()
         
         # Set up timeout (6 seconds)
         self.ai_timeout_timer = self.root.after(3000, lambda: self.handle_ai_timeout(player_idx))
     
-    def animate_thinking_dots(self, label, dots=0):
-        """Animate thinking dots"""
+    def animate_thinking_dots(self):
+        """Animate thinking dots - one pending tick at a time, cancelled by hide_ai_thinking"""
+        self._thinking_anim_id = None
         if not self.thinking_indicator:
             return
         
-        # Check if the label widget still exists
-        try:
-            # Test if widget is still valid
-            label.winfo_exists()
-            dot_text = "🤔 AI Thinking" + "." * (dots % 4)
-            label.configure(text=dot_text)
-            
-            # Continue animation only if thinking indicator still exists
-            if self.thinking_indicator:
-                self.root.after(500, lambda: self.animate_thinking_dots(label, dots + 1))
-        except tk.TclError:
-            # Widget was destroyed, stop animation
-            return
+        self._thinking_text_var.set(_THINKING_DOT_STRINGS[self._dot_idx & 3])
+        self._dot_idx += 1
+        self._thinking_anim_id = self.root.after(500, self.animate_thinking_dots)
+    
+    def _show_ai_thinking_later(self, player_idx, action_type):
+        """Show the AI thinking indicator from an idle callback, after the freshly built scene has painted"""
+        pending = self._thinking_pending
+        self._thinking_pending = (player_idx, action_type)
+        if pending is None:
+            self.root.after_idle(self._show_pending_ai_thinking)
+    
+    def _show_pending_ai_thinking(self):
+        """Idle callback for _show_ai_thinking_later - the latest request wins, a hide in between cancels it"""
+        pending = self._thinking_pending
+        self._thinking_pending = None
+        if pending is not None:
+            self.show_ai_thinking(*pending)
     
     def hide_ai_thinking(self):
         """Hide AI thinking indicator"""
+        self._thinking_pending = None
+        if self._thinking_anim_id:
+            self.root.after_cancel(self._thinking_anim_id)
+            self._thinking_anim_id = None
+        
         if self.thinking_indicator:
-            self.thinking_indicator.destroy()
+            if self.thinking_indicator.winfo_exists():
+                self.thinking_indicator.pack_forget()
             self.thinking_indicator = None
         
         if self.ai_timeout_timer:
@@ -2513,6 +3176,11 @@ Now the real game begins! Use your cards to win tricks and score points.
     
     def handle_ai_timeout(self, player_idx):
         """Handle AI timeout - force a move"""
+        # A card still being chosen on ai_play_card's worker thread is not stuck - let it finish
+        if self.game.current_phase == Phase.TRICK_TAKING and getattr(self, '_ai_turn_in_progress', False):
+            self.ai_timeout_timer = None
+            return
+        
         print(f"WARNING: AI Player {player_idx} timed out, forcing random move")
         
         # Hide thinking indicator
@@ -2532,19 +3200,15 @@ Now the real game begins! Use your cards to win tricks and score points.
     def force_ai_blocking_move(self, player_idx):
         """Force AI to make a random blocking move"""
         # Find any valid blocking option
-        for category in ["start_player", "discard", "trump", "super_trump", "points"]:
-            if self.game.can_block(category):
-                blocked_key = f"{category}_blocked"
-                blocked = self.game.blocking_board.get(blocked_key, [])
-                available = [opt for opt in self.game.blocking_board[category] 
-                           if opt not in blocked]
-                
-                if len(available) > 1:  # Can only block if more than 1 option remains
-                    import random
-                    option = random.choice(available)
-                    self.game.block_option(category, option, player_idx)
-                    self.next_blocking_turn()
-                    return
+        for category in BLOCK_CATEGORIES:
+            # Open options come straight from the board's bitmask, no blocked-list scans
+            available = self.game.get_available_options(category)
+            
+            if len(available) > 1:  # Can only block if more than 1 option remains
+                option = _rand_choice(available)
+                self.game.block_option(category, option, player_idx)
+                self.next_blocking_turn()
+                return
         
         # No valid moves, just advance
         self.next_blocking_turn()
@@ -2563,45 +3227,22 @@ Now the real game begins! Use your cards to win tricks and score points.
                 cards_needed = 0
             
             if cards_needed > 0:
-                available_cards = player.cards.copy()
-                if discard_option == "2 non-zeros":
-                    available_cards = [c for c in available_cards if c.value != 0]
+                # random.sample copies its picks, so the hand itself can be the population
+                cards = player.cards
+                available_cards = [c for c in cards if c.value != 0] if discard_option == "2 non-zeros" else cards
                 
-                import random
-                cards_to_discard = random.sample(available_cards, min(cards_needed, len(available_cards)))
-                self.discards_made[self.current_discard_player] = cards_to_discard
+                cards_to_discard = _rand_sample(available_cards, min(cards_needed, len(available_cards)))
+                self.discards_made[self.current_discard_player] = {id(card): card for card in cards_to_discard}
             
             self.process_discards()
     
     def force_ai_card_play(self, player_idx):
         """Force AI to play a random valid card using new effective suit logic"""
-        player = self.game.players[player_idx]
-        
         # Determine valid cards using enhanced suit-following rules
-        if self.game.current_trick:
-            lead_card = self.game.current_trick[0][1]
-            lead_effective_suit = self.game.get_card_effective_suit(lead_card)
-            
-            # Get all cards that match the lead effective suit
-            matching_cards = self.game.get_cards_by_effective_suit(player.cards, lead_effective_suit)
-            
-            if matching_cards:
-                # Rule 1: Must follow suit if possible
-                valid_cards = matching_cards
-            else:
-                # Rule 2: Cannot follow suit - must play trump/supertrump if available
-                trump_cards = self.game.get_cards_by_effective_suit(player.cards, "trump")
-                if trump_cards:
-                    valid_cards = trump_cards
-                else:
-                    # Rule 3: No trump cards - any card is valid
-                    valid_cards = player.cards.copy()
-        else:
-            valid_cards = player.cards.copy()
+        valid_cards = self.game.valid_plays(player_idx)
         
         if valid_cards:
-            import random
-            card = random.choice(valid_cards)
+            card = _rand_choice(valid_cards)
             self.animate_card_to_trick(player_idx, card)
 
     def setup_game_ui(self):
@@ -2659,6 +3300,10 @@ Now the real game begins! Use your cards to win tricks and score points.
         # Center game area
         self.game_area = tk.Frame(self.main_container, bg=self.colors["bg"])
         self.game_area.pack(expand=True, fill=tk.BOTH, padx=10)
+        self._card_widget_cache = {}
+        self._cached_card_widgets = set()
+        self._player_back_widgets = {}
+        self._player_views = {}
         
         
         print("DEBUG: UI setup complete")
@@ -2712,7 +3357,7 @@ Now the real game begins! Use your cards to win tricks and score points.
         def confirm_turn():
             self.turn_confirmed = True
             self.waiting_for_turn_confirmation = False
-            self.update_display()
+            self.request_update_display()
         
         confirm_btn = tk.Button(confirm_frame, 
                                text=f"✓ I am {player_name} - Show My Cards", 
@@ -2761,32 +3406,35 @@ Now the real game begins! Use your cards to win tricks and score points.
                     category = message.get("category")
                     option = message.get("option")
                     if player_idx is not None and category and option is not None:
+                        # Suit options travel as labels, like suits in card messages
+                        if category in SUIT_CATEGORIES and option != "Njet":
+                            option = Suit.from_label(option)
                         self.game.block_option(category, option, player_idx)
-                        self.root.after(10, self.update_display)
+                        self.request_update_display()
                 
                 elif message_type == "card_play":
                     # Handle card play from other player
                     player_idx = message.get("player_idx")
                     card_data = message.get("card")
                     if player_idx is not None and card_data:
-                        card = Card(Suit(card_data["suit"]), card_data["value"])
+                        card = Card(Suit.from_label(card_data["suit"]), card_data["value"])
                         self.game.play_card(player_idx, card)
-                        self.root.after(10, self.update_display)
+                        self.request_update_display()
                 
                 elif message_type == "discard_cards":
                     # Handle discard action from other player
                     player_idx = message.get("player_idx")
                     card_data_list = message.get("cards", [])
                     if player_idx is not None:
-                        cards = [Card(Suit(cd["suit"]), cd["value"]) for cd in card_data_list]
+                        cards = [Card(Suit.from_label(cd["suit"]), cd["value"]) for cd in card_data_list]
                         # Add the discards to our tracking
                         if not hasattr(self, 'discards_made'):
                             self.discards_made = {}
-                        self.discards_made[player_idx] = cards
+                        self.discards_made[player_idx] = {id(card): card for card in cards}
                         # Process the discard by calling process_discards when it's their turn
                         if self.current_discard_player == player_idx:
                             self.process_discards()
-                        self.root.after(10, self.update_display)
+                        self.request_update_display()
                 
                 elif message_type == "trick_complete":
                     # Handle trick completion - only non-host processes network message
@@ -2795,7 +3443,7 @@ Now the real game begins! Use your cards to win tricks and score points.
                         trick_data = message.get("trick", [])
                         if trick_data:
                             # Ensure we have the complete trick in our display
-                            self.update_display()
+                            self.request_update_display()
                             # Start the same 1.5 second delay
                             self.root.after(1500, self.process_trick_completion)
                 
@@ -2822,7 +3470,7 @@ Now the real game begins! Use your cards to win tricks and score points.
                             # Reset turn confirmation
                             self.turn_confirmed = False
                             self.waiting_for_turn_confirmation = False
-                            self.root.after(400, self.update_display)
+                            self.root.after(400, self.request_update_display)
                 
                 elif message_type == "team_score_update":
                     # Handle real-time team score updates
@@ -2871,32 +3519,73 @@ Now the real game begins! Use your cards to win tricks and score points.
             if self.main_menu:
                 self.main_menu.show_main_menu()
     
+    @contextmanager
+    def batch_updates(self):
+        """Defer update_display until the outermost block exits, then redraw once if anything asked for it"""
+        self._update_depth += 1
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+            if not self._update_depth and self._update_pending:
+                self._update_pending = False
+                if getattr(self, 'game', None) is not None:
+                    self.update_display()
+    
+    def request_update_display(self):
+        """Schedule update_display at idle - repeated requests in one handler collapse into one redraw"""
+        if self._update_depth:
+            self._update_pending = True
+            return
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.root.after_idle(self._do_update_display)
+    
+    def _do_update_display(self):
+        """Run a redraw queued by request_update_display"""
+        self._redraw_pending = False
+        if getattr(self, 'game', None) is not None:
+            self.update_display()
+    
     def update_display(self):
         """Update the entire display based on current game phase"""
+        # Inside batch_updates the redraw runs once when the batch ends
+        if self._update_depth:
+            self._update_pending = True
+            return
+        
         # Prevent multiple simultaneous updates
         if hasattr(self, '_updating_display') and self._updating_display:
             print("WARNING: update_display called while already updating! Skipping...")
             return
         
         self._updating_display = True
+        unmapped = False
         try:
-            print(f"DEBUG: update_display called, phase: {self.game.current_phase}, current_player: {self.game.current_player_idx}")
+            if _VERBOSE:
+                print(f"DEBUG: update_display called, phase: {self.game.current_phase}, current_player: {self.game.current_player_idx}")
             
             # Process network messages for online games
             if self.is_online_game:
                 self.process_network_messages()
                 self.check_network_connection()
             
-            # Clear game area
-            for widget in self.game_area.winfo_children():
-                widget.destroy()
-            
-            # Clear any existing blocking buttons to prevent stale references
-            self.blocking_buttons = {}
+            # Clear game area - a live blocking board is refreshed in place instead
+            if not self._blocking_scene_reusable():
+                # Build the new scene while the area is unmapped so Tk lays it out once when re-packed
+                self.game_area.pack_forget()
+                unmapped = True
+                for widget in self.game_area.winfo_children():
+                    # Cached hand cards and player areas survive; destroying the frames they sit in just unmaps them
+                    if widget not in self._cached_card_widgets:
+                        widget.destroy()
+                self._blocking_scene = None
             
             # Update info panel
             self.update_info_panel()
-            print("DEBUG: info panel updated")
+            if _VERBOSE:
+                print("DEBUG: info panel updated")
             
             # Check for turn confirmation in local multiplayer
             if (self.has_multiple_human_players() and 
@@ -2909,13 +3598,17 @@ Now the real game begins! Use your cards to win tricks and score points.
                     self._updating_display = False
                     return
             
-            # Show contextual strategy hints
-            self.show_strategy_hint()
+            # Show contextual strategy hints once the scene below has painted
+            if not self._hint_pending:
+                self._hint_pending = True
+                self.root.after_idle(self._show_pending_hint)
             
             # Update based on phase
-            print(f"DEBUG: About to show phase: {self.game.current_phase}")
+            if _VERBOSE:
+                print(f"DEBUG: About to show phase: {self.game.current_phase}")
             if self.game.current_phase == Phase.BLOCKING:
-                print(f"DEBUG: Calling show_blocking_phase for player {self.game.current_player_idx}")
+                if _VERBOSE:
+                    print(f"DEBUG: Calling show_blocking_phase for player {self.game.current_player_idx}")
                 self.show_blocking_phase()
             elif self.game.current_phase == Phase.TEAM_SELECTION:
                 self.show_team_selection_with_table()
@@ -2927,91 +3620,144 @@ Now the real game begins! Use your cards to win tricks and score points.
                 self.show_round_end()
             else:
                 print(f"DEBUG: Unknown phase: {self.game.current_phase}")
-            print("DEBUG: Finished update_display")
+            if _VERBOSE:
+                print("DEBUG: Finished update_display")
         finally:
+            if unmapped:
+                self.game_area.pack(expand=True, fill=tk.BOTH, padx=10)
             self._updating_display = False
     
+    def _font(self, size, weight="normal", family="Arial", slant="roman"):
+        """Shared Font for a family/size/weight/slant - created once, reused by every widget"""
+        key = (family, size, weight, slant)
+        cached = self._fonts.get(key)
+        if cached is None:
+            cached = self._fonts[key] = font.Font(family=family, size=size, weight=weight, slant=slant)
+        return cached
+    
+    def _build_info_widgets(self):
+        """Create the persistent info panel widgets; update_info_panel only reconfigures them"""
+        bg = self.colors["bg"]
+        panel = self.info_panel
+        w = {'panel': panel}
+        # Counter labels are bound to these variables; _set_info_text only sets changed values
+        w['vars'] = {name: tk.StringVar(panel) for name in ('round', 'phase', 'current', 'score1', 'score2')}
+        w['texts'] = {}
+        
+        # Phase and round info
+        w['info_frame'] = tk.Frame(panel, bg=bg)
+        w['round'] = tk.Label(w['info_frame'], textvariable=w['vars']['round'], font=self.header_font, bg=bg, fg="white")
+        w['round'].pack()
+        w['phase'] = tk.Label(w['info_frame'], textvariable=w['vars']['phase'], font=self.normal_font, bg=bg, fg="white")
+        w['phase'].pack()
+        w['current'] = tk.Label(w['info_frame'], textvariable=w['vars']['current'], font=self.normal_font, bg=bg, fg="white")
+        
+        # Teams display (only for 3+ player games)
+        w['teams_frame'] = tk.Frame(panel, bg=bg)
+        tk.Label(w['teams_frame'], text="Teams:",
+                font=self.header_font, bg=bg, fg="white").pack()
+        w['team_members'] = {team_num: tk.Label(w['teams_frame'], font=self.normal_font, bg=bg,
+                                                fg=self.colors.get(f"team{team_num}", "white"))
+                             for team_num in (1, 2)}
+        
+        # Team scores (only for 3+ player games)
+        w['score_frame'] = tk.Frame(panel, bg=bg)
+        tk.Label(w['score_frame'], text="Scores:",
+                font=self._font(14, 'bold'), bg=bg, fg="white").pack()
+        w['team_scores'] = {}
+        for team_num in (1, 2):
+            w['team_scores'][team_num] = tk.Label(w['score_frame'], textvariable=w['vars'][f"score{team_num}"],
+                                                  font=self._font(13, 'bold'), bg=bg, 
+                                                  fg=self.colors[f"team{team_num}"])
+            w['team_scores'][team_num].pack()
+        
+        # Add menu controls to info panel - always available
+        w['menu_frame'] = tk.Frame(panel, bg=bg)
+        small_font = self._font(10)
+        for text, command, color in (("🏠 Menu", self.exit_to_menu, "warning"),
+                                     ("💾 Save", self.save_game, "success"),
+                                     ("💾 Save & Exit", self.save_and_exit, "secondary")):
+            tk.Button(w['menu_frame'], text=text, command=command,
+                     font=small_font, bg=self.colors[color], fg="white",
+                     borderwidth=1, padx=8, pady=2, cursor="hand2").pack(side=tk.TOP, pady=1)
+        
+        w['show_current'] = None
+        w['show_teams'] = None
+        w['members'] = None
+        w['persistent'] = {w['info_frame'], w['teams_frame'], w['score_frame'], w['menu_frame']}
+        self._info_labels = w
+        return w
+    
+    def _set_info_text(self, name, text):
+        """Set one info panel variable, skipping the Tk round trip when the text is unchanged"""
+        texts = self._info_labels['texts']
+        if texts.get(name) != text:
+            texts[name] = text
+            self._info_labels['vars'][name].set(text)
+    
     def update_info_panel(self):
         """Update the information panel"""
-        for widget in self.info_panel.winfo_children():
-            widget.destroy()
+        w = self._info_labels
+        if w.get('panel') is not self.info_panel:
+            w = self._build_info_widgets()
         
-        # Phase and round info
-        info_frame = tk.Frame(self.info_panel, bg=self.colors["bg"])
-        info_frame.pack(side=tk.LEFT, padx=20)
+        # Hints and overlays are rebuilt by their owners each refresh; the AI thinking indicator is reused
+        persistent = w['persistent']
+        thinking_frame = self._thinking_widgets[0] if self._thinking_widgets else None
+        for widget in self.info_panel.winfo_children():
+            if widget not in persistent and widget is not thinking_frame:
+                widget.destroy()
         
-        tk.Label(info_frame, text=f"Round {self.game.round_number}",
-                font=self.header_font, bg=self.colors["bg"], fg="white").pack()
-        tk.Label(info_frame, text=f"Phase: {self.game.current_phase.value}",
-                font=self.normal_font, bg=self.colors["bg"], fg="white").pack()
+        # Only text changes on most refreshes
+        game = self.game
+        phase = game.current_phase
+        self._set_info_text('round', f"Round {game.round_number}")
+        self._set_info_text('phase', f"Phase: {phase.value}")
         
         # Current player
-        if self.game.current_phase in [Phase.BLOCKING, Phase.DISCARD, Phase.TRICK_TAKING]:
-            current = self.game.players[self.game.current_player_idx].name
-            tk.Label(info_frame, text=f"Current Player: {current}",
-                    font=self.normal_font, bg=self.colors["bg"], fg="white").pack()
+        show_current = phase in (Phase.BLOCKING, Phase.DISCARD, Phase.TRICK_TAKING)
+        if show_current:
+            self._set_info_text('current', f"Current Player: {game.players[game.current_player_idx].name}")
+        if show_current != w['show_current']:
+            if show_current:
+                w['current'].pack()
+            else:
+                w['current'].pack_forget()
+            w['show_current'] = show_current
         
-        # Teams display (only for 3+ player games)
-        if self.game.teams and self.game.num_players > 2:
-            teams_frame = tk.Frame(self.info_panel, bg=self.colors["bg"])
-            teams_frame.pack(side=tk.LEFT, padx=20)
-            
-            tk.Label(teams_frame, text="Teams:",
-                    font=self.header_font, bg=self.colors["bg"], fg="white").pack()
-            
+        show_teams = bool(game.teams) and game.num_players > 2
+        if show_teams:
             # Organize players by team  
             team_members = {1: [], 2: []}
-            for team_num, player_list in self.game.teams.items():
+            for team_num, player_list in game.teams.items():
                 if team_num in team_members:
                     for player_idx in player_list:
-                        team_members[team_num].append(self.game.players[player_idx].name)
+                        team_members[team_num].append(game.players[player_idx].name)
             
-            for team_num, members in team_members.items():
-                if members:
-                    team_text = f"Team {team_num}: {', '.join(members)}"
-                    team_color = self.colors.get(f"team{team_num}", "white")
-                    tk.Label(teams_frame, text=team_text,
-                            font=self.normal_font, bg=self.colors["bg"], 
-                            fg=team_color).pack()
-        
-        # Team scores (only for 3+ player games)
-        if self.game.teams and self.game.num_players > 2:
-            score_frame = tk.Frame(self.info_panel, bg=self.colors["bg"])
-            score_frame.pack(side=tk.RIGHT, padx=20)
-            
-            tk.Label(score_frame, text="Scores:",
-                    font=('Arial', 14, 'bold'), bg=self.colors["bg"], fg="white").pack()
-            tk.Label(score_frame, text=f"Team 1: {self.game.team_scores[1]}",
-                    font=('Arial', 13, 'bold'), bg=self.colors["bg"], 
-                    fg=self.colors["team1"]).pack()
-            tk.Label(score_frame, text=f"Team 2: {self.game.team_scores[2]}",
-                    font=('Arial', 13, 'bold'), bg=self.colors["bg"], 
-                    fg=self.colors["team2"]).pack()
-        
-        # Add menu controls to info panel - always available
-        menu_frame = tk.Frame(self.info_panel, bg=self.colors["bg"])
-        menu_frame.pack(side=tk.RIGHT, padx=10)
-        
-        # Exit to menu button
-        exit_btn = tk.Button(menu_frame, text="🏠 Menu", 
-                           command=self.exit_to_menu,
-                           font=('Arial', 10), bg=self.colors["warning"], fg="white",
-                           borderwidth=1, padx=8, pady=2, cursor="hand2")
-        exit_btn.pack(side=tk.TOP, pady=1)
-        
-        # Save game button
-        save_btn = tk.Button(menu_frame, text="💾 Save", 
-                           command=self.save_game,
-                           font=('Arial', 10), bg=self.colors["success"], fg="white",
-                           borderwidth=1, padx=8, pady=2, cursor="hand2")
-        save_btn.pack(side=tk.TOP, pady=1)
+            members_key = (tuple(team_members[1]), tuple(team_members[2]))
+            if members_key != w['members']:
+                for team_num, members in team_members.items():
+                    label = w['team_members'][team_num]
+                    label.pack_forget()
+                    if members:
+                        label.config(text=f"Team {team_num}: {', '.join(members)}")
+                        label.pack()
+                w['members'] = members_key
+            
+            for team_num in w['team_scores']:
+                self._set_info_text(f"score{team_num}", f"Team {team_num}: {game.team_scores[team_num]}")
         
-        # Save and Exit button
-        save_exit_btn = tk.Button(menu_frame, text="💾 Save & Exit", 
-                                command=self.save_and_exit,
-                                font=('Arial', 10), bg=self.colors["secondary"], fg="white",
-                                borderwidth=1, padx=8, pady=2, cursor="hand2")
-        save_exit_btn.pack(side=tk.TOP, pady=1)
+        # Re-pack the panel sections only when the teams section appears or disappears
+        if show_teams != w['show_teams']:
+            for section in ('info_frame', 'teams_frame', 'score_frame', 'menu_frame'):
+                w[section].pack_forget()
+            w['info_frame'].pack(side=tk.LEFT, padx=20)
+            if show_teams:
+                w['teams_frame'].pack(side=tk.LEFT, padx=20)
+                w['score_frame'].pack(side=tk.RIGHT, padx=20)
+            w['menu_frame'].pack(side=tk.RIGHT, padx=10)
+            w['show_teams'] = show_teams
+    
     
     
     
@@ -3022,43 +3768,73 @@ Now the real game begins! Use your cards to win tricks and score points.
     
     
     
+    def _blocking_scene_reusable(self):
+        """Whether update_display can refresh the current blocking board instead of rebuilding it"""
+        scene = self._blocking_scene
+        return (scene is not None and
+                scene['game'] is self.game and
+                self.game.current_phase == Phase.BLOCKING and
+                scene['frame'].winfo_exists() and
+                # Local multiplayer hides and reveals hands between turns - always rebuild
+                not self.has_multiple_human_players())
     
     def show_blocking_phase(self):
         """Display the blocking board in center with players around it"""
-        print("DEBUG: show_blocking_phase called")
+        if _VERBOSE:
+            print("DEBUG: show_blocking_phase called")
         
-        # Clear any existing blocking buttons to prevent turn overlap
-        self.blocking_buttons = {}
-        print("DEBUG: Cleared blocking buttons for new turn")
+        scene = self._blocking_scene
+        if scene is None:
+            scene = self._build_blocking_scene()
+        elif _VERBOSE:
+            print("DEBUG: Refreshing blocking board in place")
+        self._refresh_blocking_scene(scene)
         
-        # Create main table layout using grid
+        # AI turn handling - Note: AI turns are now scheduled from next_blocking_turn() 
+        # to avoid duplicate scheduling and ensure proper sequencing
+        current_player = self.game.players[self.game.current_player_idx]
+        if _VERBOSE:
+            print(f"DEBUG: *** AI TURN SCHEDULING CHECK ***")
+            print(f"DEBUG: Current player {self.game.current_player_idx} ({current_player.name}) is_human={current_player.is_human}")
+            print(f"DEBUG: Game phase: {self.game.current_phase}")
+        
+        if not current_player.is_human:
+            if _VERBOSE:
+                print(f"DEBUG: Current player is AI - scheduling turn immediately")
+            # Show thinking indicator as soon as the board has painted
+            self._show_ai_thinking_later(self.game.current_player_idx, "blocking")
+            # Queue AI turn for initial game start and when UI is ready (a turn already queued is not repeated)
+            self._queue_ai_action(self.game.current_player_idx, self.ai_blocking_turn)
+        else:
+            if _VERBOSE:
+                print(f"DEBUG: Current player {self.game.current_player_idx} ({current_player.name}) is human, waiting for input")
+            # Hide any lingering AI thinking indicators when it's human turn
+            self.hide_ai_thinking()
+    
+    def _new_table_frame(self):
+        """Packed 5x5 table grid shared by the phase scenes (board or trick area in the middle cell)"""
         table_frame = tk.Frame(self.game_area, bg=self.colors["bg"])
         table_frame.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
         
-        # Configure 5x5 grid for table layout with better weight distribution
-        # Rows: 0=title(small), 1=instruction(small), 2=players+board(main), 3=status(small), 4=bottom(small) 
-        table_frame.grid_rowconfigure(0, weight=0)  # Title - fixed size
-        table_frame.grid_rowconfigure(1, weight=0)  # Instructions - fixed size
-        table_frame.grid_rowconfigure(2, weight=3)  # Main game area - takes most space
-        table_frame.grid_rowconfigure(3, weight=0)  # Status - fixed size
-        table_frame.grid_rowconfigure(4, weight=1)  # Bottom spacing - flexible
-        
-        for i in range(5):
-            table_frame.grid_columnconfigure(i, weight=1)
+        # Rows: 0=title, 1=instructions, 2=players+board (main), 3=status, 4=bottom spacing.
+        # Title, instruction and status rows keep Tk's default weight 0, so only two rows need configuring
+        table_frame.grid_rowconfigure(2, weight=3)
+        table_frame.grid_rowconfigure(4, weight=1)
+        table_frame.grid_columnconfigure((0, 1, 2, 3, 4), weight=1)
+        return table_frame
+    
+    def _build_blocking_scene(self):
+        """Create the blocking table - title, player areas, legend and row labels"""
+        # Create main table layout using grid
+        table_frame = self._new_table_frame()
         
         # Title at top (compact)
         title_label = tk.Label(table_frame, text="BLOCKING PHASE", 
-                              font=('Arial', 16, 'bold'), bg=self.colors["bg"], fg=self.colors["accent"])
+                              font=self._font(16, 'bold'), bg=self.colors["bg"], fg=self.colors["accent"])
         title_label.grid(row=0, column=0, columnspan=5, pady=5, sticky="ew")
         
-        # Instructions below title (compact)
-        current_player = self.game.players[self.game.current_player_idx]
-        total_blockable = sum(1 for category in ["start_player", "discard", "trump", "super_trump", "points"]
-                             if self.game.can_block(category))
-        
-        instruction_text = f"{current_player.name}, choose ONE option to block  •  {total_blockable} options remaining"
-        instruction = tk.Label(table_frame, text=instruction_text,
-                              font=('Arial', 10), bg=self.colors["bg"], fg=self.colors["light_text"])
+        # Instructions below title (compact) - text set by _refresh_blocking_scene
+        instruction = tk.Label(table_frame, font=self._font(10), bg=self.colors["bg"], fg=self.colors["light_text"])
         instruction.grid(row=1, column=0, columnspan=5, pady=2, sticky="ew")
         
         # Position players around the table first
@@ -3073,12 +3849,12 @@ Now the real game begins! Use your cards to win tricks and score points.
         legend_frame.grid(row=0, column=0, columnspan=6, pady=(10, 5), sticky="ew")
         
         legend_title = tk.Label(legend_frame, text="Player Colors:", 
-                               font=('Arial', 9, 'bold'), bg=self.colors["panel_bg"], fg=self.colors["light_text"])
+                               font=self._font(9, 'bold'), bg=self.colors["panel_bg"], fg=self.colors["light_text"])
         legend_title.pack(side=tk.LEFT, padx=(10, 5))
         
         for i in range(self.game.num_players):
             player = self.game.players[i]
-            player_color = self.colors[f"player{i}"]
+            player_color = self._player_colors[i]
             
             # Create colored indicator for each player
             color_frame = tk.Frame(legend_frame, bg=player_color, width=12, height=12, relief=tk.RAISED, bd=1)
@@ -3086,142 +3862,145 @@ Now the real game begins! Use your cards to win tricks and score points.
             color_frame.pack_propagate(False)
             
             # Add X symbol in the color
-            color_label = tk.Label(color_frame, text="✗", font=('Arial', 8, 'bold'), 
+            color_label = tk.Label(color_frame, text="✗", font=self._font(8, 'bold'), 
                                   bg=player_color, fg="white")
             color_label.pack(expand=True)
             
             # Player name next to color
             name_label = tk.Label(legend_frame, text=player.name, 
-                                 font=('Arial', 8), bg="#34495E", fg="white")
+                                 font=self._font(8), bg="#34495E", fg="white")
             name_label.pack(side=tk.LEFT, padx=(0, 8))
         
-        # Blocking grid
-        categories = [
-            ("Start Player", "start_player"),
-            ("Cards to Discard", "discard"),
-            ("Trump Suit", "trump"),
-            ("Super Trump", "super_trump"),
-            ("Points per Trick", "points")
-        ]
-        
-        self.blocking_buttons = {}
-        
-        for row, (label, category) in enumerate(categories):
-            # Category label (offset by 1 for legend)
-            tk.Label(board_frame, text=label, font=('Arial', 12),
-                    bg=self.colors["bg"], fg="white", width=15).grid(row=row+1, column=0, padx=10, pady=5, sticky="w")
-            
-            # Options
-            options = self.game.blocking_board[category]
-            blocked_key = f"{category}_blocked"
-            blocked = self.game.blocking_board.get(blocked_key, [])
-            
-            col = 1
-            for option in options:
-                if category in ["trump", "super_trump"] and isinstance(option, Suit):
-                    btn_text = option.value
-                    btn_color = self.colors[option]
-                elif category in ["trump", "super_trump"] and option == "Njet":
-                    btn_text = "Njet" if category == "trump" else "Njet"
-                    btn_color = "#2C3E50"  # Dark blue-gray for Njet
-                elif category == "start_player":
-                    btn_text = self.game.players[option].name
-                    btn_color = self.colors["card_bg"]
-                else:
-                    btn_text = str(option)
-                    btn_color = self.colors["card_bg"]
-                
-                btn = tk.Button(board_frame, text=btn_text, width=12,
-                               font=('Arial', 10))
-                
-                if option in blocked:
-                    # Get who blocked this option and use their color
-                    blocking_player = self.game.get_blocking_player(category, option)
-                    if blocking_player is not None:
-                        player_color = self.colors[f"player{blocking_player}"]
-                        player_name = self.game.players[blocking_player].name
-                        
-                        # Create a frame to hold the colored X mark instead of using disabled button
-                        btn_frame = tk.Frame(board_frame, bg=player_color, width=12*8, height=25, relief=tk.SUNKEN, bd=2)
-                        btn_frame.grid(row=row+1, column=col, padx=2, pady=2, sticky="nsew")
-                        btn_frame.pack_propagate(False)
-                        
-                        # Add the X mark as a label inside the frame
-                        x_label = tk.Label(btn_frame, text=f"✗ {btn_text}", 
-                                          bg=player_color, fg="white", font=('Arial', 10, 'bold'))
-                        x_label.pack(expand=True, fill=tk.BOTH)
-                        
-                        # Store reference for cleanup
-                        if category not in self.blocking_buttons:
-                            self.blocking_buttons[category] = {}
-                        self.blocking_buttons[category][option] = btn_frame
-                        
-                        col += 1
-                        continue  # Skip the normal button creation
-                    else:
-                        # Fallback to old style if no player info
-                        btn.configure(bg="#95A5A6", fg="white", state=tk.NORMAL,
-                                     text=f"❌ {btn_text}",
-                                     relief=tk.SUNKEN,
-                                     command=lambda: None)
-                else:
-                    # Check if this row would have only one option left after blocking
-                    available_in_category = [opt for opt in options if opt not in blocked]
-                    can_block = len(available_in_category) > 1
-                    
-                    if can_block:
-                        # Can still block this option
-                        current_player = self.game.players[self.game.current_player_idx]
-                        
-                        # CRITICAL FIX: Only enable buttons if it's the current human player's turn
-                        # AND they haven't just taken a turn (prevent multiple clicks)
-                        if (current_player.is_human and 
-                            self.game.current_phase == Phase.BLOCKING and
-                            not getattr(self, '_blocking_turn_in_progress', False)):
-                            # Only enable buttons for the current human player
-                            btn.configure(bg=btn_color, fg="black", state=tk.NORMAL,
-                                         command=lambda c=category, o=option: self.block_option(c, o))
-                        else:
-                            # Disable buttons when it's an AI player's turn or turn is in progress
-                            btn.configure(bg="#95A5A6", fg="gray", state=tk.DISABLED)
-                    else:
-                        # This is the last option in the row - highlight it as the final choice
-                        btn.configure(bg="#F1C40F", fg="#2C3E50", state=tk.DISABLED, 
-                                     text=f"⭐ {btn_text}")
-                
-                btn.grid(row=row+1, column=col, padx=2, pady=2)
-                
-                if category not in self.blocking_buttons:
-                    self.blocking_buttons[category] = {}
-                self.blocking_buttons[category][option] = btn
-                
-                col += 1
-        
-        # AI turn handling - Note: AI turns are now scheduled from next_blocking_turn() 
-        # to avoid duplicate scheduling and ensure proper sequencing
-        current_player = self.game.players[self.game.current_player_idx]
-        print(f"DEBUG: *** AI TURN SCHEDULING CHECK ***")
-        print(f"DEBUG: Current player {self.game.current_player_idx} ({current_player.name}) is_human={current_player.is_human}")
-        print(f"DEBUG: Game phase: {self.game.current_phase}")
-        
-        if not current_player.is_human:
-            print(f"DEBUG: Current player is AI - scheduling turn immediately")
-            # Show thinking indicator immediately
-            self.show_ai_thinking(self.game.current_player_idx, "blocking")
-            # Schedule AI turn for initial game start and when UI is ready
-            # Use a flag to prevent duplicate scheduling
-            if not hasattr(self, '_ai_turn_scheduled') or not self._ai_turn_scheduled:
-                self._ai_turn_scheduled = True
-                def ai_turn_wrapper():
-                    self._ai_turn_scheduled = False
-                    self.ai_blocking_turn()
-                self.root.after(250, ai_turn_wrapper)
+        # The option grid is drawn on one canvas: a row label plus a rectangle and text item per option
+        max_options = max(len(self.game.blocking_board[category]) for category in BLOCK_CATEGORIES)
+        canvas = tk.Canvas(board_frame, bg=self.colors["panel_bg"], highlightthickness=0,
+                           width=_BOARD_LABEL_WIDTH + max_options * _BOARD_CELL_WIDTH + 10,
+                           height=len(BLOCK_CATEGORIES) * _BOARD_CELL_HEIGHT + 10)
+        canvas.grid(row=1, column=0, columnspan=6, padx=5, pady=(0, 10))
+        
+        categories = ("Start Player", "Cards to Discard", "Trump Suit", "Super Trump", "Points per Trick")
+        cells = {}
+        faces = {}
+        for row, (label, category) in enumerate(zip(categories, BLOCK_CATEGORIES), start=1):
+            y = 5 + (row - 1) * _BOARD_CELL_HEIGHT
+            canvas.create_rectangle(5, y + 2, _BOARD_LABEL_WIDTH - 5, y + _BOARD_CELL_HEIGHT - 2,
+                                    fill=self.colors["bg"], outline="")
+            canvas.create_text(15, y + _BOARD_CELL_HEIGHT // 2, text=label, anchor="w",
+                               font=self._font(12), fill="white")
+            for col, option in enumerate(self.game.blocking_board[category], start=1):
+                x = _BOARD_LABEL_WIDTH + (col - 1) * _BOARD_CELL_WIDTH
+                tag = f"cell{row}_{col}"
+                rect = canvas.create_rectangle(x + 2, y + 2, x + _BOARD_CELL_WIDTH - 2, y + _BOARD_CELL_HEIGHT - 2,
+                                               width=2, tags=tag)
+                text = canvas.create_text(x + _BOARD_CELL_WIDTH // 2, y + _BOARD_CELL_HEIGHT // 2,
+                                          font=self._font(10), tags=tag)
+                canvas.tag_bind(tag, '<Button-1>',
+                                lambda e, key=(row, col), c=category, o=option: self._on_blocking_cell_click(key, c, o))
+                cells[(row, col)] = (rect, text)
+                faces[(row, col)] = self._blocking_cell_face(category, option)
+        
+        scene = {'game': self.game, 'frame': table_frame, 'board': canvas,
+                 'instruction': instruction, 'cells': cells, 'faces': faces, 'looks': {}, 'rows': {}}
+        self._blocking_scene = scene
+        return scene
+    
+    def _refresh_blocking_scene(self, scene):
+        """Bring the blocking board up to date, touching only cells whose look changed"""
+        game = self.game
+        current_idx = game.current_player_idx
+        current_player = game.players[current_idx]
+        total_blockable = game.blockable_count()
+        scene['instruction'].config(
+            text=f"{current_player.name}, choose ONE option to block  •  {total_blockable} options remaining")
+        
+        # Current player's name is bold
+        for player_idx in self._player_name_labels:
+            self._highlight_player_name(player_idx, player_idx == current_idx)
+        
+        # CRITICAL FIX: Only enable buttons if it's the current human player's turn
+        # AND they haven't just taken a turn (prevent multiple clicks)
+        human_turn = (current_player.is_human and 
+                      game.current_phase == Phase.BLOCKING and
+                      not getattr(self, '_blocking_turn_in_progress', False))
+        
+        canvas = scene['board']
+        cells = scene['cells']
+        looks = scene['looks']
+        open_masks = game.blocking_board["open_mask"]
+        faces = scene['faces']
+        row_states = scene['rows']
+        for row, category in enumerate(BLOCK_CATEGORIES, start=1):
+            # A row's cells only change when its open mask or whose turn it is changes
+            mask = open_masks[category]
+            if row_states.get(row) == (mask, human_turn):
+                continue
+            row_states[row] = (mask, human_turn)
+            # Last option left in the row = final choice, decided once per row
+            can_block = mask & (mask - 1) != 0
+            for col, option in enumerate(game.blocking_board[category], start=1):
+                key = (row, col)
+                # Option col is blocked when its bit (col - 1) is clear in the open mask
+                look = self._blocking_cell_look(category, option, faces[key], not mask >> (col - 1) & 1,
+                                                can_block, human_turn)
+                if looks.get(key) != look:
+                    self._draw_blocking_cell(canvas, cells[key], look)
+                    looks[key] = look
+    
+    def _blocking_cell_face(self, category, option):
+        """(text, color) of an open blocking board cell - fixed for the whole blocking phase"""
+        if category in SUIT_CATEGORIES and isinstance(option, Suit):
+            return option.label, self.colors[option]
+        if category in SUIT_CATEGORIES and option == "Njet":
+            return "Njet", "#2C3E50"  # Dark blue-gray for Njet
+        if category == "start_player":
+            return self.game.players[option].name, self.colors["card_bg"]
+        return str(option), self.colors["card_bg"]
+    
+    def _blocking_cell_look(self, category, option, face, is_blocked, can_block, human_turn):
+        """(kind, text, color) describing how one blocking board cell should look"""
+        btn_text, btn_color = face
+        if is_blocked:
+            # Show who blocked this option in their color
+            blocking_player = self.game.get_blocking_player(category, option)
+            if blocking_player is not None:
+                return ("blocked_by", btn_text, self._player_colors[blocking_player])
+            # Fallback to old style if no player info
+            return ("blocked", btn_text, None)
+        if not can_block:
+            # This is the last option in the row - highlight it as the final choice
+            return ("final", btn_text, None)
+        if human_turn:
+            return ("open", btn_text, btn_color)
+        # Disable buttons when it's an AI player's turn or turn is in progress
+        return ("disabled", btn_text, None)
+    
+    def _draw_blocking_cell(self, canvas, items, look):
+        """Recolor one blocking board cell's rectangle and text items"""
+        kind, btn_text, color = look
+        rect, text = items
+        if kind == "blocked_by":
+            # Colored X mark of the player who blocked it
+            canvas.itemconfigure(rect, fill=color, outline="#2C3E50")
+            canvas.itemconfigure(text, text=f"✗ {btn_text}", fill="white", font=self._font(10, 'bold'))
+        elif kind == "open":
+            canvas.itemconfigure(rect, fill=color, outline="white")
+            canvas.itemconfigure(text, text=btn_text, fill="black", font=self._font(10))
+        elif kind == "blocked":
+            canvas.itemconfigure(rect, fill="#95A5A6", outline="#2C3E50")
+            canvas.itemconfigure(text, text=f"❌ {btn_text}", fill="white", font=self._font(10))
+        elif kind == "final":
+            canvas.itemconfigure(rect, fill="#F1C40F", outline="#F1C40F")
+            canvas.itemconfigure(text, text=f"⭐ {btn_text}", fill="#2C3E50", font=self._font(10))
         else:
-            print(f"DEBUG: Current player {self.game.current_player_idx} ({current_player.name}) is human, waiting for input")
-            # Hide any lingering AI thinking indicators when it's human turn
-            self.hide_ai_thinking()
-        
-        print("DEBUG: blocking board created with buttons")
+            canvas.itemconfigure(rect, fill="#95A5A6", outline="#95A5A6")
+            canvas.itemconfigure(text, text=btn_text, fill="gray", font=self._font(10))
+    
+    def _on_blocking_cell_click(self, key, category, option):
+        """Canvas click on a blocking board cell - only open cells act like buttons"""
+        scene = self._blocking_scene
+        if scene is None or scene['looks'].get(key, ("",))[0] != "open":
+            return
+        self.block_option(category, option)
     
     def show_discard_phase_with_table(self):
         """Display discard phase using table layout"""
@@ -3233,13 +4012,13 @@ Now the real game begins! Use your cards to win tricks and score points.
             # Skip to trick taking
             print("DEBUG: Skipping discard phase - no cards to discard")
             self.game.current_phase = Phase.TRICK_TAKING
-            # Use a brief delay to ensure clean transition
-            self.root.after(100, self.update_display)
+            # Redraw once this update_display pass has finished
+            self.request_update_display()
             return
         
         # Initialize discard tracking
         if not hasattr(self, 'discards_made'):
-            self.discards_made = {i: [] for i in range(self.game.num_players)}
+            self.discards_made = {i: {} for i in range(self.game.num_players)}
             # Always start with the designated start player
             self.current_discard_player = self.game.game_params["start_player"]
         elif not hasattr(self, 'current_discard_player'):
@@ -3271,28 +4050,17 @@ Now the real game begins! Use your cards to win tricks and score points.
                 self.turn_confirmed = True
         
         # Create main table layout using grid
-        table_frame = tk.Frame(self.game_area, bg=self.colors["bg"])
-        table_frame.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
-        
-        # Configure grid for table layout
-        table_frame.grid_rowconfigure(0, weight=0)  # Title
-        table_frame.grid_rowconfigure(1, weight=0)  # Instructions
-        table_frame.grid_rowconfigure(2, weight=3)  # Main area
-        table_frame.grid_rowconfigure(3, weight=0)  # Status
-        table_frame.grid_rowconfigure(4, weight=1)  # Bottom
-        
-        for i in range(5):
-            table_frame.grid_columnconfigure(i, weight=1)
+        table_frame = self._new_table_frame()
         
         # Title
         title_label = tk.Label(table_frame, text="DISCARD PHASE", 
-                              font=('Arial', 16, 'bold'), bg=self.colors["bg"], fg="#E74C3C")
+                              font=self._font(16, 'bold'), bg=self.colors["bg"], fg="#E74C3C")
         title_label.grid(row=0, column=0, columnspan=5, pady=5, sticky="ew")
         
         # Instructions
         instruction_text = f"{current_player.name}, select {cards_needed} cards to discard"
         instruction = tk.Label(table_frame, text=instruction_text,
-                              font=('Arial', 10), bg=self.colors["bg"], fg="white")
+                              font=self._font(10), bg=self.colors["bg"], fg="white")
         instruction.grid(row=1, column=0, columnspan=5, pady=2, sticky="ew")
         
         # Central discard area (where blocking board was)
@@ -3300,7 +4068,7 @@ Now the real game begins! Use your cards to win tricks and score points.
         discard_frame.grid(row=2, column=2, padx=20, pady=20, sticky="nsew")
         
         tk.Label(discard_frame, text=f"Discard Phase: {discard_option}", 
-                font=('Arial', 14, 'bold'), bg=self.colors["secondary"], fg="white").pack(pady=15)
+                font=self._font(14, 'bold'), bg=self.colors["secondary"], fg="white").pack(pady=15)
         
         # CRITICAL ADDITION: Show game parameters for strategic decision making
         params_frame = tk.Frame(discard_frame, bg=self.colors["secondary"])
@@ -3308,42 +4076,42 @@ Now the real game begins! Use your cards to win tricks and score points.
         
         # Trump information
         trump_suit = self.game.game_params.get("trump", "None")
-        trump_text = trump_suit.value if hasattr(trump_suit, 'value') else str(trump_suit)
+        trump_text = str(trump_suit)
         trump_color = self.get_suit_color(trump_suit) if hasattr(trump_suit, 'value') else "white"
         
         tk.Label(params_frame, text=f"Trump: {trump_text}", 
-                font=('Arial', 11, 'bold'), bg=self.colors["secondary"], fg=trump_color).pack()
+                font=self._font(11, 'bold'), bg=self.colors["secondary"], fg=trump_color).pack()
         
         # Super Trump information  
         super_trump = self.game.game_params.get("super_trump", "None")
-        super_trump_text = super_trump.value if hasattr(super_trump, 'value') else str(super_trump)
+        super_trump_text = str(super_trump)
         super_trump_color = self.get_suit_color(super_trump) if hasattr(super_trump, 'value') else "white"
         
         tk.Label(params_frame, text=f"Super Trump: {super_trump_text}", 
-                font=('Arial', 11, 'bold'), bg=self.colors["secondary"], fg=super_trump_color).pack()
+                font=self._font(11, 'bold'), bg=self.colors["secondary"], fg=super_trump_color).pack()
         
         # Points per trick
         points = self.game.game_params.get("points", "Unknown")
         tk.Label(params_frame, text=f"Points per Trick: {points}", 
-                font=('Arial', 11, 'bold'), bg=self.colors["secondary"], fg="yellow").pack()
+                font=self._font(11, 'bold'), bg=self.colors["secondary"], fg="yellow").pack()
         
         # Show current selection count
         selected_count = len(self.discards_made.get(self.current_discard_player, []))
         
         tk.Label(discard_frame, text=f"Selected: {selected_count}/{cards_needed}", 
-                font=('Arial', 12), bg=self.colors["secondary"], fg="white").pack(pady=10)
+                font=self._font(12), bg=self.colors["secondary"], fg="white").pack(pady=10)
         
         # Add confirm button if enough cards selected
         if selected_count == cards_needed:
             tk.Button(discard_frame, text="Confirm Discards", 
-                     font=('Arial', 12), bg="#2ECC71", fg="white",
+                     font=self._font(12), bg="#2ECC71", fg="white",
                      command=self.confirm_discards).pack(pady=10)
         
         # Handle AI players automatically
         if not current_player.is_human:
-            # Show thinking indicator immediately when AI turn is scheduled
-            self.show_ai_thinking(self.current_discard_player, "discarding")
-            self.root.after(100, lambda: self.ai_discard_cards(cards_needed))
+            # Show thinking indicator once the scene has painted
+            self._show_ai_thinking_later(self.current_discard_player, "discarding")
+            self._queue_ai_action(self.current_discard_player, lambda: self.ai_discard_cards(cards_needed))
         
         # Position players around the table with their cards
         self.position_players_around_board(table_frame, phase="discard")
@@ -3355,29 +4123,19 @@ Now the real game begins! Use your cards to win tricks and score points.
     
     def show_trick_taking_with_table(self):
         """Display trick taking using table layout"""
-        print("DEBUG: show_trick_taking_with_table called")
+        if _VERBOSE:
+            print("DEBUG: show_trick_taking_with_table called")
         
         # Initialize team scores for real-time updates during trick-taking
         if self.game.teams and self.game.num_players > 2:
             self.update_real_time_team_scores()
         
         # Create main table layout using grid
-        table_frame = tk.Frame(self.game_area, bg=self.colors["bg"])
-        table_frame.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
-        
-        # Configure grid for table layout
-        table_frame.grid_rowconfigure(0, weight=0)  # Title
-        table_frame.grid_rowconfigure(1, weight=0)  # Instructions  
-        table_frame.grid_rowconfigure(2, weight=3)  # Main area
-        table_frame.grid_rowconfigure(3, weight=0)  # Status
-        table_frame.grid_rowconfigure(4, weight=1)  # Bottom
-        
-        for i in range(5):
-            table_frame.grid_columnconfigure(i, weight=1)
+        table_frame = self._new_table_frame()
         
         # Title
         title_label = tk.Label(table_frame, text="TRICK TAKING", 
-                              font=('Arial', 16, 'bold'), bg=self.colors["bg"], fg="#2ECC71")
+                              font=self._font(16, 'bold'), bg=self.colors["bg"], fg="#2ECC71")
         title_label.grid(row=0, column=0, columnspan=5, pady=5, sticky="ew")
         
         # Instructions 
@@ -3388,16 +4146,18 @@ Now the real game begins! Use your cards to win tricks and score points.
             instruction_text = f"{current_player.name} is playing..."
             
         instruction = tk.Label(table_frame, text=instruction_text,
-                              font=('Arial', 10), bg=self.colors["bg"], fg="white")
+                              font=self._font(10), bg=self.colors["bg"], fg="white")
         instruction.grid(row=1, column=0, columnspan=5, pady=2, sticky="ew")
         
         # Central trick area
         trick_frame = tk.Frame(table_frame, bg="#34495E", relief=tk.RAISED, bd=3)
         trick_frame.grid(row=2, column=2, padx=20, pady=20, sticky="nsew")
         
-        # Store trick center position for animation (approximate center of the trick_frame)
-        # We'll update this after the widget is placed
-        self.root.after(1, lambda: self.update_trick_center_position(trick_frame))
+        # Keep the trick center for animations in step with the layout: the trick frame moves
+        # whenever it or its table is reconfigured (window resizes, player areas changing height)
+        track_center = lambda event: self.update_trick_center_position(trick_frame)
+        trick_frame.bind("<Configure>", track_center)
+        table_frame.bind("<Configure>", track_center)
         
         # Show trick information
         trump = self.game.game_params.get("trump")
@@ -3405,17 +4165,17 @@ Now the real game begins! Use your cards to win tricks and score points.
         points = self.game.game_params.get("points", 0)
         
         # Handle trump display properly
-        trump_text = "None" if trump is None else (trump.value if hasattr(trump, 'value') else str(trump))
-        super_trump_text = "None" if super_trump is None else (super_trump.value if hasattr(super_trump, 'value') else str(super_trump))
+        trump_text = str(trump)
+        super_trump_text = str(super_trump)
         
         info_label = tk.Label(trick_frame, 
                              text=f"Trump: {trump_text}  •  Super: {super_trump_text}  •  Points: {points}",
-                             font=('Arial', 10), bg="#34495E", fg="white")
+                             font=self._font(10), bg="#34495E", fg="white")
         info_label.pack(pady=5)
         
         # Current trick display
         trick_label = tk.Label(trick_frame, text="Current Trick", 
-                              font=('Arial', 14, 'bold'), bg="#34495E", fg="white")
+                              font=self._font(14, 'bold'), bg="#34495E", fg="white")
         trick_label.pack(pady=10)
         
         # Show played cards in the trick
@@ -3437,7 +4197,7 @@ Now the real game begins! Use your cards to win tricks and score points.
                 player_name = self.game.players[player_idx].name
                 play_order = ["1st", "2nd", "3rd", "4th", "5th"][i]
                 tk.Label(card_container, text=f"{player_name} ({play_order})",
-                        font=('Arial', 9, 'bold'), bg="#34495E", fg="white").pack()
+                        font=self._font(9, 'bold'), bg="#34495E", fg="white").pack()
                 
                 # The card
                 card_widget = self.create_card_widget(card_container, card, small=True)
@@ -3452,13 +4212,14 @@ Now the real game begins! Use your cards to win tricks and score points.
                 # Additional validation: ensure AI hasn't already played in current trick
                 already_played = any(p_idx == self.game.current_player_idx for p_idx, _ in self.game.current_trick)
                 if not already_played:
-                    print(f"DEBUG: SCHEDULING AI TURN for Player {self.game.current_player_idx} ({current_player.name})")
-                    # Show thinking indicator immediately when AI turn is scheduled
-                    self.show_ai_thinking(self.game.current_player_idx, "playing")
-                    self.root.after(100, self.ai_play_card)
-                else:
+                    if _VERBOSE:
+                        print(f"DEBUG: SCHEDULING AI TURN for Player {self.game.current_player_idx} ({current_player.name})")
+                    # Show thinking indicator once the scene has painted
+                    self._show_ai_thinking_later(self.game.current_player_idx, "playing")
+                    self._queue_ai_action(self.game.current_player_idx, self.ai_play_card)
+                elif _VERBOSE:
                     print(f"DEBUG: SKIPPING AI SCHEDULING - Player {self.game.current_player_idx} already played in trick")
-            else:
+            elif _VERBOSE:
                 print(f"DEBUG: SKIPPING AI SCHEDULING - conditions not met (phase={self.game.current_phase}, ai_in_progress={getattr(self, '_ai_turn_in_progress', False)}, waiting_for_confirmation={getattr(self, 'waiting_for_turn_confirmation', False)})")
         
         # Position players around the table with their cards
@@ -3467,16 +4228,18 @@ Now the real game begins! Use your cards to win tricks and score points.
     def update_trick_center_position(self, trick_frame):
         """Update the stored center position of the trick area for animation"""
         try:
-            # Get the actual position of the trick frame
-            trick_frame.update_idletasks()
-            x = trick_frame.winfo_rootx() - self.game_area.winfo_rootx()
-            y = trick_frame.winfo_rooty() - self.game_area.winfo_rooty()
+            # Called from <Configure>, so the geometry is already laid out - no update_idletasks needed.
+            # The trick frame sits in the table frame, which sits in game_area
+            table_frame = trick_frame.master
+            x = table_frame.winfo_x() + trick_frame.winfo_x()
+            y = table_frame.winfo_y() + trick_frame.winfo_y()
             width = trick_frame.winfo_width()
             height = trick_frame.winfo_height()
             
             # Store center position
             self.trick_center_pos = (x + width // 2 - 30, y + height // 2 - 40)  # Adjust for card size
-            print(f"DEBUG: Trick center position set to {self.trick_center_pos}")
+            if _VERBOSE:
+                print(f"DEBUG: Trick center position set to {self.trick_center_pos}")
         except:
             # Fallback position if calculation fails
             self.trick_center_pos = (700, 350)
@@ -3493,25 +4256,21 @@ Now the real game begins! Use your cards to win tricks and score points.
                 human_idx = idx
                 break
         
-        # Define positions around the 5x5 grid (board is at row=2, col=2)
-        if num_players == 2:
-            positions = [(3, 2, "BOTTOM"), (1, 2, "TOP")]  # Bottom and top
-        elif num_players == 3:
-            positions = [(3, 2, "BOTTOM"), (1, 1, "TOP_LEFT"), (1, 3, "TOP_RIGHT")]
-        elif num_players == 4:
-            positions = [(3, 2, "BOTTOM"), (2, 1, "LEFT"), (1, 2, "TOP"), (2, 3, "RIGHT")]
-        else:  # 5 players
-            positions = [(3, 2, "BOTTOM"), (2, 1, "LEFT"), (1, 1, "TOP_LEFT"), (1, 3, "TOP_RIGHT"), (2, 3, "RIGHT")]
+        # Positions around the 5x5 grid (board is at row=2, col=2)
+        positions = _BOARD_SEATS[num_players]
         
         # Place players starting with human at bottom
+        self._player_name_labels = {}
         for i in range(num_players):
             player_idx = (human_idx + i) % num_players
             player = self.game.players[player_idx]
             row, col, pos = positions[i]
             
-            # Create player area
-            player_frame = tk.Frame(table_frame, bg=self.colors["bg"], relief=tk.RIDGE, bd=2)
-            player_frame.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
+            # Player area - kept between scenes, re-gridded into this table and raised above it
+            view = self._player_view(player_idx)
+            player_frame = view['frame']
+            player_frame.grid(in_=table_frame, row=row, column=col, padx=10, pady=10, sticky="nsew")
+            player_frame.lift()
             
             # Store player frame for animation positioning
             self.player_frames[player_idx] = player_frame
@@ -3522,87 +4281,181 @@ Now the real game begins! Use your cards to win tricks and score points.
             else:
                 is_current = self.game.current_player_idx == player_idx
             
-            # Use assigned player color from legend, with bold for current player
-            player_color = self.colors[f"player{player_idx}"]
-            font_weight = 'bold' if is_current else 'normal'
-            
-            tk.Label(player_frame, text=player.name, font=('Arial', 12, font_weight),
-                    bg=self.colors["bg"], fg=player_color).pack(pady=2)
-            
-            # Always show total score
-            tk.Label(player_frame, text=f"Score: {player.total_score}", font=('Arial', 10, 'bold'),
-                    bg=self.colors["bg"], fg=self.colors["accent"]).pack()
-            
-            player_type = "Human" if player.is_human else "AI"
-            tk.Label(player_frame, text=player_type, font=('Arial', 8),
-                    bg=self.colors["bg"], fg="gray").pack()
-            
-            # Show compact card count only
-            if not player.is_human:
-                tk.Label(player_frame, text=f"{len(player.cards)} cards",
-                        font=('Arial', 8), bg=self.colors["bg"], fg="gray").pack()
+            # Bold name for current player
+            self._highlight_player_name(player_idx, is_current)
+            self._player_name_labels[player_idx] = view['name']
+            
+            # Name, total score, player type and AI card count only change between some refreshes
+            info = (player.name, player.total_score, player.is_human, len(player.cards))
+            if view['info'] != info:
+                view['info'] = info
+                view['name_var'].set(player.name)
+                view['score_var'].set(f"Score: {player.total_score}")
+                view['type_var'].set("Human" if player.is_human else "AI")
+                # Show compact card count only
+                if not player.is_human:
+                    view['count_var'].set(f"{len(player.cards)} cards")
+                    view['count'].pack()
+                else:
+                    view['count'].pack_forget()
             
             # Show actual cards for human players (with turn confirmation for local multiplayer)
             should_show_cards = (player.is_human and len(player.cards) > 0 and
                                 (not self.has_multiple_human_players() or 
                                  (player_idx == self.game.current_player_idx and self.turn_confirmed)))
             
+            # Cards shown below the labels - the view's hand and backs frames are re-packed so they stay last
+            hand_frame, backs_frame = view['hand'], view['backs']
+            hand_frame.pack_forget()
+            backs_frame.pack_forget()
+            
             if should_show_cards:
-                cards_frame = tk.Frame(player_frame, bg=self.colors["bg"])
-                cards_frame.pack(pady=2, expand=True, fill=tk.BOTH)
+                hand_frame.pack(pady=2, expand=True, fill=tk.BOTH)
                 
                 # Show all cards in rows of 5
-                cards_per_row = 5
-                total_cards = len(player.cards)
+                # Make cards clickable for current player during interactive phases
+                clickable = player.is_human and is_current and phase in ["discard", "trick_taking"]
+                seen = {}
+                used = set()
+                row_ranges = _HAND_ROW_RANGES[len(player.cards)]
+                rows = view['rows']
+                while len(rows) < len(row_ranges):
+                    rows.append(tk.Frame(hand_frame, bg=self.colors["bg"]))
                 
-                for row_idx in range((total_cards + cards_per_row - 1) // cards_per_row):
-                    row_frame = tk.Frame(cards_frame, bg=self.colors["bg"])
+                for row_frame, (start_idx, end_idx) in zip(rows, row_ranges):
                     row_frame.pack()
                     
-                    start_idx = row_idx * cards_per_row
-                    end_idx = min(start_idx + cards_per_row, total_cards)
-                    
+                    # Cards are children of game_area, so they are packed into the row and raised above it;
+                    # the first goes in front of whatever the row held last time, the rest follow in hand order
+                    slaves = row_frame.pack_slaves()
+                    previous = None
                     for card_idx in range(start_idx, end_idx):
                         card = player.cards[card_idx]
-                        # Make cards clickable for current player during interactive phases
-                        if player.is_human and is_current and phase in ["discard", "trick_taking"]:
-                            card_widget = self.create_card_widget(row_frame, card, clickable=True, small=True, player_idx=player_idx)
+                        # Duplicate cards are told apart by how many copies came before them
+                        copy = seen[card.code] = seen.get(card.code, -1) + 1
+                        card_widget = self._hand_card_widget(player_idx, card, copy, clickable)
+                        used.add((card.code, copy))
+                        if previous is not None:
+                            card_widget.pack(after=previous, side=tk.LEFT, padx=1)
+                        elif slaves and slaves[0] is not card_widget:
+                            card_widget.pack(before=slaves[0], side=tk.LEFT, padx=1)
                         else:
-                            card_widget = self.create_card_widget(row_frame, card, small=True)
-                        card_widget.pack(side=tk.LEFT, padx=1)
-            
-            elif player.is_human and len(player.cards) > 0 and not should_show_cards:
-                # Show card backs for hidden human players (local multiplayer)
-                backs_frame = tk.Frame(player_frame, bg=self.colors["bg"])
-                backs_frame.pack(pady=2)
+                            card_widget.pack(in_=row_frame, side=tk.LEFT, padx=1)
+                        card_widget.lift()
+                        previous = card_widget
+                    
+                    # Anything left after this row's cards was shown last time but not now
+                    for widget in row_frame.pack_slaves()[end_idx - start_idx:]:
+                        widget.pack_forget()
                 
-                # Show limited card backs with "HIDDEN" indicator
-                num_backs = min(3, len(player.cards))
-                for j in range(num_backs):
-                    card_back = self.create_card_back(backs_frame, small=True)
-                    card_back.pack(side=tk.LEFT, padx=1)
+                for row_frame in rows[len(row_ranges):]:
+                    row_frame.pack_forget()
                 
-                # Add hidden indicator with card count (open information)
-                card_count_text = f"🔒 HIDDEN ({len(player.cards)} cards)"
-                tk.Label(backs_frame, text=card_count_text, 
-                        font=('Arial', 7, 'bold'), bg=self.colors["bg"], fg="gray").pack()
+                self._evict_hand_card_widgets(player_idx, used)
             
-            elif not player.is_human and len(player.cards) > 0:
-                # Show card backs for AI players
-                backs_frame = tk.Frame(player_frame, bg=self.colors["bg"])
+            elif len(player.cards) > 0:
                 backs_frame.pack(pady=2)
+                backs_label = view['backs_label']
+                backs_label.pack_forget()
                 
-                # Show 3-4 card backs
-                num_backs = min(4, len(player.cards))
-                for j in range(num_backs):
-                    card_back = self.create_card_back(backs_frame, small=True)
-                    card_back.pack(side=tk.LEFT, padx=1)
+                if player.is_human:
+                    # Show limited card backs with "HIDDEN" indicator for hidden human players (local multiplayer)
+                    shown = min(3, len(player.cards))
+                    # Hidden indicator with card count (open information)
+                    label_text = f"🔒 HIDDEN ({len(player.cards)} cards)"
+                    label_font = self._font(7, 'bold')
+                else:
+                    # Show 3-4 card backs for AI players
+                    shown = min(4, len(player.cards))
+                    label_text = f"+{len(player.cards)-4}" if len(player.cards) > 4 else None
+                    label_font = self._font(6)
                 
-                if len(player.cards) > 4:
-                    tk.Label(backs_frame, text=f"+{len(player.cards)-4}",
-                            font=('Arial', 6), bg=self.colors["bg"], fg="gray").pack()
-
-
+                for card_back in self._player_card_backs(player_idx, shown):
+                    card_back.pack(in_=backs_frame, side=tk.LEFT, padx=1)
+                    card_back.lift()
+                
+                if label_text:
+                    backs_label.config(text=label_text, font=label_font)
+                    backs_label.pack()
+    
+    def _player_view(self, player_idx):
+        """A player's area (frame, name/score/type/count labels and hand/backs frames), reused across scene rebuilds.
+        The frame is a child of game_area so each rebuilt table can grid it again."""
+        view = self._player_views.get(player_idx)
+        if view is None or view['frame'].master is not self.game_area or not view['frame'].winfo_exists():
+            bg = self.colors["bg"]
+            frame = tk.Frame(self.game_area, bg=bg, relief=tk.RIDGE, bd=2)
+            # Label texts live in StringVars, so a refresh only writes the values that changed
+            name_var, score_var, type_var, count_var = (tk.StringVar() for _ in range(4))
+            # Use assigned player color from legend
+            name_label = tk.Label(frame, textvariable=name_var, font=self._font(12), bg=bg,
+                                  fg=self._player_colors[player_idx])
+            name_label.pack(pady=2)
+            score_label = tk.Label(frame, textvariable=score_var, font=self._font(10, 'bold'), bg=bg,
+                                   fg=self.colors["accent"])
+            score_label.pack()
+            type_label = tk.Label(frame, textvariable=type_var, font=self._font(8), bg=bg, fg="gray")
+            type_label.pack()
+            count_label = tk.Label(frame, textvariable=count_var, font=self._font(8), bg=bg, fg="gray")
+            # Shown hand (rows of cards) or card backs with their label, packed below the labels as needed
+            hand_frame = tk.Frame(frame, bg=bg)
+            backs_frame = tk.Frame(frame, bg=bg)
+            backs_label = tk.Label(backs_frame, bg=bg, fg="gray")
+            view = {'frame': frame, 'name': name_label, 'score': score_label, 'type': type_label,
+                    'count': count_label, 'hand': hand_frame, 'rows': [], 'backs': backs_frame,
+                    'backs_label': backs_label, 'info': None, 'bold': False,
+                    'name_var': name_var, 'score_var': score_var, 'type_var': type_var, 'count_var': count_var}
+            self._player_views[player_idx] = view
+            self._cached_card_widgets.add(frame)
+        return view
+    
+    def _highlight_player_name(self, player_idx, is_current):
+        """Bold the name in a player's area for the current player - the font is only changed when the highlight moves"""
+        view = self._player_views[player_idx]
+        if view['bold'] != is_current:
+            view['bold'] = is_current
+            view['name'].config(font=self._font(12, 'bold' if is_current else 'normal'))
+    
+    def _hand_card_widget(self, player_idx, card, copy, clickable):
+        """Small card widget for a shown hand, reused while its look and click behavior stay the same.
+        The widget is a child of game_area so it can be packed into any row frame."""
+        is_selected = False
+        if clickable and getattr(self, 'selecting_discards', False):
+            selected = getattr(self, 'discards_made', {}).get(getattr(self, 'current_discard_player', None), {})
+            is_selected = id(card) in selected
+        key = (player_idx, card.code, copy, clickable and self.game.current_phase, is_selected)
+        widget = self._card_widget_cache.get(key)
+        if widget is None or widget.master is not self.game_area or not widget.winfo_exists():
+            widget = self.create_card_widget(self.game_area, card, clickable=clickable, small=True,
+                                             player_idx=player_idx)
+            self._card_widget_cache[key] = widget
+            self._cached_card_widgets.add(widget)
+        return widget
+    
+    def _player_card_backs(self, player_idx, count):
+        """A player's small card backs, kept between redraws - only the difference from last time is created or destroyed.
+        The backs are children of game_area so they can be packed into any frame."""
+        backs = self._player_back_widgets.setdefault(player_idx, [])
+        if backs and (backs[0].master is not self.game_area or not backs[0].winfo_exists()):
+            backs.clear()
+        while len(backs) > count:
+            widget = backs.pop()
+            self._cached_card_widgets.discard(widget)
+            widget.destroy()
+        while len(backs) < count:
+            widget = self.create_card_back(self.game_area, small=True)
+            backs.append(widget)
+            self._cached_card_widgets.add(widget)
+        return backs
+    
+    def _evict_hand_card_widgets(self, player_idx, used):
+        """Destroy a player's cached card widgets for cards no longer in hand (used: (code, copy) pairs still held)"""
+        for key in [key for key in self._card_widget_cache if key[0] == player_idx and key[1:3] not in used]:
+            widget = self._card_widget_cache.pop(key)
+            self._cached_card_widgets.discard(widget)
+            widget.destroy()
+    
+    @_batched_updates
     def block_option(self, category, option, player_idx=None):
         """Handle blocking an option with turn validation"""
         # CRITICAL FIX: Set turn in progress flag to prevent multiple actions
@@ -3615,22 +4468,20 @@ Now the real game begins! Use your cards to win tricks and score points.
         current_player_idx = self.game.current_player_idx
         current_player = self.game.players[current_player_idx]
         
-        print(f"DEBUG: *** BLOCK_OPTION CALLED ***")
-        print(f"DEBUG: Requested block: {category}={option}")
-        print(f"DEBUG: Player_idx parameter: {player_idx}")
-        print(f"DEBUG: Current game player: {current_player_idx} ({current_player.name}), is_human={current_player.is_human}")
-        print(f"DEBUG: Game phase: {self.game.current_phase}")
-        
-        # Check for rapid successive calls (potential bug detection)
-        import time
-        current_time = time.time()
-        if not hasattr(self, '_last_block_time'):
-            self._last_block_time = 0
-        
-        time_since_last = current_time - self._last_block_time
-        if time_since_last < 0.1:  # Less than 100ms since last block
-            print(f"WARNING: Rapid successive block_option calls! Time since last: {time_since_last:.3f}s")
-        self._last_block_time = current_time
+        if _VERBOSE:
+            print(f"DEBUG: *** BLOCK_OPTION CALLED ***")
+            print(f"DEBUG: Requested block: {category}={option}")
+            print(f"DEBUG: Player_idx parameter: {player_idx}")
+            print(f"DEBUG: Current game player: {current_player_idx} ({current_player.name}), is_human={current_player.is_human}")
+            print(f"DEBUG: Game phase: {self.game.current_phase}")
+            
+            # Check for rapid successive calls (potential bug detection)
+            import time
+            current_time = time.monotonic()
+            time_since_last = current_time - getattr(self, '_last_block_time', float('-inf'))
+            if time_since_last < 0.1:  # Less than 100ms since last block
+                print(f"WARNING: Rapid successive block_option calls! Time since last: {time_since_last:.3f}s")
+            self._last_block_time = current_time
         
         # CRITICAL: Validate it's actually the current player's turn
         if not current_player.is_human:
@@ -3655,12 +4506,7 @@ Now the real game begins! Use your cards to win tricks and score points.
             return
         
         # Check if blocking would leave no options
-        blocked_key = f"{category}_blocked"
-        current_blocked = self.game.blocking_board.get(blocked_key, [])
-        available = [opt for opt in self.game.blocking_board[category] 
-                    if opt not in current_blocked]
-        
-        if len(available) <= 1:
+        if not self.game.can_block(category):
             messagebox.showwarning("Invalid Block", "Must leave at least one option unblocked!")
             self._blocking_turn_in_progress = False  # Clear flag on error
             return
@@ -3671,30 +4517,21 @@ Now the real game begins! Use your cards to win tricks and score points.
         # Play blocking sound effect
         self.sound_manager.play_sound('block')
         
-        print(f"DEBUG: Human player {current_player_idx} blocked {category}={option}")
+        if _VERBOSE:
+            print(f"DEBUG: Human player {current_player_idx} blocked {category}={option}")
         
         # Send network message for online games
         if self.is_online_game:
             self.send_network_action("blocking_action", {
                 "player_idx": current_player_idx,
                 "category": category,
-                "option": option
+                "option": option.label if isinstance(option, Suit) else option
             })
         
-        # CRITICAL: Immediately disable ALL buttons to prevent multiple clicks
-        print("DEBUG: Disabling all blocking buttons to prevent multiple clicks")
-        for cat in self.blocking_buttons:
-            for opt in self.blocking_buttons[cat]:
-                btn = self.blocking_buttons[cat][opt]
-                if hasattr(btn, 'configure') and hasattr(btn, 'config'):
-                    try:
-                        # Check if it's actually a Button widget by testing if it has a 'state' option
-                        btn.configure(state=tk.DISABLED)
-                    except tk.TclError:
-                        # Not a button widget, skip it
-                        pass
-        
-        print(f"DEBUG: About to call next_blocking_turn from block_option")
+        # CRITICAL: Immediately disable ALL cells to prevent multiple clicks
+        # (the turn-in-progress flag makes every open cell redraw as disabled)
+        if self._blocking_scene_reusable():
+            self._refresh_blocking_scene(self._blocking_scene)
         
         # Next player
         self.next_blocking_turn()
@@ -3719,13 +4556,41 @@ Now the real game begins! Use your cards to win tricks and score points.
                     print(f"ERROR in immediate AI turn: {e}")
                     import traceback
                     traceback.print_exc()
-            self.root.after(150, immediate_ai_turn)
+            self._queue_ai_action(self.game.current_player_idx, immediate_ai_turn)
+    
+    def _queue_ai_action(self, player_idx, action, delay=None):
+        """Queue an AI turn for the AI driver; a turn already queued for this player and phase is not queued twice"""
+        if delay is None:
+            delay = self.ai_speed_ms
+        game = self.game
+        phase = game.current_phase
+        for queued_game, queued_phase, queued_player, _, _ in self._ai_queue:
+            if queued_game is game and queued_phase == phase and queued_player == player_idx:
+                return
+        self._ai_queue.append((game, phase, player_idx, action, delay))
+        if self._ai_driver_id is None:
+            self._ai_driver_id = self.root.after(delay, self._drive_ai)
     
+    def _drive_ai(self):
+        """Run the next queued AI turn, then schedule the one after it"""
+        self._ai_driver_id = None
+        try:
+            if self._ai_queue:
+                game, phase, _, action, _ = self._ai_queue.popleft()
+                # Turns queued for an earlier phase or game have nothing left to do
+                if game is self.game and phase == game.current_phase:
+                    action()
+        finally:
+            if self._ai_queue and self._ai_driver_id is None:
+                self._ai_driver_id = self.root.after(self._ai_queue[0][4], self._drive_ai)
+    
+    @_batched_updates
     def ai_blocking_turn(self):
         """Handle AI blocking turn with smart strategy"""
         try:
             player_idx = self.game.current_player_idx
-            print(f"DEBUG: ai_blocking_turn called for player {player_idx}")
+            if _VERBOSE:
+                print(f"DEBUG: ai_blocking_turn called for player {player_idx}")
             
             # CRITICAL: Validate this is actually an AI player's turn
             current_player = self.game.players[player_idx]
@@ -3743,19 +4608,17 @@ Now the real game begins! Use your cards to win tricks and score points.
                 self.hide_ai_thinking()
                 return
             
-            # Check if any valid blocks exist and evaluate them
+            # Check if any valid blocks exist and evaluate them - one pass over the categories,
+            # skipped entirely once every row is down to its last option
+            game = self.game
             option_scores = []
-            for category in ["start_player", "discard", "trump", "super_trump", "points"]:
-                if self.game.can_block(category):
-                    blocked_key = f"{category}_blocked"
-                    blocked = self.game.blocking_board.get(blocked_key, [])
-                    available = [opt for opt in self.game.blocking_board[category] 
-                               if opt not in blocked]
-                    
+            if game.blockable_count():
+                for category in BLOCK_CATEGORIES:
+                    available = game.get_available_options(category)
                     if len(available) > 1:  # Can only block if more than 1 option remains
                         for option in available:
                             # Use AI evaluation to score this blocking option
-                            score = self.game.ai_evaluate_blocking_option(player_idx, category, option)
+                            score = game.ai_evaluate_blocking_option(player_idx, category, option)
                             option_scores.append((score, category, option))
             
             if not option_scores:
@@ -3765,24 +4628,23 @@ Now the real game begins! Use your cards to win tricks and score points.
                 self.next_blocking_turn()
                 return
             
-            # Sort by score (higher is better) - only compare scores to avoid Suit comparison errors
-            option_scores.sort(key=lambda x: x[0], reverse=True)
-            
             # Smart AI: Choose from top options with some randomness
             strategy = self.game.ai_strategies[player_idx]
             risk_tolerance = strategy['risk_tolerance']
             
             # Higher risk tolerance = more likely to pick optimal choice
             # Lower risk tolerance = more random behavior
-            if random.random() < risk_tolerance:
-                # Pick from top 3 options
-                top_options = option_scores[:min(3, len(option_scores))]
-                _, category, option = random.choice(top_options)
+            if self.game._uniform() < risk_tolerance:
+                # Pick from top 3 options - only compare scores to avoid Suit comparison errors
+                top_options = heapq.nlargest(3, option_scores, key=itemgetter(0))
+                _, category, option = _rand_choice(top_options)
             else:
                 # Pick randomly from all available (old behavior)
-                _, category, option = random.choice(option_scores)
+                _, category, option = _rand_choice(option_scores)
             
-            print(f"DEBUG: AI Player {player_idx} blocking {category}={option} (score: {option_scores[0][0]:.2f})")
+            if _VERBOSE:
+                best_score = max(option_scores, key=itemgetter(0))[0]
+                print(f"DEBUG: AI Player {player_idx} blocking {category}={option} (best score: {best_score:.2f})")
             
             # Actually perform the block
             self.game.block_option(category, option, player_idx)
@@ -3793,12 +4655,11 @@ Now the real game begins! Use your cards to win tricks and score points.
             # Hide AI thinking indicator after decision is made
             self.hide_ai_thinking()
             
-            print(f"DEBUG: AI player {player_idx} blocked {category}={option}, scheduling next turn")
+            if _VERBOSE:
+                print(f"DEBUG: AI player {player_idx} blocked {category}={option}, moving to next turn")
             
-            # Move to next player after a short delay
-            # Note: We don't update the button directly here since next_blocking_turn 
-            # will call update_display() which recreates the entire UI
-            self.root.after(100, self.next_blocking_turn)
+            # Move to next player - the board is redrawn once when this batched turn ends
+            self.next_blocking_turn()
             
         except Exception as e:
             print(f"ERROR in ai_blocking_turn: {e}")
@@ -3809,45 +4670,50 @@ Now the real game begins! Use your cards to win tricks and score points.
             # Try to recover by moving to next turn
             self.next_blocking_turn()
     
+    def _blocking_turn_caller(self):
+        """'function:line' that called next_blocking_turn - only looked up when a turn warning is printed"""
+        import inspect
+        # Skip this helper, next_blocking_turn and its _batched_updates wrapper
+        caller_frame = inspect.currentframe()
+        for _ in range(3):
+            caller_frame = caller_frame.f_back if caller_frame else None
+        return f"{caller_frame.f_code.co_name}:{caller_frame.f_lineno}" if caller_frame else "Unknown"
+    
+    @_batched_updates
     def next_blocking_turn(self):
         """Move to next player in blocking phase"""
-        # Add timestamp and stack trace info for debugging
-        import time, inspect
-        timestamp = time.strftime("%H:%M:%S.%f")[:-3]  # Include milliseconds
-        caller_frame = inspect.currentframe().f_back
-        caller_info = f"{caller_frame.f_code.co_name}:{caller_frame.f_lineno}" if caller_frame else "Unknown"
+        game = self.game
+        num_players = game.num_players
+        current_idx = game.current_player_idx
         
-        print(f"\n=== DEBUG: next_blocking_turn ENTRY [{timestamp}] ===")
-        print(f"DEBUG: Called from: {caller_info}")
-        print(f"DEBUG: Current game state:")
-        print(f"  - Phase: {self.game.current_phase}")
-        print(f"  - Current player index: {self.game.current_player_idx}")
-        print(f"  - Total players: {self.game.num_players}")
+        if _VERBOSE:
+            import time
+            timestamp = f"{time.monotonic():.3f}"
+            print(f"\n=== DEBUG: next_blocking_turn ENTRY [{timestamp}] ===")
+            print(f"DEBUG: Current game state:")
+            print(f"  - Phase: {game.current_phase}")
+            print(f"  - Current player index: {current_idx}")
+            print(f"  - Total players: {num_players}")
         
         # Validate current player index
-        if not (0 <= self.game.current_player_idx < self.game.num_players):
-            print(f"ERROR: Invalid current_player_idx {self.game.current_player_idx} (should be 0-{self.game.num_players-1})")
+        if not (0 <= current_idx < num_players):
+            print(f"ERROR: Invalid current_player_idx {current_idx} (should be 0-{num_players-1})")
             return
         
-        current_player = self.game.players[self.game.current_player_idx]
-        print(f"  - Current player: {current_player.name} ({'human' if current_player.is_human else 'AI'})")
+        current_player = game.players[current_idx]
+        if _VERBOSE:
+            print(f"  - Current player: {current_player.name} ({'human' if current_player.is_human else 'AI'})")
         
         # Check if any more blocking is possible
-        blockable_categories = []
-        for category in ["start_player", "discard", "trump", "super_trump", "points"]:
-            if self.game.can_block(category):
-                blockable_categories.append(category)
-        
-        total_blockable = len(blockable_categories)
-        print(f"DEBUG: Blockable categories remaining: {blockable_categories} (total: {total_blockable})")
+        total_blockable = game.blockable_count()
         
         # Show detailed blocking state for each category
-        for category in ["start_player", "discard", "trump", "super_trump", "points"]:
-            blocked_key = f"{category}_blocked"
-            blocked = self.game.blocking_board.get(blocked_key, [])
-            available = [opt for opt in self.game.blocking_board[category] 
-                        if opt not in blocked]
-            print(f"  - {category}: total={len(self.game.blocking_board[category])}, blocked={len(blocked)}, available={len(available)}")
+        if _VERBOSE:
+            print(f"DEBUG: Blockable categories remaining: {total_blockable}")
+            for category in BLOCK_CATEGORIES:
+                blocked = game.blocking_board.get(BLOCKED_KEYS[category], ())
+                available = game.get_available_options(category)
+                print(f"  - {category}: total={len(game.blocking_board[category])}, blocked={len(blocked)}, available={len(available)}")
         
         if total_blockable == 0:
             # Blocking phase complete - each row has exactly one option left
@@ -3870,26 +4736,27 @@ Now the real game begins! Use your cards to win tricks and score points.
                 self.game.current_player_idx = self.game.game_params["start_player"]
                 print(f"DEBUG: Changed current_player_idx from {old_current_player} to {self.game.current_player_idx} (start_player)")
             
-            print(f"DEBUG: === next_blocking_turn EXIT [{time.strftime('%H:%M:%S.%f')[:-3]}] ===\n")
             self.update_display()
             return
         
         # Move to next player
-        old_player = self.game.current_player_idx
-        old_player_name = self.game.players[old_player].name
+        old_player = current_idx
+        old_player_name = current_player.name
         
-        # Calculate next player with detailed logging
-        next_player_calculation = (self.game.current_player_idx + 1) % self.game.num_players
-        print(f"DEBUG: Turn progression calculation:")
-        print(f"  - Old player: {old_player} ({old_player_name})")
-        print(f"  - Calculation: ({old_player} + 1) % {self.game.num_players} = {next_player_calculation}")
+        # Calculate next player
+        next_player_calculation = (old_player + 1) % num_players
+        if _VERBOSE:
+            print(f"DEBUG: Turn progression calculation:")
+            print(f"  - Old player: {old_player} ({old_player_name})")
+            print(f"  - Calculation: ({old_player} + 1) % {num_players} = {next_player_calculation}")
         
         # Actually change the current player
-        self.game.current_player_idx = next_player_calculation
-        new_player = self.game.current_player_idx
-        new_player_name = self.game.players[new_player].name
+        game.current_player_idx = next_player_calculation
+        new_player = next_player_calculation
+        next_player = game.players[new_player]
         
-        print(f"  - New player: {new_player} ({new_player_name}) [{'human' if self.game.players[new_player].is_human else 'AI'}]")
+        if _VERBOSE:
+            print(f"  - New player: {new_player} ({next_player.name}) [{'human' if next_player.is_human else 'AI'}]")
         
         # Reset turn confirmation for local multiplayer
         self.turn_confirmed = False
@@ -3897,70 +4764,51 @@ Now the real game begins! Use your cards to win tricks and score points.
         
         # CRITICAL CHECK: Verify the player index actually changed
         if old_player == new_player:
-            print(f"CRITICAL ERROR: Player index did not change! Still {old_player}")
-            print(f"  - num_players: {self.game.num_players}")
-            print(f"  - Calculation should be: ({old_player} + 1) % {self.game.num_players} = {(old_player + 1) % self.game.num_players}")
+            print(f"CRITICAL ERROR: Player index did not change! Still {old_player} (called from {self._blocking_turn_caller()})")
+            print(f"  - num_players: {num_players}")
+            print(f"  - Calculation should be: ({old_player} + 1) % {num_players} = {(old_player + 1) % num_players}")
             # Force the calculation to ensure it works
-            self.game.current_player_idx = (old_player + 1) % self.game.num_players
-            print(f"  - Forced new player: {self.game.current_player_idx}")
-        else:
-            print(f"SUCCESS: Player changed from {old_player} to {new_player}")
-        
-        # Detect potential bug: same player multiple times
-        if old_player == new_player:
-            print(f"WARNING: Player {old_player} is taking consecutive turns! This might be a bug!")
-        
-        # Track turn history for pattern detection
-        if not hasattr(self, '_turn_history'):
-            self._turn_history = []
-        self._turn_history.append((timestamp, old_player, new_player, caller_info))
-        
-        # Keep only last 10 turns for analysis
-        if len(self._turn_history) > 10:
-            self._turn_history = self._turn_history[-10:]
-        
-        # Check for problematic patterns
-        if len(self._turn_history) >= 3:
-            recent_players = [turn[2] for turn in self._turn_history[-3:]]  # new_player from last 3 turns
-            if len(set(recent_players)) == 1:
-                print(f"WARNING: Player {recent_players[0]} has taken 3+ consecutive turns!")
-                print("Turn history (last 10):")
-                for i, (ts, old_p, new_p, caller) in enumerate(self._turn_history):
-                    print(f"  {i+1}. [{ts}] {old_p}->{new_p} (from {caller})")
-        
-        print(f"DEBUG: === next_blocking_turn EXIT [{time.strftime('%H:%M:%S.%f')[:-3]}] ===\n")
+            game.current_player_idx = (old_player + 1) % num_players
+            next_player = game.players[game.current_player_idx]
+            print(f"  - Forced new player: {game.current_player_idx}")
+        
+        if _VERBOSE:
+            # Detect potential bug: same player multiple times
+            if old_player == new_player:
+                print(f"WARNING: Player {old_player} is taking consecutive turns! This might be a bug!")
+            
+            # Track turn history for pattern detection (the deque keeps only the last 10 turns)
+            self._turn_history.append((timestamp, old_player, new_player))
+            
+            # Check for problematic patterns
+            if len(self._turn_history) >= 3:
+                recent_players = [self._turn_history[i][2] for i in (-3, -2, -1)]  # new_player from last 3 turns
+                if len(set(recent_players)) == 1:
+                    print(f"WARNING: Player {recent_players[0]} has taken 3+ consecutive turns! "
+                          f"(called from {self._blocking_turn_caller()})")
+                    print("Turn history (last 10):")
+                    for i, (ts, old_p, new_p) in enumerate(self._turn_history):
+                        print(f"  {i+1}. [{ts}] {old_p}->{new_p}")
+            
+            print(f"DEBUG: === next_blocking_turn EXIT [{time.monotonic():.3f}] ===\n")
         
         # CRITICAL: Clear any blocking turn flags when switching players
         if hasattr(self, '_blocking_turn_in_progress'):
             self._blocking_turn_in_progress = False
-            print("DEBUG: Cleared blocking turn in progress flag in next_blocking_turn")
-        
-        # CRITICAL: Add delay before update_display to ensure state is stable
-        print("DEBUG: Scheduling update_display in 100ms to ensure stable state")
-        
-        # Check if next player is AI and schedule their turn after UI update
-        next_player = self.game.players[self.game.current_player_idx]
-        if not next_player.is_human and self.game.current_phase == Phase.BLOCKING:
-            print(f"DEBUG: Next player {self.game.current_player_idx} ({next_player.name}) is AI, scheduling turn after UI update")
-            def update_and_schedule_ai():
-                self.update_display()
-                # Schedule AI turn after UI is updated, but only if not already scheduled
-                if not hasattr(self, '_ai_turn_scheduled') or not self._ai_turn_scheduled:
-                    self._ai_turn_scheduled = True
-                    def ai_turn_wrapper():
-                        self._ai_turn_scheduled = False
-                        self.ai_blocking_turn()
-                    self.root.after(200, ai_turn_wrapper)
-            self.root.after(100, update_and_schedule_ai)
-        else:
-            self.root.after(100, self.update_display)
+        
+        # Redraw once the surrounding batch ends (block_option and ai_blocking_turn are batched too)
+        self.update_display()
+        
+        # Check if next player is AI and queue their turn, unless it is already queued
+        if not next_player.is_human and game.current_phase == Phase.BLOCKING:
+            self._queue_ai_action(game.current_player_idx, self.ai_blocking_turn)
     
     def debug_show_player_history(self):
         """Display recent player change history for debugging"""
         print("\n=== PLAYER CHANGE HISTORY ===")
         history = self.game.get_player_change_history()
         if not history:
-            print("No player changes recorded yet.")
+            print("No player changes recorded yet (set NjetGame._debug = True to record them).")
         else:
             print("Recent player index changes (last 20):")
             for i, (timestamp, old_val, new_val, caller) in enumerate(history):
@@ -3987,7 +4835,7 @@ Now the real game begins! Use your cards to win tricks and score points.
         
         for i in range(self.game.num_players):
             player = self.game.players[i]
-            player_color = self.colors[f"player{i}"]
+            player_color = self._player_colors[i]
             
             # Create colored indicator for each player
             color_frame = tk.Frame(legend_frame, bg=player_color, width=12, height=12, relief=tk.RAISED, bd=1)
@@ -4018,32 +4866,30 @@ Now the real game begins! Use your cards to win tricks and score points.
             tk.Label(board_frame, text=label, font=('Arial', 11, 'bold'),
                     bg="#34495E", fg="white", width=15).grid(row=row_idx+2, column=0, padx=5, pady=2, sticky="w")
             
-            # Options with blocking status
+            # Options with blocking status - option col is blocked when bit (col - 1) of the open mask is clear
             options = self.game.blocking_board[category]
-            blocked_key = f"{category}_blocked"
-            blocked = self.game.blocking_board.get(blocked_key, [])
+            open_mask = self.game.blocking_board["open_mask"][category]
             
-            col = 1
-            for option in options:
-                if category in ["trump", "super_trump"] and isinstance(option, Suit):
-                    btn_text = option.value
+            for col, option in enumerate(options, start=1):
+                if category in SUIT_CATEGORIES and isinstance(option, Suit):
+                    btn_text = option.label
                     btn_color = self.colors[option]
-                elif category in ["trump", "super_trump"] and option == "Njet":
+                elif category in SUIT_CATEGORIES and option == "Njet":
                     btn_text = "Njet"
                     btn_color = "#2C3E50"
                 elif category == "start_player":
                     btn_text = self.game.players[option].name
-                    btn_color = self.colors[f"player{option}"]
+                    btn_color = self._player_colors[option]
                 else:
                     btn_text = str(option)
                     btn_color = "#2C3E50"
                 
                 # Create label with appropriate background (blocked or available)
-                if option in blocked:
+                if not open_mask >> (col - 1) & 1:
                     # Show blocked option with X and blocker's color
                     blocking_player = self.game.get_blocking_player(category, option)
                     if blocking_player is not None:
-                        blocker_color = self.colors[f"player{blocking_player}"]
+                        blocker_color = self._player_colors[blocking_player]
                         text_color = "white"
                         display_text = f"✗ {btn_text}"
                         bg_color = blocker_color
@@ -4060,8 +4906,6 @@ Now the real game begins! Use your cards to win tricks and score points.
                 option_label = tk.Label(board_frame, text=display_text, font=('Arial', 9),
                                        bg=bg_color, fg=text_color, width=10, relief=tk.RAISED, bd=1)
                 option_label.grid(row=row_idx+2, column=col, padx=2, pady=2)
-                
-                col += 1
     
     def show_team_selection(self):
         """Show team selection for 3, 4, or 5 players - starting player chooses teams"""
@@ -4134,12 +4978,13 @@ Now the real game begins! Use your cards to win tricks and score points.
             # AI selects random teammates
             tk.Label(frame, text="AI is selecting...",
                     font=self.normal_font, bg=self.colors["bg"], fg="white").pack()
-            self.root.after(100, lambda: self.ai_select_teammates(start_player_idx, teammates_needed))
+            self._queue_ai_action(start_player_idx, lambda: self.ai_select_teammates(start_player_idx, teammates_needed))
     
+    @_batched_updates
     def ai_select_teammates(self, start_player_idx, teammates_needed):
         """AI selects random teammates"""
         available = [i for i in range(self.game.num_players) if i != start_player_idx]
-        selected = random.sample(available, teammates_needed)
+        selected = _rand_sample(available, teammates_needed)
         
         self.selected_teammates = selected
         self.finalize_team_selection()
@@ -4172,7 +5017,7 @@ Now the real game begins! Use your cards to win tricks and score points.
                 # AI makes random choice
                 tk.Label(frame, text="AI is choosing...",
                         font=self.normal_font, bg=self.colors["bg"], fg="white").pack()
-                choice = random.choice(["2player", "1player"])
+                choice = _rand_choice(["2player", "1player"])
                 self.root.after(100, lambda: self.handle_3player_team_choice(start_player_idx, choice))
         else:
             # Step 2: Assign the other players based on start player's choice
@@ -4182,7 +5027,7 @@ Now the real game begins! Use your cards to win tricks and score points.
         """Handle start player's choice of team structure"""
         self.team_structure_chosen = True
         self.start_player_team_choice = choice
-        self.update_display()  # Refresh to show player assignment
+        self.request_update_display()  # Refresh to show player assignment
     
     def show_3player_assignment(self, frame, start_player_idx):
         """Show player assignment after team structure is chosen"""
@@ -4202,7 +5047,7 @@ Now the real game begins! Use your cards to win tricks and score points.
                              width=20, height=2).pack(pady=5)
             else:
                 # AI chooses random teammate
-                teammate = random.choice(other_players)
+                teammate = _rand_choice(other_players)
                 solo_player = [p for p in other_players if p != teammate][0]
                 self.root.after(100, lambda: self.finalize_3player_teams(start_player_idx, teammate, solo_player))
         else:
@@ -4245,28 +5090,23 @@ Now the real game begins! Use your cards to win tricks and score points.
         
         # Continue to discard phase
         self.game.current_phase = Phase.DISCARD
-        self.update_display()
+        self.request_update_display()
     
+    @_batched_updates
     def finalize_team_selection(self):
         """Finalize team selection after all teammates are chosen"""
         start_idx = self.game.game_params["start_player"]
         
         # Form teams: start player + selected teammates = Team 1, others = Team 2
-        self.game.teams = {}
-        team1_members = [start_idx] + self.selected_teammates
-        
-        # Create teams in correct format: {team_number: [list_of_player_indices]}
-        self.game.teams = {1: [], 2: []}
-        for i in range(self.game.num_players):
-            if i in team1_members:
-                self.game.teams[1].append(i)
-            else:
-                self.game.teams[2].append(i)
+        team1_members = {start_idx, *self.selected_teammates}
         
-        # Assign teams to players
-        for team_num, player_list in self.game.teams.items():
-            for player_idx in player_list:
-                self.game.players[player_idx].team = team_num
+        # Teams in the usual format {team_number: [list_of_player_indices]}, assigned to players in the same pass
+        teams = {1: [], 2: []}
+        for i, player in enumerate(self.game.players):
+            team_num = 1 if i in team1_members else 2
+            teams[team_num].append(i)
+            player.team = team_num
+        self.game.teams = teams
         
         # Reset selection for next round
         self.selected_teammates = []
@@ -4274,8 +5114,9 @@ Now the real game begins! Use your cards to win tricks and score points.
         self.game.current_phase = Phase.DISCARD
         self.sound_manager.play_sound('phase_change')
         self.game.current_player_idx = self.game.game_params["start_player"]
-        self.update_display()
+        self.request_update_display()
     
+    @_batched_updates
     def handle_teammate_selection(self, player_idx, teammates_needed):
         """Handle teammate selection with support for multiple teammates"""
         if not hasattr(self, 'selected_teammates'):
@@ -4288,7 +5129,7 @@ Now the real game begins! Use your cards to win tricks and score points.
             self.finalize_team_selection()
         else:
             # Need more teammates, refresh display
-            self.update_display()
+            self.request_update_display()
     
     
     def show_discard_phase(self):
@@ -4305,11 +5146,11 @@ Now the real game begins! Use your cards to win tricks and score points.
             # Skip to trick taking
             self.game.current_phase = Phase.TRICK_TAKING
             self.sound_manager.play_sound('phase_change')
-            self.update_display()
+            self.request_update_display()
         else:
             # Initialize discard tracking
             if not hasattr(self, 'discards_made'):
-                self.discards_made = {i: [] for i in range(self.game.num_players)}
+                self.discards_made = {i: {} for i in range(self.game.num_players)}
                 self.current_discard_player = self.game.game_params["start_player"]
             
             # Show current player's turn
@@ -4339,9 +5180,9 @@ Now the real game begins! Use your cards to win tricks and score points.
             
             # AI or human handling
             if not current_player.is_human:
-                # Show thinking indicator immediately when AI turn is scheduled
-                self.show_ai_thinking(self.current_discard_player, "discarding")
-                self.root.after(100, lambda: self.ai_discard_cards(cards_needed))
+                # Show thinking indicator once the scene has painted
+                self._show_ai_thinking_later(self.current_discard_player, "discarding")
+                self._queue_ai_action(self.current_discard_player, lambda: self.ai_discard_cards(cards_needed))
             else:
                 # Enable card selection for human players
                 self.selecting_discards = True
@@ -4352,8 +5193,22 @@ Now the real game begins! Use your cards to win tricks and score points.
                     tk.Button(frame, text="Confirm Discard", font=self.normal_font,
                              command=self.confirm_discards).pack(pady=10)
     
+    @_batched_updates
     def ai_discard_cards(self, cards_needed):
-        """AI discards cards with smart strategy"""
+        """AI discards cards; following AI players discard straight after, and the table is redrawn once at the end"""
+        players = self.game.players
+        while True:
+            self._choose_ai_discards(cards_needed)
+            self.process_discards()
+            
+            # process_discards ends the phase (and drops current_discard_player) after the last player
+            if self.game.current_phase != Phase.DISCARD or not hasattr(self, 'current_discard_player'):
+                return
+            if self.current_discard_player >= len(players) or players[self.current_discard_player].is_human:
+                return
+    
+    def _choose_ai_discards(self, cards_needed):
+        """Pick the current AI discard player's discards with smart strategy and record them in discards_made"""
         current_player_idx = self.current_discard_player
         current_player = self.game.players[current_player_idx]
         discard_option = self.game.game_params["discard"]
@@ -4370,16 +5225,19 @@ Now the real game begins! Use your cards to win tricks and score points.
         super_trump = self.game.game_params.get("super_trump")
         remaining_cards = self.game.get_remaining_cards(current_player_idx)
         
+        # Suit lengths come from the cached hand partition instead of rescanning the hand per card
+        by_suit, _, _ = current_player.hand_partition()
+        
         # Score each card for how much we want to keep it (higher = keep)
         card_scores = []
         for card in available_cards:
             keep_score = 0.0
             
             # Keep super trump 0s at all costs
-            if super_trump and card.suit == super_trump and card.value == 0:
+            if super_trump is not None and card.suit == super_trump and card.value == 0:
                 keep_score = 1000.0
             # Keep trump cards, especially high ones
-            elif trump and card.suit == trump:
+            elif trump is not None and card.suit == trump:
                 keep_score = 50.0 + card.value
             # Keep high-value cards that can win tricks
             elif card.value >= 12:
@@ -4389,28 +5247,23 @@ Now the real game begins! Use your cards to win tricks and score points.
                 keep_score = 25.0
             # Keep cards where we have suit strength
             else:
-                suit_cards = [c for c in current_player.cards if c.suit == card.suit]
-                if len(suit_cards) >= 4:  # Strong in this suit
+                if len(by_suit[card.suit]) >= 4:  # Strong in this suit
                     keep_score = 15.0 + card.value
                 else:
                     keep_score = card.value
             
             card_scores.append((keep_score, card))
         
-        # Sort by score (ascending - discard lowest scores first)
-        card_scores.sort()
-        cards_to_discard = [card for _, card in card_scores[:cards_needed]]
+        # Discard the lowest scores (same picks as sorting ascending and slicing)
+        cards_to_discard = [card for _, card in heapq.nsmallest(cards_needed, card_scores)]
         
         print(f"DEBUG: AI Player {current_player_idx} discarding: {[str(c) for c in cards_to_discard]}")
         
         # Store discards
-        self.discards_made[self.current_discard_player] = cards_to_discard
+        self.discards_made[self.current_discard_player] = {id(card): card for card in cards_to_discard}
         
         # Hide AI thinking indicator
         self.hide_ai_thinking()
-        
-        # Process the discard
-        self.process_discards()
     
     def confirm_discards(self):
         """Confirm human player's discards"""
@@ -4418,8 +5271,8 @@ Now the real game begins! Use your cards to win tricks and score points.
         
         # Send network message for online games
         if self.is_online_game:
-            discarded_cards = self.discards_made[self.current_discard_player]
-            card_data = [{"suit": card.suit.value, "value": card.value} for card in discarded_cards]
+            discarded_cards = self.discards_made[self.current_discard_player].values()
+            card_data = [{"suit": card.suit.label, "value": card.value} for card in discarded_cards]
             self.send_network_action("discard_cards", {
                 "player_idx": self.current_discard_player,
                 "cards": card_data
@@ -4427,11 +5280,12 @@ Now the real game begins! Use your cards to win tricks and score points.
         
         self.process_discards()
     
+    @_batched_updates
     def process_discards(self):
         """Process the discards for current player"""
         current_player = self.game.players[self.current_discard_player]
         discard_option = self.game.game_params["discard"]
-        discarded_cards = self.discards_made[self.current_discard_player]
+        discarded_cards = list(self.discards_made[self.current_discard_player].values())
         
         if discard_option == "Pass 2 right":
             # Pass cards to right neighbor
@@ -4439,8 +5293,8 @@ Now the real game begins! Use your cards to win tricks and score points.
             right_neighbor = self.game.players[right_neighbor_idx]
             
             # Remove from current player
-            for card in discarded_cards:
-                current_player.cards.remove(card)
+            current_player.remove_cards(discarded_cards)
+            self.game.record_discards(self.current_discard_player, discarded_cards, right_neighbor_idx)
             
             # Add to right neighbor (will be done after all players select)
             if not hasattr(self, 'cards_to_pass'):
@@ -4448,8 +5302,8 @@ Now the real game begins! Use your cards to win tricks and score points.
             self.cards_to_pass[self.current_discard_player] = (right_neighbor_idx, discarded_cards)
         else:
             # Just discard the cards
-            for card in discarded_cards:
-                current_player.cards.remove(card)
+            current_player.remove_cards(discarded_cards)
+            self.game.record_discards(self.current_discard_player, discarded_cards)
         
         # Move to next player
         self.current_discard_player += 1
@@ -4475,10 +5329,12 @@ Now the real game begins! Use your cards to win tricks and score points.
         if self.current_discard_player >= self.game.num_players:
             # All players have discarded
             if discard_option == "Pass 2 right":
-                # Now actually pass the cards
+                # Now actually pass the cards, sorting each receiving hand once
+                receivers = set()
                 for from_idx, (to_idx, cards) in self.cards_to_pass.items():
-                    for card in cards:
-                        self.game.players[to_idx].cards.append(card)
+                    self.game.players[to_idx].cards.extend(cards)
+                    receivers.add(to_idx)
+                for to_idx in receivers:
                     self.game.players[to_idx].sort_cards()
             
             # Clean up and move to trick taking
@@ -4493,8 +5349,7 @@ Now the real game begins! Use your cards to win tricks and score points.
             self.game.current_phase = Phase.TRICK_TAKING
             self.sound_manager.play_sound('phase_change')
             print("DEBUG: Transitioning to TRICK_TAKING phase after discard completion")
-            # Use a brief delay to ensure clean transition
-            self.root.after(100, self.update_display)
+            self.update_display()
             return
         
         self.update_display()
@@ -4516,23 +5371,15 @@ Now the real game begins! Use your cards to win tricks and score points.
             messagebox.showwarning("Invalid Selection", "Cannot discard 0-value cards!")
             return
         
-        # Toggle selection using object identity (id) to handle duplicate cards
-        if current_player_idx not in self.discards_made:
-            self.discards_made[current_player_idx] = []
-        
-        # Find if this specific card object is already selected
-        card_already_selected = False
-        for i, selected_card in enumerate(self.discards_made[current_player_idx]):
-            if selected_card is card:  # Use 'is' for object identity
-                self.discards_made[current_player_idx].pop(i)
-                card_already_selected = True
-                break
-        
-        if not card_already_selected:
-            if len(self.discards_made[current_player_idx]) < self.cards_to_discard:
-                self.discards_made[current_player_idx].append(card)
+        # Toggle selection keyed by object identity (id) to handle duplicate cards
+        selected = self.discards_made.setdefault(current_player_idx, {})
+        key = id(card)
+        if key in selected:
+            del selected[key]
+        elif len(selected) < self.cards_to_discard:
+            selected[key] = card
         
-        self.update_display()
+        self.request_update_display()
     
     def show_trick_taking(self):
         """Show trick taking phase"""
@@ -4546,13 +5393,15 @@ Now the real game begins! Use your cards to win tricks and score points.
         trump = self.game.game_params.get("trump")
         super_trump = self.game.game_params.get("super_trump")
         points = self.game.game_params.get("points")
+        trump_color = self.colors[trump] if trump is not None else "white"
+        super_trump_color = self.colors[super_trump] if super_trump is not None else "white"
         
-        tk.Label(params_frame, text=f"Trump: {trump.value if trump else 'None'}",
+        tk.Label(params_frame, text=f"Trump: {trump.label if trump is not None else 'None'}",
                 font=self.normal_font, bg=self.colors["bg"], 
-                fg=self.colors[trump] if trump else "white").pack(side=tk.LEFT, padx=10)
-        tk.Label(params_frame, text=f"Super Trump: {super_trump.value if super_trump else 'None'}",
+                fg=trump_color).pack(side=tk.LEFT, padx=10)
+        tk.Label(params_frame, text=f"Super Trump: {super_trump.label if super_trump is not None else 'None'}",
                 font=self.normal_font, bg=self.colors["bg"],
-                fg=self.colors[super_trump] if super_trump else "white").pack(side=tk.LEFT, padx=10)
+                fg=super_trump_color).pack(side=tk.LEFT, padx=10)
         tk.Label(params_frame, text=f"Points per Trick: {points}",
                 font=self.normal_font, bg=self.colors["bg"], fg="white").pack(side=tk.LEFT, padx=10)
         
@@ -4569,13 +5418,14 @@ Now the real game begins! Use your cards to win tricks and score points.
                 # Additional validation: ensure AI hasn't already played in current trick
                 already_played = any(p_idx == self.game.current_player_idx for p_idx, _ in self.game.current_trick)
                 if not already_played:
-                    print(f"DEBUG: SCHEDULING AI TURN (alt path) for Player {self.game.current_player_idx} ({current_player.name})")
-                    # Show thinking indicator immediately when AI turn is scheduled
-                    self.show_ai_thinking(self.game.current_player_idx, "playing")
-                    self.root.after(100, self.ai_play_card)
-                else:
+                    if _VERBOSE:
+                        print(f"DEBUG: SCHEDULING AI TURN (alt path) for Player {self.game.current_player_idx} ({current_player.name})")
+                    # Show thinking indicator once the scene has painted
+                    self._show_ai_thinking_later(self.game.current_player_idx, "playing")
+                    self._queue_ai_action(self.game.current_player_idx, self.ai_play_card)
+                elif _VERBOSE:
                     print(f"DEBUG: SKIPPING AI SCHEDULING (alt path) - Player {self.game.current_player_idx} already played in trick")
-            else:
+            elif _VERBOSE:
                 print(f"DEBUG: SKIPPING AI SCHEDULING (alt path) - conditions not met (phase={self.game.current_phase}, ai_in_progress={getattr(self, '_ai_turn_in_progress', False)}, waiting_for_confirmation={getattr(self, 'waiting_for_turn_confirmation', False)})")
         else:
             # Show whose turn it is
@@ -4584,17 +5434,18 @@ Now the real game begins! Use your cards to win tricks and score points.
     
     def show_player_cards_DISABLED(self):
         """Display players and their cards in simple layout"""
-        print(f"DEBUG: show_player_cards called, {len(self.game.players)} players")
+        if _VERBOSE:
+            print(f"DEBUG: show_player_cards called, {len(self.game.players)} players")
         
         # Restore player area if it was hidden during blocking phase
         if hasattr(self, 'player_area'):
             self.player_area.pack(fill=tk.X, padx=10, pady=5)
         
-        for i, p in enumerate(self.game.players):
-            print(f"DEBUG: Player {i}: {p.name}, {len(p.cards)} cards, human={p.is_human}")
-        
-        print(f"DEBUG: Player area exists: {hasattr(self, 'player_area')}")
-        print(f"DEBUG: Player area children before clear: {len(self.player_area.winfo_children())}")
+        if _VERBOSE:
+            for i, p in enumerate(self.game.players):
+                print(f"DEBUG: Player {i}: {p.name}, {len(p.cards)} cards, human={p.is_human}")
+            print(f"DEBUG: Player area exists: {hasattr(self, 'player_area')}")
+            print(f"DEBUG: Player area children before clear: {len(self.player_area.winfo_children())}")
         
         for widget in self.player_area.winfo_children():
             widget.destroy()
@@ -4606,7 +5457,8 @@ Now the real game begins! Use your cards to win tricks and score points.
         
         # Configure grid for table-like arrangement
         num_players = len(self.game.players)
-        print(f"DEBUG: Arranging {num_players} players")
+        if _VERBOSE:
+            print(f"DEBUG: Arranging {num_players} players")
         
         # Find human player to put at bottom
         human_idx = 0
@@ -4616,15 +5468,8 @@ Now the real game begins! Use your cards to win tricks and score points.
                 break
         
         # Define positions around table
-        if num_players == 2:
-            positions = [(1, 0, "BOTTOM"), (0, 0, "TOP")]
-        elif num_players == 3:
-            positions = [(2, 1, "BOTTOM"), (0, 0, "TOP_LEFT"), (0, 2, "TOP_RIGHT")]
-        elif num_players == 4:
-            positions = [(2, 1, "BOTTOM"), (1, 0, "LEFT"), (0, 1, "TOP"), (1, 2, "RIGHT")]
-        elif num_players == 5:
-            positions = [(2, 1, "BOTTOM"), (1, 0, "LEFT"), (0, 0, "TOP_LEFT"), (0, 2, "TOP_RIGHT"), (1, 2, "RIGHT")]
-        else:
+        positions = _SIMPLE_SEATS.get(num_players)
+        if positions is None:
             positions = [(0, i, "ROW") for i in range(num_players)]  # Fallback
         
         # Configure grid
@@ -4639,7 +5484,8 @@ Now the real game begins! Use your cards to win tricks and score points.
             player = self.game.players[player_idx]
             row, col, pos = positions[i]
             
-            print(f"DEBUG: Placing {player.name} at position {pos} (grid {row},{col})")
+            if _VERBOSE:
+                print(f"DEBUG: Placing {player.name} at position {pos} (grid {row},{col})")
             
             # Player frame
             player_frame = tk.Frame(players_container, bg=self.colors["bg"], relief=tk.RIDGE, bd=2)
@@ -4664,7 +5510,8 @@ Now the real game begins! Use your cards to win tricks and score points.
             
             # Show cards for human players
             if player.is_human and len(player.cards) > 0:
-                print(f"DEBUG: Showing cards for {player.name}: {len(player.cards)} cards")
+                if _VERBOSE:
+                    print(f"DEBUG: Showing cards for {player.name}: {len(player.cards)} cards")
                 
                 # Sort controls for human players
                 sort_frame = tk.Frame(player_frame, bg=self.colors["bg"])
@@ -4681,24 +5528,25 @@ Now the real game begins! Use your cards to win tricks and score points.
                 
                 # Show cards in rows
                 cards_per_row = 6
+                is_clickable = self.is_hand_clickable(i)
                 for j, card in enumerate(player.cards):
                     if j % cards_per_row == 0:
                         row_frame = tk.Frame(cards_frame, bg=self.colors["bg"])
                         row_frame.pack()
                     
                     try:
-                        is_clickable = self.is_card_clickable(i, card)
                         card_widget = self.create_card_widget(row_frame, card, clickable=is_clickable, small=True)
                         card_widget.pack(side=tk.LEFT, padx=1, pady=1)
                     except Exception as e:
                         print(f"DEBUG: Error creating card widget: {e}")
                         # Fallback: show simple text representation
-                        tk.Label(row_frame, text=f"{card.value}{card.suit.value[0]}",
+                        tk.Label(row_frame, text=f"{card.value}{card.suit.label[0]}",
                                 font=('Arial', 8), bg="white", fg="black", width=3).pack(side=tk.LEFT, padx=1)
             
             # Show card backs for AI players
             elif not player.is_human and len(player.cards) > 0:
-                print(f"DEBUG: Showing card backs for {player.name}: {len(player.cards)} cards")
+                if _VERBOSE:
+                    print(f"DEBUG: Showing card backs for {player.name}: {len(player.cards)} cards")
                 
                 # Show a few card backs
                 backs_frame = tk.Frame(player_frame, bg=self.colors["bg"])
@@ -4721,8 +5569,9 @@ Now the real game begins! Use your cards to win tricks and score points.
                 tk.Label(player_frame, text=f"Team {player.team}",
                         font=('Arial', 10), bg=self.colors["bg"], fg=team_color).pack()
         
-        print("DEBUG: Player display complete")
-        print(f"DEBUG: Player area children after setup: {len(self.player_area.winfo_children())}")
+        if _VERBOSE:
+            print("DEBUG: Player display complete")
+            print(f"DEBUG: Player area children after setup: {len(self.player_area.winfo_children())}")
         
         # Force update
         self.player_area.update_idletasks()
@@ -4740,14 +5589,7 @@ Now the real game begins! Use your cards to win tricks and score points.
         parent.grid_columnconfigure(2, weight=1)  # Right
         
         # Define seating positions
-        if num_players == 2:
-            positions = [(2, 1, "S"), (0, 1, "N")]  # Bottom, Top
-        elif num_players == 3:
-            positions = [(2, 1, "S"), (0, 0, "NW"), (0, 2, "NE")]  # Bottom, Top-Left, Top-Right
-        elif num_players == 4:
-            positions = [(2, 1, "S"), (1, 0, "W"), (0, 1, "N"), (1, 2, "E")]  # Bottom, Left, Top, Right
-        elif num_players == 5:
-            positions = [(2, 1, "S"), (1, 0, "W"), (0, 0, "NW"), (0, 2, "NE"), (1, 2, "E")]  # 5 positions
+        positions = _COMPASS_SEATS[num_players]
         
         # Place players starting with human at bottom
         for i in range(num_players):
@@ -4777,7 +5619,7 @@ Now the real game begins! Use your cards to win tricks and score points.
         
         # Name with current player highlight
         name_color = "#FFD700" if is_current else "white"
-        name_font = font.Font(family="Arial", size=14, weight="bold")
+        name_font = self._font(14, "bold")
         tk.Label(info_frame, text=player.name, font=name_font,
                 bg=self.colors["bg"], fg=name_color).pack()
         
@@ -4791,8 +5633,7 @@ Now the real game begins! Use your cards to win tricks and score points.
                     font=self.normal_font, bg=self.colors["bg"], fg=team_color).pack()
         
         # Monster card indicator
-        if (hasattr(self.game, 'monster_card_holder') and 
-            self.game.monster_card_holder == player_idx):
+        if self.game.monster_card_holder == player_idx:
             tk.Label(status_frame, text="🐉 MONSTER", 
                     font=self.normal_font, bg=self.colors["bg"], fg="gold").pack()
         
@@ -4807,22 +5648,21 @@ Now the real game begins! Use your cards to win tricks and score points.
     
     def create_table_center_DISABLED(self, parent):
         """Create the central table area"""
-        center_frame = tk.Frame(parent, bg="#8B4513", relief=tk.RAISED, bd=5)  # Wood table color
-        center_frame.grid(row=1, column=1, padx=20, pady=20, sticky="nsew")
-        
-        # Table surface with subtle pattern
-        table_surface = tk.Frame(center_frame, bg="#A0522D", relief=tk.SUNKEN, bd=2)
-        table_surface.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
-        
-        # Game logo/title in center
-        tk.Label(table_surface, text="NJET", 
-                font=font.Font(family="Arial", size=32, weight="bold"),
-                bg="#A0522D", fg="#2C3E50").pack(expand=True)
-        
-        # Subtitle
-        tk.Label(table_surface, text="Card Game by Stefan Dorra",
-                font=font.Font(family="Arial", size=12, style="italic"),
-                bg="#A0522D", fg="#34495E").pack()
+        # One canvas: the wood-colored border is its highlight ring, title and subtitle are text items
+        table_surface = tk.Canvas(parent, bg="#A0522D", highlightthickness=5,
+                                  highlightbackground="#8B4513")  # Wood table color
+        table_surface.grid(row=1, column=1, padx=20, pady=20, sticky="nsew")
+        
+        # Game logo/title and subtitle, kept centered whenever the grid resizes the table
+        table_surface.create_text(0, 0, text="NJET", font=self._font(32, "bold"),
+                                  fill="#2C3E50", tags="title")
+        table_surface.create_text(0, 0, text="Card Game by Stefan Dorra",
+                                  font=self._font(12, slant="italic"), fill="#34495E", tags="subtitle")
+        
+        def center_text(event):
+            table_surface.coords("title", event.width // 2, event.height // 2 - 10)
+            table_surface.coords("subtitle", event.width // 2, event.height // 2 + 25)
+        table_surface.bind("<Configure>", center_text)
     
     def create_human_card_area_DISABLED(self, parent, player, player_idx, orientation):
         """Create card area for human players with full visibility"""
@@ -4832,14 +5672,14 @@ Now the real game begins! Use your cards to win tricks and score points.
             sort_frame.pack(pady=2)
             
             tk.Label(sort_frame, text="Sort by:", 
-                    font=font.Font(family="Arial", size=10),
+                    font=self._font(10),
                     bg=self.colors["bg"], fg="white").pack(side=tk.LEFT, padx=2)
             
             sort_suit_btn = tk.Button(sort_frame, text="Suit→Rank", 
-                                     font=font.Font(family="Arial", size=9),
+                                     font=self._font(9),
                                      command=lambda: self.change_sort(player_idx, True))
             sort_rank_btn = tk.Button(sort_frame, text="Rank→Suit", 
-                                     font=font.Font(family="Arial", size=9),
+                                     font=self._font(9),
                                      command=lambda: self.change_sort(player_idx, False))
             
             # Style sort buttons
@@ -4858,6 +5698,7 @@ Now the real game begins! Use your cards to win tricks and score points.
         cards_frame.pack(fill=tk.BOTH, expand=True)
         
         # Arrange cards based on position
+        is_clickable = self.is_hand_clickable(player_idx)
         if orientation in ["W", "E"]:  # Side players - vertical arrangement
             max_cards_shown = 8
             cards_per_column = 4
@@ -4866,7 +5707,6 @@ Now the real game begins! Use your cards to win tricks and score points.
                     col_frame = tk.Frame(cards_frame, bg=self.colors["bg"])
                     col_frame.pack(side=tk.LEFT, padx=1)
                 
-                is_clickable = self.is_card_clickable(player_idx, card)
                 card_widget = self.create_card_widget(col_frame, card, 
                                                      clickable=is_clickable, small=True)
                 card_widget.pack(pady=1)
@@ -4878,7 +5718,6 @@ Now the real game begins! Use your cards to win tricks and score points.
                     row_frame = tk.Frame(cards_frame, bg=self.colors["bg"])
                     row_frame.pack()
                 
-                is_clickable = self.is_card_clickable(player_idx, card)
                 card_size = False if orientation == "S" else True  # Full size for bottom player
                 card_widget = self.create_card_widget(row_frame, card, 
                                                      clickable=is_clickable, small=card_size)
@@ -4887,7 +5726,7 @@ Now the real game begins! Use your cards to win tricks and score points.
         # Show card count if not all cards visible
         if len(player.cards) > max_cards_shown:
             tk.Label(cards_frame, text=f"({len(player.cards)} total)",
-                    font=font.Font(family="Arial", size=9),
+                    font=self._font(9),
                     bg=self.colors["bg"], fg="#BDC3C7").pack()
     
     def create_ai_card_area_DISABLED(self, parent, player, orientation):
@@ -4920,22 +5759,15 @@ Now the real game begins! Use your cards to win tricks and score points.
         # Card count
         count_color = "#E74C3C" if num_cards <= 3 else "#F39C12" if num_cards <= 6 else "white"
         tk.Label(cards_frame, text=f"{num_cards} cards",
-                font=font.Font(family="Arial", size=10, weight="bold"),
+                font=self._font(10, "bold"),
                 bg=self.colors["bg"], fg=count_color).pack(pady=2)
     
     def arrange_players_around_table(self, parent):
         """Arrange all players around the table with human players showing cards, others showing card backs"""
         num_players = len(self.game.players)
         
-        # Create positions around the table
-        if num_players == 2:
-            positions = ["bottom", "top"]
-        elif num_players == 3:
-            positions = ["bottom", "top_left", "top_right"]
-        elif num_players == 4:
-            positions = ["bottom", "left", "top", "right"]
-        elif num_players == 5:
-            positions = ["bottom", "left", "top_left", "top_right", "right"]
+        # Positions around the table
+        positions = _SEAT_NAMES[num_players]
         
         for i, player in enumerate(self.game.players):
             position = positions[i]
@@ -4983,8 +5815,7 @@ Now the real game begins! Use your cards to win tricks and score points.
                     font=self.normal_font, bg=self.colors["bg"], fg=team_color).pack()
         
         # Monster card indicator
-        if (hasattr(self.game, 'monster_card_holder') and 
-            self.game.monster_card_holder == player_idx):
+        if self.game.monster_card_holder == player_idx:
             tk.Label(info_frame, text="🐉 MONSTER",
                     font=self.normal_font, bg=self.colors["bg"], fg="gold").pack()
         
@@ -5032,6 +5863,7 @@ Now the real game begins! Use your cards to win tricks and score points.
         cards_display_frame.pack()
         
         # Arrange cards based on position
+        is_clickable = self.is_hand_clickable(player_idx)
         if position in ["left", "right"]:
             # Vertical arrangement for side players
             for i, card in enumerate(player.cards[:8]):  # Limit visible cards
@@ -5039,7 +5871,6 @@ Now the real game begins! Use your cards to win tricks and score points.
                     row_frame = tk.Frame(cards_display_frame, bg=self.colors["bg"])
                     row_frame.pack()
                 
-                is_clickable = self.is_card_clickable(player_idx, card)
                 card_widget = self.create_card_widget(row_frame, card, clickable=is_clickable, small=True)
                 card_widget.pack(side=tk.TOP, pady=1)
         else:
@@ -5050,7 +5881,6 @@ Now the real game begins! Use your cards to win tricks and score points.
                     row_frame = tk.Frame(cards_display_frame, bg=self.colors["bg"])
                     row_frame.pack()
                 
-                is_clickable = self.is_card_clickable(player_idx, card)
                 card_widget = self.create_card_widget(row_frame, card, clickable=is_clickable)
                 card_widget.pack(side=tk.LEFT, padx=2, pady=2)
     
@@ -5062,23 +5892,21 @@ Now the real game begins! Use your cards to win tricks and score points.
         # Show limited number of card backs
         display_cards = min(num_cards, 8) if position in ["left", "right"] else min(num_cards, 12)
         
+        # All backs go into one gridded frame instead of a frame per row
+        backs_grid = tk.Frame(cards_frame, bg=self.colors["bg"])
+        backs_grid.pack()
+        
         if position in ["left", "right"]:
             # Vertical arrangement
             for i in range(display_cards):
-                if i % 4 == 0:
-                    row_frame = tk.Frame(cards_frame, bg=self.colors["bg"])
-                    row_frame.pack()
-                card_back = self.create_card_back(row_frame, small=True)
-                card_back.pack(side=tk.TOP, pady=1)
+                card_back = self.create_card_back(backs_grid, small=True)
+                card_back.grid(row=i, column=0, pady=1)
         else:
             # Horizontal arrangement
             cards_per_row = 6
             for i in range(display_cards):
-                if i % cards_per_row == 0:
-                    row_frame = tk.Frame(cards_frame, bg=self.colors["bg"])
-                    row_frame.pack()
-                card_back = self.create_card_back(row_frame)
-                card_back.pack(side=tk.LEFT, padx=1)
+                card_back = self.create_card_back(backs_grid)
+                card_back.grid(row=i // cards_per_row, column=i % cards_per_row, padx=1)
         
         # Show card count
         if num_cards > 0:
@@ -5086,49 +5914,38 @@ Now the real game begins! Use your cards to win tricks and score points.
                     font=self.normal_font, bg=self.colors["bg"], fg="white").pack(pady=2)
     
     def create_card_back(self, parent, small=False):
-        """Create an attractive card back widget with artwork"""
-        size = (40, 60) if small else (60, 80)
-        
-        # Main card frame with gradient-like effect
-        card_frame = tk.Frame(parent, bg="#1A237E", relief=tk.RAISED, bd=2,
-                             width=size[0], height=size[1])
-        card_frame.pack_propagate(False)
+        """Create an attractive card back widget with artwork - drawn on one canvas instead of a tree of frames and labels"""
+        width, height = (40, 60) if small else (60, 80)
         
-        # Inner decorative frame
-        inner_frame = tk.Frame(card_frame, bg="#283593", relief=tk.SUNKEN, bd=1)
-        inner_frame.pack(expand=True, fill=tk.BOTH, padx=2, pady=2)
+        # Main card with gradient-like effect: the raised border is the canvas's own
+        card_back = tk.Canvas(parent, bg="#1A237E", relief=tk.RAISED, bd=2, highlightthickness=0,
+                              width=width, height=height)
         
-        # Central design area
-        design_frame = tk.Frame(inner_frame, bg="#3949AB")
-        design_frame.pack(expand=True, fill=tk.BOTH, padx=2, pady=2)
+        # Inner decorative panel and central design area
+        card_back.create_rectangle(4, 4, width, height, fill="#283593", outline="#0D1440")
+        card_back.create_rectangle(7, 7, width - 3, height - 3, fill="#3949AB", outline="")
         
-        # Top decoration
+        # Star, NJET, suit pattern, star - stacked down the design area
+        center_x = (width + 4) // 2
         top_font_size = 12 if small else 16
-        tk.Label(design_frame, text="★", 
-                font=font.Font(family="Arial", size=top_font_size, weight="bold"),
-                bg="#3949AB", fg="#FFD700").pack(pady=(2, 0))
-        
-        # Main NJET text
         main_font_size = 8 if small else 12
-        tk.Label(design_frame, text="NJET",
-                font=font.Font(family="Arial", size=main_font_size, weight="bold"),
-                bg="#3949AB", fg="white").pack()
-        
-        # Decorative pattern
         pattern_font_size = 6 if small else 8
-        tk.Label(design_frame, text="♦ ♣ ♥ ♠",
-                font=font.Font(family="Arial", size=pattern_font_size),
-                bg="#3949AB", fg="#E1BEE7").pack()
+        for text, size, weight, color, y in (
+                ("★", top_font_size, 'bold', "#FFD700", 0.22),
+                ("NJET", main_font_size, 'bold', "white", 0.45),
+                ("♦ ♣ ♥ ♠", pattern_font_size, 'normal', "#E1BEE7", 0.62),
+                ("★", top_font_size, 'bold', "#FFD700", 0.82)):
+            card_back.create_text(center_x, round(2 + y * height), text=text,
+                                  font=self._font(size, weight), fill=color)
         
-        # Bottom decoration
-        tk.Label(design_frame, text="★",
-                font=font.Font(family="Arial", size=top_font_size, weight="bold"),
-                bg="#3949AB", fg="#FFD700").pack(pady=(0, 2))
-        
-        return card_frame
+        return card_back
     
     def is_card_clickable(self, player_idx, card):
         """Determine if a card should be clickable"""
+        return self.is_hand_clickable(player_idx)
+    
+    def is_hand_clickable(self, player_idx):
+        """Determine if this player's cards should be clickable (same answer for every card)"""
         is_current = self.game.current_player_idx == player_idx
         
         return ((is_current and self.game.current_phase == Phase.TRICK_TAKING) or
@@ -5155,31 +5972,25 @@ Now the real game begins! Use your cards to win tricks and score points.
         if (hasattr(self, 'selecting_discards') and self.selecting_discards and 
             hasattr(self, 'current_discard_player') and 
             self.current_discard_player in self.discards_made):
-            # Use object identity to check if this specific card is selected
-            for selected_card in self.discards_made[self.current_discard_player]:
-                if selected_card is card:
-                    is_selected = True
-                    break
+            # Selections are keyed by id(card), so this specific card object is looked up directly
+            is_selected = id(card) in self.discards_made[self.current_discard_player]
             if is_selected:
                 card_frame.configure(bg="#E74C3C")  # Red background for selected
         
-        # Card value
+        # Card value - face text, symbol and fonts all come from shared tables
         bg_color = "#E74C3C" if is_selected else self.colors["card_bg"]
-        value_label = tk.Label(card_frame, text=str(card.value),
+        suit_color = self.colors[card.suit]
+        value_label = tk.Label(card_frame, text=_VAL_STR[card.value],
                               font=self.card_font, 
                               bg=bg_color,
-                              fg=self.colors[card.suit])
+                              fg=suit_color)
         value_label.pack(pady=(10, 5))
         
         # Suit symbol
-        suit_symbols = {
-            Suit.RED: "♦", Suit.BLUE: "♠",
-            Suit.YELLOW: "♣", Suit.GREEN: "♥"
-        }
-        symbol_label = tk.Label(card_frame, text=suit_symbols[card.suit],
-                               font=font.Font(family="Arial", size=20),
+        symbol_label = tk.Label(card_frame, text=_SUIT_SYMBOLS[card.suit],
+                               font=self._font(20),
                                bg=bg_color,
-                               fg=self.colors[card.suit])
+                               fg=suit_color)
         symbol_label.pack(pady=(0, 10))
         
         # Make card size consistent
@@ -5233,12 +6044,12 @@ Now the real game begins! Use your cards to win tricks and score points.
         title_frame.pack(fill=tk.X, padx=10, pady=5)
         
         tk.Label(title_frame, text="Current Trick",
-                font=font.Font(family="Arial", size=16, weight="bold"),
+                font=self._font(16, "bold"),
                 bg="#34495E", fg="#ECF0F1").pack()
         
         if not self.game.current_trick:
             tk.Label(trick_display, text="Waiting for first card...",
-                    font=font.Font(family="Arial", size=12, style="italic"),
+                    font=self._font(12, slant="italic"),
                     bg="#34495E", fg="#BDC3C7").pack(pady=15)
             return
         
@@ -5264,14 +6075,14 @@ Now the real game begins! Use your cards to win tricks and score points.
             name_weight = "bold" if is_leader else "normal"
             
             tk.Label(card_container, text=player.name,
-                    font=font.Font(family="Arial", size=11, weight=name_weight),
+                    font=self._font(11, name_weight),
                     bg="#2C3E50", fg=name_color).pack()
             
             # Team indicator with color coding
             if player.team:
                 team_color = self.colors.get(f"team{player.team}", "white")
                 tk.Label(card_container, text=f"Team {player.team}",
-                        font=font.Font(family="Arial", size=9),
+                        font=self._font(9),
                         bg="#2C3E50", fg=team_color).pack()
             
             # The card with shadow effect
@@ -5285,7 +6096,7 @@ Now the real game begins! Use your cards to win tricks and score points.
             order_text = ["1st", "2nd", "3rd", "4th", "5th"][i]
             order_color = "#E67E22" if is_leader else "#95A5A6"
             tk.Label(card_container, text=order_text,
-                    font=font.Font(family="Arial", size=9, style="italic"),
+                    font=self._font(9, slant="italic"),
                     bg="#2C3E50", fg=order_color).pack()
     
     def play_card(self, card):
@@ -5314,7 +6125,7 @@ Now the real game begins! Use your cards to win tricks and score points.
                 if lead_effective_suit == "trump":
                     messagebox.showwarning("Invalid Play", "You must follow trump suit if possible!")
                 else:
-                    messagebox.showwarning("Invalid Play", f"You must follow suit ({lead_effective_suit.value}) if possible!")
+                    messagebox.showwarning("Invalid Play", f"You must follow suit ({lead_effective_suit.label}) if possible!")
                 return
             
             # Rule 2: If player cannot follow suit, they must play trump/supertrump if they have any
@@ -5360,52 +6171,59 @@ Now the real game begins! Use your cards to win tricks and score points.
             strategy['card_memory'].add((card.suit, card.value))
         
         # Determine valid cards based on enhanced suit-following rules
-        valid_cards = []
-        if self.game.current_trick:
-            # Must follow effective suit if possible
-            lead_card = self.game.current_trick[0][1]
-            lead_effective_suit = self.game.get_card_effective_suit(lead_card)
-            
-            # Get all cards that match the lead effective suit
-            matching_cards = self.game.get_cards_by_effective_suit(player.cards, lead_effective_suit)
-            
-            if matching_cards:
-                # Rule 1: Must follow suit if possible
-                valid_cards = matching_cards
-            else:
-                # Rule 2: Cannot follow suit - must play trump/supertrump if available
-                trump_cards = self.game.get_cards_by_effective_suit(player.cards, "trump")
-                if trump_cards:
-                    valid_cards = trump_cards
-                else:
-                    # Rule 3: No trump cards - any card is valid
-                    valid_cards = player.cards.copy()
-        else:
-            valid_cards = player.cards.copy()
+        valid_cards = self.game.valid_plays(player_idx)
         
         if not valid_cards:
             self.hide_ai_thinking()
             return  # No cards to play
         
+        # Score the candidates off the Tk thread so the thinking indicator keeps animating;
+        # the worker reads a snapshot, and the chosen card comes back through _ai_moves
+        # and is played by _poll_ai_move
+        game = self.game
+        snapshot = game.ai_snapshot()
+        def choose():
+            try:
+                card = self._choose_ai_card(snapshot, player_idx, valid_cards)
+            except Exception as e:
+                print(f"ERROR: AI card choice failed for player {player_idx}: {e}")
+                card = valid_cards[0]
+            self._ai_moves.put((game, player_idx, card))
+        
+        worker = threading.Thread(target=choose)
+        worker.daemon = True
+        worker.start()
+        self.root.after(_AI_MOVE_POLL_MS, self._poll_ai_move)
+    
+    def _choose_ai_card(self, game, player_idx, valid_cards):
+        """Pick the AI's card from valid_cards - pure game logic; on a worker thread, pass a
+        game.ai_snapshot() since scoring draws random numbers and fills the game's caches"""
+        player = game.players[player_idx]
+        strategy = game.ai_strategies[player_idx]
+        
         # Advanced AI card selection with deep strategy
-        trump = self.game.game_params.get("trump")
-        super_trump = self.game.game_params.get("super_trump")
-        remaining_cards = self.game.get_remaining_cards(player_idx)
+        trump = game.game_params.get("trump")
+        super_trump = game.game_params.get("super_trump")
+        strength_table = game.card_strength_table(player_idx)
         
         # Advanced strategic analysis
-        try_to_win = self.game.should_take_trick(player_idx, self.game.current_trick)
+        try_to_win = game.should_take_trick(player_idx, game.current_trick)
         
         # Analyze game state
         tricks_remaining = len(player.cards)
-        team_status = self.game.get_team_status(player_idx)
+        team_status = game.get_team_status(player_idx)
+        
+        # Random playouts of the rest of the round for each candidate
+        rollout_values = game.rollout_card_values(player_idx, valid_cards)
         
         # Score each valid card with sophisticated evaluation
         card_scores = []
-        for card in valid_cards:
-            score = 0.0
+        for card, rollout_value in zip(valid_cards, rollout_values):
+            # Expected item swing (tricks + 0s) over the rest of the round
+            score = rollout_value * 4.0
             
             # Predict trick outcome
-            winner, confidence = self.game.predict_trick_winner(self.game.current_trick, card, player_idx)
+            winner, confidence = game.predict_trick_winner(game.current_trick, card, player_idx)
             would_win = (winner == player_idx)
             
             # Advanced intention matching with confidence weighting
@@ -5433,7 +6251,7 @@ Now the real game begins! Use your cards to win tricks and score points.
                     score -= 20.0
             
             # Advanced card strength evaluation
-            card_strength = self.game.evaluate_card_strength(card, trump, super_trump, remaining_cards)
+            card_strength = strength_table[card.code]
             
             # Context-aware strength usage
             if try_to_win:
@@ -5449,7 +6267,7 @@ Now the real game begins! Use your cards to win tricks and score points.
                     score -= 15.0
             
             # Super trump 0s: extremely sophisticated handling
-            if super_trump and card.suit == super_trump and card.value == 0:
+            if super_trump is not None and card.suit == super_trump and card.value == 0:
                 if try_to_win:
                     if tricks_remaining <= 3:  # Endgame
                         score += 80.0  # Use in endgame
@@ -5463,7 +6281,7 @@ Now the real game begins! Use your cards to win tricks and score points.
                     score -= 300.0  # Never waste super trump
             
             # Regular trumps: advanced trump management
-            elif trump and card.suit == trump:
+            elif trump is not None and card.suit == trump:
                 trump_cards_left = len([c for c in player.cards if c.suit == trump])
                 
                 if try_to_win:
@@ -5481,14 +6299,14 @@ Now the real game begins! Use your cards to win tricks and score points.
                 if try_to_win:
                     score -= 15.0  # Usually can't win
                     # But sometimes 0s can win against other 0s
-                    trick_has_zeros = any(c.value == 0 for _, c in self.game.current_trick)
+                    trick_has_zeros = any(c.value == 0 for _, c in game.current_trick)
                     if trick_has_zeros:
                         score += 10.0
                 else:
                     score += 8.0   # Safe discard
                     # Bonus if trick already has opponent 0s to capture
-                    opponent_zeros = sum(1 for p_idx, c in self.game.current_trick 
-                                       if c.value == 0 and not self.game.are_teammates(player_idx, p_idx))
+                    opponent_zeros = sum(1 for p_idx, c in game.current_trick 
+                                       if c.value == 0 and not game.are_teammates(player_idx, p_idx))
                     score += opponent_zeros * 5.0
             
             # High-value cards: preserve for key moments
@@ -5496,8 +6314,8 @@ Now the real game begins! Use your cards to win tricks and score points.
                 if try_to_win:
                     score += 15.0
                     # Bonus for using high cards to capture opponent 0s
-                    opponent_zeros = sum(1 for p_idx, c in self.game.current_trick 
-                                       if c.value == 0 and not self.game.are_teammates(player_idx, p_idx))
+                    opponent_zeros = sum(1 for p_idx, c in game.current_trick 
+                                       if c.value == 0 and not game.are_teammates(player_idx, p_idx))
                     score += opponent_zeros * 12.0
                 else:
                     score -= 25.0  # Don't waste high cards
@@ -5509,15 +6327,15 @@ Now the real game begins! Use your cards to win tricks and score points.
                     score += 20.0
             
             # Team coordination bonuses
-            if team_status['team'] and self.game.current_trick:
-                current_winner = self.game.predict_current_trick_winner(self.game.current_trick)
-                if self.game.are_teammates(player_idx, current_winner):
+            if team_status['team'] and game.current_trick:
+                current_winner = game.predict_current_trick_winner(game.current_trick)
+                if game.are_teammates(player_idx, current_winner):
                     # Teammate winning - avoid overbidding unless essential
                     if try_to_win and confidence > 0.8:
                         score -= 30.0  # Don't compete with teammate
             
             # Strategic randomness based on personality
-            personality_variance = strategy['risk_tolerance'] * random.uniform(-8.0, 8.0)
+            personality_variance = strategy['risk_tolerance'] * game._uniform(-8.0, 8.0)
             score += personality_variance
             
             card_scores.append((score, card))
@@ -5534,10 +6352,10 @@ Now the real game begins! Use your cards to win tricks and score points.
             if team_status['losing'] or tricks_remaining <= 2:
                 best_card = card_scores[0][1]
             # Otherwise, add controlled randomness
-            elif random.random() < (0.3 + strategy['risk_tolerance'] * 0.4):
+            elif game._uniform() < (0.3 + strategy['risk_tolerance'] * 0.4):
                 # Weight selection toward better cards
                 weights = [0.6, 0.3, 0.1]
-                best_card = random.choices([card for _, card in top_three], weights=weights)[0]
+                best_card = _rand_choices([card for _, card in top_three], weights=weights)[0]
             else:
                 best_card = card_scores[0][1]
         else:
@@ -5545,6 +6363,26 @@ Now the real game begins! Use your cards to win tricks and score points.
         
         print(f"DEBUG: AI Player {player_idx} playing {best_card} (try_win={try_to_win}, score={card_scores[0][0]:.1f})")
         
+        return best_card
+    
+    def _poll_ai_move(self):
+        """Play the card chosen by the AI worker thread once it is ready"""
+        try:
+            game, player_idx, card = self._ai_moves.get_nowait()
+        except queue.Empty:
+            self.root.after(_AI_MOVE_POLL_MS, self._poll_ai_move)
+            return
+        self._apply_ai_move(game, player_idx, card)
+    
+    def _apply_ai_move(self, game, player_idx, card):
+        """Play an AI card on the Tk thread, unless the game moved on while it was being chosen"""
+        if (game is not self.game or game.current_phase != Phase.TRICK_TAKING or
+                game.current_player_idx != player_idx or
+                any(p_idx == player_idx for p_idx, _ in game.current_trick)):
+            print(f"DEBUG: AI move for player {player_idx} dropped - game state changed")
+            self._ai_turn_in_progress = False
+            return
+        
         # Hide AI thinking indicator
         self.hide_ai_thinking()
         
@@ -5552,7 +6390,7 @@ Now the real game begins! Use your cards to win tricks and score points.
         self.sound_manager.play_sound('card_play')
         
         # Animate card movement to trick center
-        self.animate_card_to_trick(player_idx, best_card)
+        self.animate_card_to_trick(player_idx, card)
         
         # Clear turn protection flag after initiating play
         self._ai_turn_in_progress = False
@@ -5566,7 +6404,7 @@ Now the real game begins! Use your cards to win tricks and score points.
         if self.is_online_game:
             self.send_network_action("card_play", {
                 "player_idx": player_idx,
-                "card": {"suit": card.suit.value, "value": card.value}
+                "card": {"suit": card.suit.label, "value": card.value}
             })
         
         # Find the trick center position (we'll need to store this during layout)
@@ -5601,13 +6439,13 @@ Now the real game begins! Use your cards to win tricks and score points.
         animated_card.pack_propagate(False)
         
         # Add card content
-        value_label = tk.Label(animated_card, text=str(card.value),
+        value_label = tk.Label(animated_card, text=_VAL_STR[card.value],
                               font=('Arial', 12, 'bold'), 
                               bg=self.colors["card_bg"],
                               fg=self.colors[card.suit])
         value_label.pack(expand=True)
         
-        symbol_label = tk.Label(animated_card, text=card.suit.value[:3],
+        symbol_label = tk.Label(animated_card, text=card.suit.label[:3],
                                font=('Arial', 8), 
                                bg=self.colors["card_bg"],
                                fg=self.colors[card.suit])
@@ -5699,7 +6537,7 @@ Now the real game begins! Use your cards to win tricks and score points.
             return
         
         # Calculate current team scores based on tricks won and captured 0s
-        points_per_trick = int(self.game.game_params.get("points", 1))
+        points_per_trick = self.game._points_per_trick
         
         # Reset team scores for real-time calculation
         self.game.team_scores = {1: 0, 2: 0}
@@ -5717,8 +6555,7 @@ Now the real game begins! Use your cards to win tricks and score points.
             points = team_items[team_num] * points_per_trick
             
             # Handle monster card doubling (doubles the entire team's points)
-            if (hasattr(self.game, 'monster_card_holder') and 
-                self.game.monster_card_holder is not None):
+            if self.game.monster_card_holder is not None:
                 monster_player = self.game.players[self.game.monster_card_holder]
                 if monster_player.team == team_num:
                     points *= 2
@@ -5755,7 +6592,7 @@ Now the real game begins! Use your cards to win tricks and score points.
     def process_trick_completion(self):
         """Process trick completion after delay - determine winner and advance game"""
         print(f"DEBUG: === TRICK COMPLETION PROCESSING ===")
-        print(f"DEBUG: Current trick: {[(p_idx, f'{card.value} of {card.suit.value}') for p_idx, card in self.game.current_trick]}")
+        print(f"DEBUG: Current trick: {[(p_idx, f'{card.value} of {card.suit.label}') for p_idx, card in self.game.current_trick]}")
         
         # Determine trick winner
         winner_idx = self.game.determine_trick_winner()
@@ -5804,7 +6641,7 @@ Now the real game begins! Use your cards to win tricks and score points.
             # Reset turn confirmation for local multiplayer
             self.turn_confirmed = False
             self.waiting_for_turn_confirmation = False
-            self.root.after(400, self.update_display)
+            self.root.after(400, self.request_update_display)
     
     def next_trick_turn(self):
         """Move to next player in trick"""
@@ -5814,12 +6651,12 @@ Now the real game begins! Use your cards to win tricks and score points.
         if len(self.game.current_trick) == self.game.num_players:
             # Trick complete - add 1.5 second delay to show all cards
             print("DEBUG: Trick complete, showing all cards for 1.5 seconds...")
-            self.update_display()  # Refresh display to show all 4 cards clearly
+            self.request_update_display()  # Refresh display to show all 4 cards clearly
             
             # Send trick completion message for online games
             if self.is_online_game:
                 self.send_network_action("trick_complete", {
-                    "trick": [{"player_idx": p_idx, "card": {"suit": card.suit.value, "value": card.value}} 
+                    "trick": [{"player_idx": p_idx, "card": {"suit": card.suit.label, "value": card.value}} 
                              for p_idx, card in self.game.current_trick]
                 })
             
@@ -5833,7 +6670,7 @@ Now the real game begins! Use your cards to win tricks and score points.
             # Reset turn confirmation for local multiplayer
             self.turn_confirmed = False
             self.waiting_for_turn_confirmation = False
-            self.update_display()
+            self.request_update_display()
     
     def show_trick_winner(self, winner_idx):
         """Display trick winner"""
@@ -5849,7 +6686,7 @@ Now the real game begins! Use your cards to win tricks and score points.
     def end_round(self):
         """End the current round"""
         # Calculate scores
-        points_per_trick = int(self.game.game_params["points"])
+        points_per_trick = self.game._points_per_trick
         
         # Count team tricks and captured 0s
         team_tricks = {1: 0, 2: 0}
@@ -5866,8 +6703,7 @@ Now the real game begins! Use your cards to win tricks and score points.
             points = total_items * points_per_trick
             
             # Handle monster card for uneven teams
-            if (hasattr(self.game, 'monster_card_holder') and 
-                self.game.monster_card_holder is not None):
+            if self.game.monster_card_holder is not None:
                 monster_player = self.game.players[self.game.monster_card_holder]
                 if monster_player.team == team_num:
                     # Double points for the monster player's team
@@ -5881,7 +6717,7 @@ Now the real game begins! Use your cards to win tricks and score points.
                 player.total_score += points
         
         self.game.current_phase = Phase.ROUND_END
-        self.update_display()
+        self.request_update_display()
     
     def show_round_end(self):
         """Show round end summary"""
@@ -5905,8 +6741,7 @@ Now the real game begins! Use your cards to win tricks and score points.
                     font=self.normal_font, bg=self.colors["bg"], fg="white").pack()
         
         # Show monster card holder if applicable
-        if (hasattr(self.game, 'monster_card_holder') and 
-            self.game.monster_card_holder is not None):
+        if self.game.monster_card_holder is not None:
             monster_player = self.game.players[self.game.monster_card_holder]
             tk.Label(frame, text=f"Monster Card: {monster_player.name} (Team {monster_player.team})",
                     font=self.normal_font, bg=self.colors["bg"], fg="gold").pack(pady=5)
@@ -5981,10 +6816,12 @@ Now the real game begins! Use your cards to win tricks and score points.
             player.captured_zeros = 0
             player.team = None  # Clear team assignments so they get re-selected each round
         
-        # Deal new cards
+        # Deal new cards - cached card widgets belong to the old hands
         self.game.deal_cards()
+        for player_idx in range(self.game.num_players):
+            self._evict_hand_card_widgets(player_idx, ())
         
-        self.update_display()
+        self.request_update_display()
     
     def get_suit_color(self, suit):
         """Get the color for a suit"""
@@ -6055,17 +6892,17 @@ Now the real game begins! Use your cards to win tricks and score points.
                     'team': player.team,
                     'tricks_won': player.tricks_won,
                     'captured_zeros': player.captured_zeros,
-                    'cards': [(card.suit.value, card.value) for card in player.cards]
+                    'cards': [(card.suit.label, card.value) for card in player.cards]
                 }
                 save_data['players'].append(player_data)
             
             # Save blocking board (convert Suit enums to strings)
             for key, value in self.game.blocking_board.items():
-                if isinstance(value, list):
+                if isinstance(value, (list, tuple)):
                     save_data['blocking_board'][key] = []
                     for item in value:
-                        if hasattr(item, 'value'):  # Suit enum
-                            save_data['blocking_board'][key].append(item.value)
+                        if isinstance(item, Suit):
+                            save_data['blocking_board'][key].append(item.label)
                         else:
                             save_data['blocking_board'][key].append(item)
                 else:
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+import sys
+sys.path.append('.')
+
+# Import the game classes
+import importlib.util
+spec = importlib.util.spec_from_file_location("njet_game", "njet-game-2.py")
+njet_game = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(njet_game)
+NjetGame = njet_game.NjetGame
+Suit = njet_game.Suit
+Card = njet_game.Card
+
+def make_trick_game(num_players=4):
+    """Dealt game with parameters finalized and alternating teams"""
+    game = NjetGame(num_players)
+    game.deal_cards()
+    game.finalize_parameters()
+    for i, player in enumerate(game.players):
+        player.team = 1 if i % 2 == 0 else 2
+    return game
+
+def test_legal_plays_follow_suit():
+    """Must follow the led suit, else trump, else anything"""
+    red, blue = njet_game.SUIT_INDEX[Suit.RED], njet_game.SUIT_INDEX[Suit.BLUE]
+    no_suit = njet_game.NO_SUIT
+    hand = [Card(Suit.RED, 5).code, Card(Suit.BLUE, 3).code, Card(Suit.GREEN, 9).code]
+    lead_red = Card(Suit.RED, 1).code
+    lead_yellow = Card(Suit.YELLOW, 1).code
+    
+    assert njet_game.legal_plays(hand, lead_red, blue, no_suit) == [hand[0]]
+    assert njet_game.legal_plays(hand, lead_yellow, blue, no_suit) == [hand[1]]
+    assert njet_game.legal_plays(hand, lead_yellow, no_suit, no_suit) == hand
+    assert njet_game.legal_plays(hand, None, red, blue) == hand
+
+def test_valid_plays_match_effective_suits():
+    """valid_plays agrees with the effective-suit rules for every possible lead"""
+    game = make_trick_game()
+    game.game_params["trump"] = Suit.RED
+    game.game_params["super_trump"] = Suit.BLUE
+    player = game.players[1]
+    player.cards = [Card(Suit.RED, 4), Card(Suit.BLUE, 0), Card(Suit.BLUE, 6), Card(Suit.GREEN, 2)]
+    
+    def expected():
+        lead = game.get_card_effective_suit(game.current_trick[0][1])
+        matching = game.get_cards_by_effective_suit(player.cards, lead)
+        return matching or game.get_cards_by_effective_suit(player.cards, "trump") or player.cards
+    
+    assert game.valid_plays(1) == player.cards
+    for suit in Suit:
+        for value in (0, 5):
+            game.current_trick = [(0, Card(suit, value))]
+            assert sorted(game.valid_plays(1)) == sorted(expected()), (suit, value)
+
+def test_playout_accounts_for_every_trick():
+    """A random playout awards every trick of the round to some team"""
+    game = make_trick_game()
+    hands = [[c.code for c in p.cards] for p in game.players]
+    tricks = len(hands[0])
+    teams = [p.team for p in game.players]
+    items = njet_game.playout_round(hands, [], 0, game._trump, game._super_trump, teams, game._rng.random)
+    
+    assert all(hand == [] for hand in hands)
+    zeros = sum(1 for p in game.players for c in p.cards if c.value == 0)
+    assert tricks <= sum(items) <= tricks + zeros
+
+def test_rollout_values_per_candidate():
+    """One rollout value per candidate card"""
+    game = make_trick_game()
+    candidates = game.players[0].cards[:3]
+    values = game.rollout_card_values(0, candidates, rollouts=4)
+    assert len(values) == len(candidates)
+    
+    # Without teams there is nothing to score
+    game.players[1].team = None
+    assert game.rollout_card_values(0, candidates, rollouts=4) == [0.0, 0.0, 0.0]
+
+def test_solve_endgame_last_tricks():
+    """Exact search finds the forced outcome of a tiny endgame"""
+    red = njet_game.SUIT_INDEX[Suit.RED]
+    no_suit = njet_game.NO_SUIT
+    teams = [1, 2]
+    hands = ((Card(Suit.RED, 9).code, Card(Suit.BLUE, 1).code),
+             (Card(Suit.RED, 0).code, Card(Suit.BLUE, 5).code))
+    
+    # Either order, player 0 captures the red 0 with the 9 (2 items) and loses the blue trick
+    value = njet_game.solve_endgame(hands, (), 0, no_suit, no_suit, teams, 1, -1000, 1000, {})
+    assert value == 1
+    
+    # With red as super trump the red 0 wins its trick and player 1 takes both tricks
+    value = njet_game.solve_endgame(hands, (), 0, no_suit, red, teams, 1, -1000, 1000, {})
+    assert value == -2
+
+def test_playout_stops_on_uneven_hands():
+    """Playouts and the endgame solver stop once a player runs out of cards"""
+    no_suit = njet_game.NO_SUIT
+    teams = [1, 2]
+    hands = [[Card(Suit.RED, 9).code, Card(Suit.RED, 3).code], [Card(Suit.RED, 5).code]]
+    items = njet_game.playout_round(hands, [], 0, no_suit, no_suit, teams, lambda: 0.0)
+    assert sum(items) == 1
+    
+    hands = ((Card(Suit.RED, 9).code, Card(Suit.RED, 3).code), (Card(Suit.RED, 5).code,))
+    value = njet_game.solve_endgame(hands, (), 0, no_suit, no_suit, teams, 1, -1000, 1000, {})
+    assert value == 1
+
+def test_rollouts_sample_hidden_cards():
+    """Sampled deals come from every card the player can't see, not just the opponents' real hands"""
+    game = make_trick_game(num_players=2)
+    opponent_hand = sorted(game.players[1].card_codes())
+    own_discard = game.players[0].cards[0]
+    game.players[0].remove_cards([own_discard])
+    game.record_discards(0, [own_discard])
+    
+    sampled = []
+    def record_playout(hands, trick, to_play, trump, super_trump, teams, rand):
+        sampled.append(sorted(hands[1]))
+        return [0, 0, 0]
+    original = njet_game.playout_round
+    njet_game.playout_round = record_playout
+    try:
+        game.rollout_card_values(0, game.players[0].cards[:1], rollouts=8)
+    finally:
+        njet_game.playout_round = original
+    
+    assert len(sampled) == 8
+    assert all(len(hand) == len(opponent_hand) for hand in sampled)
+    assert any(hand != opponent_hand for hand in sampled)
+    
+    # The player's own cards and discards are never dealt to the opponent
+    own = game.players[0].card_codes() + [own_discard.code]
+    remaining = [njet_game.DECK_COUNT_TABLE[code] - own.count(code) for code in range(64)]
+    assert all(hand.count(code) <= remaining[code] for hand in sampled for code in set(hand))
+
+def test_ai_snapshot_leaves_game_untouched():
+    """Scoring on a snapshot draws no random numbers and fills no caches on the live game"""
+    game = make_trick_game()
+    game.play_card(0, game.players[0].cards[0])
+    snapshot = game.ai_snapshot()
+    rng_state = game._rng.getstate()
+    snapshot.rollout_card_values(1, snapshot.valid_plays(1), rollouts=4)
+    snapshot.card_strength_table(1)
+    snapshot.play_card(1, snapshot.valid_plays(1)[0])
+    
+    assert game._rng.getstate() == rng_state
+    assert game._remaining_cache is None and game._strength_cache is None
+    assert len(game.current_trick) == 1
+    assert sum(len(p.cards) for p in game.players) == sum(len(p.cards) for p in snapshot.players) + 1
+
+if __name__ == "__main__":
+    test_legal_plays_follow_suit()
+    test_valid_plays_match_effective_suits()
+    test_playout_accounts_for_every_trick()
+    test_rollout_values_per_candidate()
+    test_solve_endgame_last_tricks()
+    test_playout_stops_on_uneven_hands()
+    test_rollouts_sample_hidden_cards()
+    test_ai_snapshot_leaves_game_untouched()
+    print("All AI rollout tests passed")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+import sys
+sys.path.append('.')
+
+# Import the game classes
+import importlib.util
+spec = importlib.util.spec_from_file_location("njet_game", "njet-game-2.py")
+njet_game = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(njet_game)
+NjetGame = njet_game.NjetGame
+Suit = njet_game.Suit
+
+def test_blocking_until_one_option_left():
+    """can_block stays true until a single option remains"""
+    game = NjetGame(4)
+    options = list(game.blocking_board["discard"])
+    for i, option in enumerate(options[:-1]):
+        assert game.can_block("discard"), f"should still be blockable after {i} blocks"
+        assert game.count_remaining_options("discard") == len(options) - i
+        game.block_option("discard", option, player_idx=i % 4)
+    assert not game.can_block("discard")
+    assert game.get_available_options("discard") == [options[-1]]
+
+def test_finalize_parameters_uses_open_options():
+    """Finalized parameters are the first unblocked option of each category"""
+    game = NjetGame(4)
+    game.block_option("start_player", 0, 0)
+    game.block_option("trump", Suit.RED, 1)
+    game.block_option("trump", Suit.BLUE, 2)
+    for suit in Suit:
+        game.block_option("super_trump", suit, 3)
+    game.block_option("points", "-2", 0)
+    game.finalize_parameters()
+    
+    assert game.game_params["start_player"] == 1
+    assert game.game_params["discard"] == "0 cards"
+    assert game.game_params["trump"] == Suit.YELLOW
+    assert game.game_params["super_trump"] is None  # Only "Njet" left
+    assert game.game_params["points"] == "1"
+
+def test_blockable_count_tracks_blocks():
+    """blockable_count drops as each category is narrowed to its last option"""
+    game = NjetGame(4)
+    assert game.blockable_count() == len(njet_game.BLOCK_CATEGORIES)
+    options = list(game.blocking_board["trump"])
+    for option in options[:-2]:
+        game.block_option("trump", option, 0)
+    assert game.blockable_count() == len(njet_game.BLOCK_CATEGORIES)
+    game.block_option("trump", options[-2], 0)
+    assert game.blockable_count() == len(njet_game.BLOCK_CATEGORIES) - 1
+    assert game.blockable_count() == sum(1 for c in njet_game.BLOCK_CATEGORIES if game.can_block(c))
+
+def test_available_options_follow_blocks():
+    """Cached open options are refreshed after a block and for a new board"""
+    game = NjetGame(4)
+    options = list(game.blocking_board["discard"])
+    assert game.get_available_options("discard") == options
+    game.block_option("discard", options[1], 0)
+    assert game.get_available_options("discard") == options[:1] + options[2:]
+    game.blocking_board = game.init_blocking_board()
+    assert game.get_available_options("discard") == options
+
+def test_blocking_scores_follow_hand():
+    """Cached blocking scores match a fresh evaluation and are redone when the hand changes"""
+    game = NjetGame(4)
+    game.deal_cards()
+    for category in ("trump", "super_trump", "discard", "points"):
+        for option in game.blocking_board[category]:
+            assert game.ai_evaluate_blocking_option(0, category, option) == game._score_blocking_option(0, category, option)
+    game.players[0].cards = game.players[1].cards[:]
+    for option in game.blocking_board["trump"]:
+        assert game.ai_evaluate_blocking_option(0, "trump", option) == game._score_blocking_option(0, "trump", option)
+
+if __name__ == "__main__":
+    test_blocking_until_one_option_left()
+    test_finalize_parameters_uses_open_options()
+    test_blockable_count_tracks_blocks()
+    test_available_options_follow_blocks()
+    test_blocking_scores_follow_hand()
+    print("All blocking board tests passed")
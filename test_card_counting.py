@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+import sys
+sys.path.append('.')
+
+# Import the game classes
+import importlib.util
+spec = importlib.util.spec_from_file_location("njet_game", "njet-game-2.py")
+njet_game = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(njet_game)
+NjetGame = njet_game.NjetGame
+Suit = njet_game.Suit
+Card = njet_game.Card
+
+def test_remaining_cards_full_deal():
+    """With every card dealt nothing is left to count"""
+    game = NjetGame(4)
+    game.deal_cards()
+    remaining = game.get_remaining_cards(0)
+    assert all(values == [] for values in remaining.values())
+
+def test_remaining_cards_tracks_duplicates():
+    """Set-aside cards are counted once per copy, including repeated values"""
+    game = NjetGame(2)
+    game.deal_cards()
+    remaining = game.get_remaining_cards(0)
+    assert sum(len(values) for values in remaining.values()) == len(game.set_aside_cards)
+    for suit in Suit:
+        expected = sorted(c.value for c in game.set_aside_cards if c.suit == suit)
+        assert remaining[suit] == expected, f"{suit}: {remaining[suit]} != {expected}"
+
+def test_remaining_cards_after_play():
+    """Playing a card keeps it out of the remaining counts"""
+    game = NjetGame(2)
+    game.deal_cards()
+    before = sum(len(values) for values in game.get_remaining_cards(0).values())
+    game.play_card(0, game.players[0].cards[0])
+    after = sum(len(values) for values in game.get_remaining_cards(0).values())
+    assert after == before
+
+def test_remaining_cards_cache_invalidation():
+    """Cached results are reused until a card leaves a hand"""
+    game = NjetGame(2)
+    game.deal_cards()
+    first = game.get_remaining_cards(0)
+    assert game.get_remaining_cards(1) is first
+    
+    # Discarding removes a card from the hand without going through play_card
+    discarded = game.players[1].cards.pop()
+    after_discard = game.get_remaining_cards(0)
+    assert after_discard is not first
+    assert discarded.value in after_discard[discarded.suit]
+
+def test_remaining_masks_match_lists():
+    """Copy bitmasks hold one bit per remaining copy, ordered by value"""
+    game = NjetGame(2)
+    game.deal_cards()
+    remaining = game.get_remaining_cards(0)
+    masks = game.get_remaining_masks(0)
+    start = njet_game.COPY_BIT_START
+    popcount = njet_game.POPCOUNT
+    for suit in Suit:
+        assert popcount[masks[suit]] == len(remaining[suit])
+        for value in range(10):
+            copies = (masks[suit] >> start[value]) & ((1 << (start[value + 1] - start[value])) - 1)
+            assert popcount[copies] == remaining[suit].count(value)
+            higher = popcount[masks[suit] >> start[value + 1]]
+            assert higher == sum(1 for v in remaining[suit] if v > value)
+
+def test_card_strength_table_matches_evaluation():
+    """Strength table agrees with evaluate_card_strength and refreshes after a play"""
+    game = NjetGame(2)
+    game.deal_cards()
+    game.game_params = {"trump": Suit.BLUE, "super_trump": Suit.RED}
+    table = game.card_strength_table(0)
+    assert game.card_strength_table(0) is table
+    masks = game.get_remaining_masks(0)
+    for card in game.players[0].cards:
+        assert table[card.code] == game.evaluate_card_strength(card, Suit.BLUE, Suit.RED, masks)
+    game.play_card(1, game.players[1].cards[0])
+    assert game.card_strength_table(0) is not table
+
+if __name__ == "__main__":
+    test_remaining_cards_full_deal()
+    test_remaining_cards_tracks_duplicates()
+    test_remaining_cards_after_play()
+    test_remaining_cards_cache_invalidation()
+    test_remaining_masks_match_lists()
+    test_card_strength_table_matches_evaluation()
+    print("All card counting tests passed")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+import sys
+sys.path.append('.')
+
+# Import the game classes
+import importlib.util
+spec = importlib.util.spec_from_file_location("njet_game", "njet-game-2.py")
+njet_game = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(njet_game)
+NjetGame = njet_game.NjetGame
+Suit = njet_game.Suit
+Card = njet_game.Card
+
+def test_card_code_round_trip():
+    """Packed card codes decode back to the same card"""
+    for suit in Suit:
+        for value in range(10):
+            card = Card(suit, value)
+            decoded = Card.from_code(card.code)
+            assert decoded == card, f"{card} decoded as {decoded}"
+            assert decoded.code == card.code
+
+def test_card_codes_are_distinct():
+    """Every (suit, value) pair gets its own code"""
+    codes = {Card(suit, value).code for suit in Suit for value in range(10)}
+    assert len(codes) == 40
+
+def test_player_card_codes():
+    """Player.card_codes mirrors the hand order"""
+    game = NjetGame(4)
+    game.deal_cards()
+    for player in game.players:
+        assert player.card_codes() == [c.code for c in player.cards]
+        assert [Card.from_code(code) for code in player.card_codes()] == player.cards
+
+def test_player_hand_partition():
+    """hand_partition groups the hand by suit and refreshes after the hand changes"""
+    game = NjetGame(4)
+    game.deal_cards()
+    player = game.players[0]
+    by_suit, high_cards, zeros = player.hand_partition()
+    for suit in Suit:
+        assert by_suit[suit] == [c for c in player.cards if c.suit == suit]
+    assert high_cards == []
+    assert zeros == [c for c in player.cards if c.value == 0]
+    
+    removed = player.cards.pop()
+    by_suit, _, _ = player.hand_partition()
+    assert sum(len(cards) for cards in by_suit.values()) == len(player.cards)
+    assert len(by_suit[removed.suit]) == sum(1 for c in player.cards if c.suit == removed.suit)
+
+def test_player_remove_cards():
+    """remove_cards drops one matching card per entry, like repeated list.remove"""
+    game = NjetGame(4)
+    game.deal_cards()
+    player = game.players[0]
+    expected = list(player.cards)
+    discards = [Card(c.suit, c.value) for c in (expected[0], expected[3])]
+    for card in discards:
+        expected.remove(card)
+    player.remove_cards(discards)
+    assert player.cards == expected
+
+def test_card_beats_kernel():
+    """Packed card_beats matches the basic trick rules"""
+    card_beats = njet_game.card_beats
+    red, blue, green = (njet_game.SUIT_INDEX[s] for s in (Suit.RED, Suit.BLUE, Suit.GREEN))
+    no_suit = njet_game.NO_SUIT
+    
+    # Higher card of the lead suit wins, off-suit cards never do
+    assert card_beats(Card(Suit.RED, 9).code, Card(Suit.RED, 3).code, red, no_suit, no_suit)
+    assert not card_beats(Card(Suit.BLUE, 9).code, Card(Suit.RED, 3).code, red, no_suit, no_suit)
+    # Trump beats the lead suit, super trump 0 beats the highest trump
+    assert card_beats(Card(Suit.BLUE, 1).code, Card(Suit.RED, 9).code, red, blue, green)
+    assert card_beats(Card(Suit.GREEN, 0).code, Card(Suit.BLUE, 9).code, red, blue, green)
+    # Identical cards: the earlier one keeps the trick
+    assert not card_beats(Card(Suit.RED, 7).code, Card(Suit.RED, 7).code, red, blue, green)
+
+if __name__ == "__main__":
+    test_card_code_round_trip()
+    test_card_codes_are_distinct()
+    test_player_card_codes()
+    test_player_hand_partition()
+    test_player_remove_cards()
+    test_card_beats_kernel()
+    print("All card encoding tests passed")